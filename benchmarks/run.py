@@ -0,0 +1,277 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Benchmarks
+----------
+
+Time the phases of the pipeline of every 2D and 3D plotter, and of the
+``comparison`` and ``panes`` compositions, for small, medium and huge inputs:
+
+    construct: rest of the plotter constructor (parameter record, defaults and style)
+    main:      canvas setup and plot
+    finish:    axes, ticks, labels, legend and layout
+    savefig:   rendering the figure to PNG with Agg
+
+The phases are disjoint, so that together they add up to the time taken to draw
+and save a plot. Compositions are timed as a whole, the construction of the
+figure (``construct``) and its rendering (``savefig``).
+
+and record the peak memory allocated by Python and NumPy while the plot is built
+and saved. Results are compared against a stored baseline, and any phase slower,
+or peak larger, than its baseline by more than a threshold is reported as a
+regression (exit status 1).
+
+    python -m benchmarks.run --save                    # Store the results as the baseline
+    python -m benchmarks.run                           # Compare against the baseline
+    python -m benchmarks.run --sizes small medium      # Skip the huge inputs
+    python -m benchmarks.run --cases heatmap surface   # Benchmark some cases only
+
+Plots are drawn without Pyplot, on Agg canvases (``pyplot=False``).
+
+Timings are only comparable on the machine and with the dependencies they were
+measured with, so baselines are stored by environment (host, Python, NumPy and
+Matplotlib versions), and results are only compared against the baseline of
+their own environment. Baselines are stored locally (``benchmarks/baseline.json``
+is not under version control): run with ``--save`` first, on every machine.
+"""
+
+import io
+import os
+import sys
+import json
+import argparse
+import platform
+import tracemalloc
+
+from time import perf_counter
+
+import numpy as np
+import matplotlib as mpl
+
+from mpl_plotter.two_d import line, scatter, heatmap, contour, quiver, streamline, fill_area, comparison, panes
+from mpl_plotter.three_d import line as line3, scatter as scatter3, surface
+
+
+baseline_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+phases = ['construct', 'main', 'finish', 'savefig']
+sizes  = ['small', 'medium', 'huge']
+
+
+"""
+Inputs
+"""
+
+
+def curve(n):
+    x = np.linspace(0, 10, n)
+    return x, np.sin(x) * np.exp(-x / 10)
+
+
+def grid(n):
+    x, y = np.meshgrid(np.linspace(-3, 3, n), np.linspace(-3, 3, n))
+    return x, y, np.sin(x) * np.cos(y)
+
+
+def field(n):
+    x, y, _ = grid(n)
+    return x, y, -y, x
+
+
+def helix(n):
+    t = np.linspace(0, 20 * np.pi, n)
+    return np.cos(t), np.sin(t), t
+
+
+def cloud(n):
+    rng = np.random.default_rng(0)
+    x, y = rng.random(n), rng.random(n)
+    return x, y, np.sin(6 * x) * np.cos(6 * y)
+
+
+# Case: (plotter, number of points or grid side of each size, keyword arguments for a given size)
+cases = {
+    'line':       (line,       [10**2, 10**4, 10**6], lambda n: dict(zip('xy', curve(n)))),
+    'scatter':    (scatter,    [10**2, 10**4, 10**6], lambda n: {**dict(zip('xy', curve(n))), 'color_rule': curve(n)[1]}),
+    'heatmap':    (heatmap,    [32, 256, 2048],       lambda n: dict(zip('xyz', grid(n)))),
+    'contour':    (contour,    [32, 256, 2048],       lambda n: dict(zip('xyz', grid(n)))),
+    'quiver':     (quiver,     [16, 64, 256],         lambda n: dict(zip('xyuv', field(n)))),
+    'streamline': (streamline, [16, 64, 256],         lambda n: {**dict(zip('xyuv', field(n))), 'streamline_cache': False}),
+    'fill_area':  (fill_area,  [10**2, 10**4, 10**6], lambda n: {**dict(zip('xy', curve(n))), 'z': -curve(n)[1], 'fill_area_between': True}),
+    'line3':      (line3,      [10**2, 10**4, 10**6], lambda n: dict(zip('xyz', helix(n)))),
+    'scatter3':   (scatter3,   [10**2, 10**3, 10**5], lambda n: dict(zip('xyz', cloud(n)))),
+    'surface':    (surface,    [16, 64, 256],         lambda n: dict(zip('xyz', grid(n)))),
+    'comparison': (comparison, [10**2, 10**4, 10**6], lambda n: {'x': curve(n)[0], 'y': [curve(n)[1], -curve(n)[1], 2 * curve(n)[1]]}),
+    'panes':      (panes,      [10**2, 10**4, 10**6], lambda n: {'x': curve(n)[0], 'y': [curve(n)[1], -curve(n)[1], 2 * curve(n)[1]]}),
+}
+
+
+"""
+Measurement
+"""
+
+
+def instrumented(plotter, clock):
+    """
+    Return a subclass of a plotter which records the duration of its
+    **main** and **finish** phases in **clock**.
+    """
+    class timed(plotter):
+
+        def main(self):
+            t = perf_counter()
+            super().main()
+            clock['main'] = perf_counter() - t
+
+        def finish(self):
+            t = perf_counter()
+            super().finish()
+            clock['finish'] = perf_counter() - t
+
+    timed.__name__ = plotter.__name__
+
+    return timed
+
+
+def environment():
+    """
+    :return: [str] Key of the baselines measured on this machine, with these versions of Python and of the dependencies.
+    """
+    return f'{platform.node()} (Python {platform.python_version()}, NumPy {np.__version__}, Matplotlib {mpl.__version__})'
+
+
+def measure(case, size, repeat=5):
+    """
+    Benchmark a case with an input size.
+
+    :param case:   Case name
+    :param size:   Input size ('small', 'medium' or 'huge')
+    :param repeat: Number of timed runs, of which the fastest is kept for each phase
+
+    :return: [dict] Duration of each phase in seconds, and peak memory in bytes.
+    """
+    plotter, n, inputs = cases[case]
+    kwargs             = {**inputs(n[sizes.index(size)]), 'pyplot': False}
+
+    composition = not isinstance(plotter, type)
+
+    def run():
+        clock = {}
+        build = plotter if composition else instrumented(plotter, clock)
+
+        t      = perf_counter()
+        result = build(**kwargs)
+        # The constructor runs main and finish, which are timed on their own
+        clock['construct'] = perf_counter() - t - clock.get('main', 0) - clock.get('finish', 0)
+
+        fig = result if composition else result.fig
+
+        t = perf_counter()
+        fig.savefig(io.BytesIO(), format='png')
+        clock['savefig'] = perf_counter() - t
+
+        return clock
+
+    runs   = [run() for _ in range(repeat)]
+    result = {phase: min(r[phase] for r in runs) for phase in phases if phase in runs[0]}
+
+    # Tracing allocations slows them down, so memory is measured on a separate run
+    tracemalloc.start()
+    run()
+    result['peak'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return result
+
+
+def compare(results, baseline, threshold=0.25, resolution=0.005):
+    """
+    Compare results against a baseline.
+
+    :param results:    Results by case and size (``{case: {size: {phase: value}}}``)
+    :param baseline:   Baseline results, of the same structure
+    :param threshold:  Relative increase over the baseline considered a regression
+    :param resolution: Time differences below which phases are never considered slower, in seconds
+
+    :type results:     dict
+    :type baseline:    dict
+    :type threshold:   float
+    :type resolution:  float
+
+    :return: [list of str] Regressions.
+    """
+    regressions = []
+
+    for case, by_size in results.items():
+        for size, result in by_size.items():
+            reference = baseline.get(case, {}).get(size, {})
+            for key, value in result.items():
+                if key not in reference:
+                    continue
+                margin = 0 if key == 'peak' else resolution
+                if value > reference[key] * (1 + threshold) + margin:
+                    regressions.append(f'{case} ({size}) {key}: {value:.4g} > {reference[key]:.4g} baseline')
+
+    return regressions
+
+
+def report(results):
+    """
+    Print a table of results.
+    """
+    print(f'{"case":<12}{"size":<8}' + ''.join(f'{p:>11}' for p in phases) + f'{"peak [MB]":>11}')
+    for case, by_size in results.items():
+        for size, result in by_size.items():
+            times = ''.join(f'{result[p] * 1e3:>9.1f}ms' if p in result else f'{"-":>11}' for p in phases)
+            print(f'{case:<12}{size:<8}{times}{result["peak"] / 2**20:>11.1f}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='MPL Plotter benchmarks')
+    parser.add_argument('--cases',     nargs='+', default=list(cases), choices=list(cases))
+    parser.add_argument('--sizes',     nargs='+', default=sizes, choices=sizes)
+    parser.add_argument('--repeat',    type=int, default=5, help='Timed runs of each benchmark (the fastest is kept)')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Relative increase considered a regression')
+    parser.add_argument('--baseline',  default=baseline_file, help='Baseline file')
+    parser.add_argument('--save',      action='store_true', help='Store the results as the baseline')
+    args = parser.parse_args(argv)
+
+    results = {case: {size: measure(case, size, args.repeat) for size in args.sizes} for case in args.cases}
+
+    report(results)
+
+    # Baselines of all environments: {environment: {case: {size: {phase: value}}}}
+    baselines = {}
+    if os.path.isfile(args.baseline):
+        with open(args.baseline) as f:
+            baselines = json.load(f)
+
+    env = environment()
+
+    if args.save:
+        for case, by_size in results.items():
+            baselines.setdefault(env, {}).setdefault(case, {}).update(by_size)
+        with open(args.baseline, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+        print(f'\nBaseline of {env} saved to {args.baseline}')
+        return 0
+
+    if env not in baselines:
+        print(f'\nNo baseline of {env} in {args.baseline}: run with --save to store one')
+        return 0
+
+    regressions = compare(results, baselines[env], args.threshold)
+
+    if regressions:
+        print(f'\n{len(regressions)} regressions (threshold: {args.threshold:.0%}):')
+        for r in regressions:
+            print(f'    {r}')
+        return 1
+
+    print('\nNo regressions')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,7 +3,6 @@
 
 import re
 import matplotlib as mpl
-from matplotlib import font_manager
 
 
 """
@@ -17,20 +16,33 @@ General utilities
 """
 
 
-def figure(figsize=(6, 6), backend='Qt5Agg'):
+def figure(figsize=(6, 6), backend='Qt5Agg', pyplot=True):
     """
     Create a Matplotlib figure with a given backend.
     Importantly, the backend is set BEFORE importing
     Pyplot.
 
+    If **pyplot** is False, the figure is created without Pyplot,
+    on an Agg canvas: it is not registered by Pyplot's figure manager,
+    and it is garbage collected as soon as it is no longer referenced.
+    The backend is ignored.
+
     :param figsize: Matplotlib figure size. Default: (6, 6)
     :param backend: Matplotlib backend to be used. Default: 'Qt5Agg'
+    :param pyplot:  Whether to create the figure through Pyplot. Default: True
 
     :type figsize: tuple
     :type backend: str
+    :type pyplot:  bool
 
     :return: Figure object
     """
+    if not pyplot:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig
     if not isinstance(backend, type(None)):
         mpl.use(backend)
     import matplotlib.pyplot as plt
@@ -40,9 +52,13 @@ def figure(figsize=(6, 6), backend='Qt5Agg'):
 def get_available_fonts(silent=False):
     """
     Print all fonts available to Matplotlib in your system.
+
+    The font catalogue is read from the process-wide font registry
+    (see ``mpl_plotter.fonts``), which is filled only once.
     """
+    from mpl_plotter.fonts import font_registry
     
-    fnames = font_manager.get_font_names()
+    fnames = sorted(font_registry())
     
     if not silent:
         print("\n=============================")
@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Animation
+---------
+"""
+
+import subprocess
+
+import matplotlib as mpl
+
+
+class animation:
+
+    def __init__(self, plot, frames, n=None, fps=30):
+        """
+        Animation class
+        mpl_plotter
+
+        Animate a plot by updating the data of its artist every frame. The figure is drawn
+        once: its static background (axes, grid, spines, ticks and tick labels, titles,
+        colorbar) is stored, and each frame is drawn by restoring it and drawing the
+        artist of the plot over it (blitting), so the artist is drawn on top of every
+        other element of the axes. The bounds and ticks of the axes are
+        those of the plot as created, so they should fit all frames.
+
+        Frames are dictionaries of keyword arguments of the ``update`` method of the plot
+        (eg: ``{'y': y}`` for ``line``, ``{'z': z}`` for ``heatmap`` and ``surface``).
+
+            plot = line(x=x, y=f(x, 0), bounds_y=[-1, 1], pyplot=False)
+            animation(plot, lambda i: {'y': f(x, i/30)}, n=10_000).save('f.mp4')
+
+        :param plot:   MPL Plotter plot (2D ``line``, ``scatter``, ``heatmap``, ``quiver``; 3D ``surface``)
+        :param frames: Iterable of frames, or function of the frame index returning a frame
+        :param n:      Number of frames. Required if **frames** is a function
+        :param fps:    Frames per second
+
+        :type plot:    mpl_plotter plot
+        :type frames:  iterable of dict or function
+        :type n:       int
+        :type fps:     float
+        """
+        assert hasattr(plot, 'update'), f'{type(plot).__name__} plots cannot be animated.'
+        assert not callable(frames) or n is not None, 'The number of frames **n** must be provided if **frames** is a function.'
+
+        self.plot   = plot
+        self.frames = frames
+        self.n      = n
+        self.fps    = fps
+
+    def __iter__(self):
+        if callable(self.frames):
+            return map(self.frames, range(self.n))
+        return iter(self.frames)
+
+    def draw(self, frame):
+        """
+        Update the plot with a frame, and draw it over the background of its axes.
+
+        :param frame: Keyword arguments of the ``update`` method of the plot
+
+        :type frame: dict
+        """
+        self.plot.update(**frame)
+        self.plot.method_blit()
+
+    def size(self):
+        """
+        :return: [tuple] Width and height of the frames in pixels.
+        """
+        w, h = self.plot.fig.canvas.get_width_height(physical=True)
+        return w, h
+
+    def save(self, filename=None, pipe=None, codec='libx264', bitrate=None, extra_args=None):
+        """
+        Render all frames, writing them to a video encoder as they are drawn.
+
+        Frames are written as raw RGBA pixel data straight from the buffer of the canvas,
+        with no intermediate image files. By default, they are encoded into **filename**
+        by FFmpeg (``matplotlib.rcParams['animation.ffmpeg_path']``), run as a subprocess
+        reading from its standard input. Alternatively, they are written to **pipe**.
+
+        :param filename:   Video file
+        :param pipe:       Writable binary file object to write the raw frames to, instead of FFmpeg
+                           (eg: the standard input of another encoder). Frames are ``size()`` pixels,
+                           RGBA, 8 bits per channel, row-major from the top-left corner
+        :param codec:      FFmpeg video codec
+        :param bitrate:    FFmpeg video bitrate in kbit/s
+        :param extra_args: Additional FFmpeg output arguments
+
+        :type filename:    str
+        :type pipe:        file object
+        :type codec:       str
+        :type bitrate:     int
+        :type extra_args:  list of str
+
+        :return: [int] Number of frames written
+        """
+        assert (filename is None) != (pipe is None), 'Either a **filename** or a **pipe** must be provided.'
+
+        if pipe is None:
+            encoder = subprocess.Popen(self.command(filename, codec, bitrate, extra_args),
+                                       stdin=subprocess.PIPE,
+                                       stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.PIPE)
+            pipe    = encoder.stdin
+        else:
+            encoder = None
+
+        canvas = self.plot.fig.canvas
+        count  = 0
+
+        try:
+            for frame in self:
+                self.draw(frame)
+                # Blitting draws on the renderer of the canvas, whose buffer holds the frame
+                pipe.write(canvas.buffer_rgba())
+                count += 1
+        finally:
+            if encoder is not None:
+                _, error = encoder.communicate()
+                if encoder.returncode != 0:
+                    raise RuntimeError(f'FFmpeg exited with code {encoder.returncode}:\n{error.decode(errors="replace")}')
+
+        return count
+
+    def command(self, filename, codec='libx264', bitrate=None, extra_args=None):
+        """
+        :return: [list] FFmpeg command encoding raw RGBA frames read from its standard input into a video file.
+        """
+        w, h = self.size()
+
+        command = [mpl.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+                   # Input
+                   '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{w}x{h}', '-r', str(self.fps), '-i', '-',
+                   # Output
+                   '-vcodec', codec]
+
+        if codec in ['libx264', 'libx265']:
+            # Even dimensions are required by the yuv420p pixel format
+            command += ['-pix_fmt', 'yuv420p', '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2']
+        if bitrate is not None:
+            command += ['-b:v', f'{bitrate}k']
+        if extra_args is not None:
+            command += list(extra_args)
+
+        return command + [filename]
+
+    def show(self, repeat=False):
+        """
+        Play the animation in the interactive window of the figure of the plot.
+        Requires a plot drawn with Pyplot.
+
+        :param repeat: Whether to loop the animation
+
+        :type repeat:  bool
+        """
+        assert self.plot.pyplot, 'Animations can only be shown for plots drawn with Pyplot.'
+
+        from matplotlib.animation import FuncAnimation
+
+        def frame(data):
+            self.plot.update(**data)
+            return [self.plot.graph]
+
+        # Kept referenced while the window is open
+        self.player = FuncAnimation(self.plot.fig, frame,
+                                    frames=lambda: iter(self),
+                                    save_count=self.n,
+                                    interval=1000/self.fps,
+                                    repeat=repeat,
+                                    blit=True)
+
+        self.plot.plt.show()
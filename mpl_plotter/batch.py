@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Batch
+-----
+"""
+
+import os
+import traceback
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+
+result = namedtuple('result', ['index', 'filename', 'error'])
+result.__doc__ = """
+Outcome of a batch job: the index of the job in the batch, the file
+it was saved to, and the formatted traceback of the exception it raised,
+or None if it was rendered successfully.
+"""
+
+
+def initialize():
+    """
+    Prepare a rendering worker.
+
+    Selects the Agg backend and performs a throwaway render, so that the
+    work shared by all plots (font registry and typesetting, style library,
+    colormaps, glyph caches) is done once per worker rather than once per job.
+    """
+    import matplotlib as mpl
+    mpl.use('Agg')
+
+    from mpl_plotter.fonts import font_registry, typesetting
+    from mpl_plotter.two_d import line
+
+    font_registry()
+    typesetting().apply()
+
+    warmup = line(x=[0, 1], y=[0, 1], pyplot=False)
+    warmup.fig.canvas.draw()
+
+
+def job(index, plotter, kwargs, filename):
+    """
+    Render a single batch job in the current process.
+
+    :param index:    Index of the job in the batch
+    :param plotter:  MPL Plotter plotting class or composition function (``comparison``, ``panes``)
+    :param kwargs:   Keyword arguments of the plotter
+    :param filename: File to save the figure to
+
+    :type index:     int
+    :type plotter:   type or function
+    :type kwargs:    dict
+    :type filename:  str
+
+    :return: ``result``
+    """
+    try:
+        # Plots are drawn without Pyplot, so no figures are left behind in the worker
+        plot = plotter(**{**kwargs, 'backend': None, 'show': False, 'pyplot': False})
+        fig  = plot.fig if hasattr(plot, 'fig') else plot
+        fig.savefig(filename, dpi=kwargs.get('dpi', None))
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+
+    return result(index, filename, error)
+
+
+def render(jobs, workers=None, queue=4):
+    """
+    Render a batch of plots across a pool of worker processes.
+
+    Each job is a ``(plotter, kwargs, filename)`` tuple, where ``plotter`` is an MPL Plotter
+    plotting class (or the ``comparison`` and ``panes`` functions), ``kwargs`` its keyword
+    arguments and ``filename`` the file the figure is saved to. Workers use the Agg backend,
+    and are prepared once by ``initialize``.
+
+    Results are yielded as jobs finish, in order of completion. A job which fails does not
+    stop the batch: its result carries the traceback of the exception it raised.
+
+        for r in render([(line, {'x': x, 'y': y}, 'line.png'), ...], workers=8):
+            if r.error is not None:
+                print(r.filename, r.error)
+
+    :param jobs:    Iterable of (plotter, kwargs, filename) tuples
+    :param workers: Number of worker processes. Default: number of processors in the machine
+    :param queue:   Maximum number of jobs submitted per worker at any one time. Keeps
+                    memory bounded when rendering large batches from a generator
+
+    :type jobs:     iterable of tuple
+    :type workers:  int
+    :type queue:    int
+
+    :return: generator of ``result``
+    """
+
+    workers = workers if workers is not None else os.cpu_count()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initialize) as pool:
+
+        limit   = workers * queue
+        pending = set()
+
+        for index, (plotter, kwargs, filename) in enumerate(jobs):
+
+            pending.add(pool.submit(job, index, plotter, kwargs, filename))
+
+            if len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -6,10 +6,18 @@ Color Maps
 ----------
 """
 
+from functools import lru_cache
+
+import numpy as np
+import matplotlib as mpl
 
 from matplotlib.colors import LinearSegmentedColormap
 
 
+# Sequential colormaps of a single hue
+monochrome = ['Greys', 'Purples', 'Blues', 'Greens', 'Oranges', 'Reds']
+
+
 def custom(red, green, blue,
            name="coolheat", n=1024):
     """
@@ -59,3 +67,61 @@ def mapstack(maps,
     colors = np.vstack(stack)
 
     return mpl.colors.LinearSegmentedColormap.from_list('custom_RdBu', colors)
+
+
+@lru_cache(maxsize=1)
+def colormap_index(registered):
+    """
+    Index of the colormaps registered in Matplotlib, built again only when
+    colormaps are registered or unregistered.
+
+    :param registered: Names of the colormaps registered in Matplotlib
+
+    :type registered:  tuple of str
+
+    :return: [tuple of dict] Colormap names by normalized name (lowercase, and without
+             the plural for single hue colormaps such as "Blues"), and hues of the
+             single hue colormaps by name.
+    """
+    names = {}
+    for name in sorted(registered, key=lambda n: (n.endswith('_r'), n)):
+        if name.endswith('_r'):
+            continue
+        key = name.lower()
+        names.setdefault(key, name)
+        if name in monochrome:
+            names.setdefault(key[:-1], name)
+
+    # Hue of the color each colormap is named after
+    hues = {name: mpl.colors.rgb_to_hsv(mpl.colors.to_rgb(name[:-1].lower()))[0] for name in monochrome[1:]}
+
+    return names, hues
+
+
+def colormap(color):
+    """
+    Return the colormap best matching a solid color: the colormap of the same name
+    (eg: "blue" -> "Blues", "pink" -> "pink"), or the single hue colormap of the
+    closest hue (eg: "navy" -> "Blues"), or "Greys" for gray and invalid colors.
+
+    :param color: Matplotlib color
+
+    :type color:  str or tuple
+
+    :return: [str] Colormap name.
+    """
+    names, hues = colormap_index(tuple(mpl.colormaps))
+
+    if isinstance(color, str) and color.lower() in names:
+        return names[color.lower()]
+
+    try:
+        h, s, v = mpl.colors.rgb_to_hsv(mpl.colors.to_rgb(color))
+    except ValueError:
+        return 'Greys'
+
+    if s < 0.15 or v < 0.15:
+        return 'Greys'
+
+    # Hue distance on the color wheel
+    return min(hues, key=lambda name: min(abs(h - hues[name]), 1 - abs(h - hues[name])))
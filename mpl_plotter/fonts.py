@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Fonts
+-----
+"""
+
+import matplotlib as mpl
+from matplotlib import font_manager
+
+
+"""
+Font registry
+"""
+
+_registry = {
+    'key':   None,
+    'names': frozenset(),
+    'index': {},
+}
+
+_families = ['serif', 'cursive', 'sans-serif', 'monospace', 'fantasy']
+
+
+def _registry_key():
+    """
+    Return a key identifying the state of Matplotlib's font catalogue.
+
+    The key changes whenever the font manager is rebuilt or fonts are
+    added to it (eg: through ``font_manager.fontManager.addfont``).
+    """
+    fm = font_manager.fontManager
+    return id(fm), len(fm.ttflist), len(fm.afmlist)
+
+
+def font_registry():
+    """
+    Return the set of typefaces available to Matplotlib.
+
+    The font catalogue is scanned once per process, and scanned again
+    only if Matplotlib's font catalogue changes.
+
+    :return: frozenset of typeface names
+    """
+    key = _registry_key()
+    if _registry['key'] != key:
+        names = font_manager.get_font_names()
+        _registry['names'] = frozenset(names)
+        _registry['index'] = {name.lower(): name for name in names}
+        _registry['key']   = key
+    return _registry['names']
+
+
+def font_available(typeface):
+    """
+    Check whether a typeface is available to Matplotlib.
+
+    :param typeface: Typeface name
+
+    :type typeface: str
+
+    :return: bool
+    """
+    return typeface in font_registry()
+
+
+def font(typeface, fallback=None):
+    """
+    Resolve a typeface name against the font registry.
+
+    The lookup is case insensitive, and typeface family names (*serif*,
+    *sans-serif*, etc.) are returned as they are. If the typeface is not available,
+    the *fallback* is returned, so that Matplotlib does not have to
+    search the font catalogue for a typeface it will not find.
+
+    :param typeface: Typeface name
+    :param fallback: Value returned if the typeface is not available
+
+    :type typeface: str
+    :type fallback: str
+
+    :return: Available typeface name, or *fallback*
+    """
+    if typeface is None:
+        return fallback
+    if typeface in _families:
+        return typeface
+    font_registry()
+    return _registry['index'].get(typeface.lower(), fallback)
+
+
+"""
+Typesetting
+"""
+
+_typefaces = {
+    'serif':      ['DejaVu Serif',
+                   'Latin Modern Roman'],
+    'cursive':    ['Apple Chancery'],
+    'sans-serif': ['DeJaVu'],
+    'monospace':  ['Bitstream Vera Sans Mono'],
+    'fantasy':    ['Chicago'],
+}
+
+_math = {
+    'mathtext.fontset':  'cm',
+    'mathtext.default':  'it',
+    'mathtext.fallback': 'stix',
+}
+
+
+class typesetting:
+
+    # Stack of the rcParams entries changed by each active context
+    _undo = []
+
+    def __init__(self, family='serif', typeface=None, color='black'):
+        """
+        Typesetting state manager
+        =========================
+
+        Holds the ``rcParams`` configuration MPL Plotter uses to typeset
+        text: the typeface lists of each family, the chosen family, the
+        math fontset and the text color.
+
+        ``apply`` writes only those entries which differ from the active
+        ones, so applying the same configuration for every plot costs a
+        handful of comparisons, and the global typeface lists are rebuilt
+        rather than extended, so they never grow.
+
+        Used as a context manager, the entries changed upon entering are
+        restored upon exit:
+
+            with typesetting(typeface='Latin Modern Roman'):
+                line(...)
+
+        :param family:   Typeface family: 'serif', 'cursive', 'sans-serif', 'monospace' or 'fantasy'
+        :param typeface: Typeface. If provided, it is placed first in the *serif* typeface
+                         list, and the family is set to *serif*
+        :param color:    Default text color
+
+        :type family:    str
+        :type typeface:  str
+        :type color:     str
+        """
+
+        assert family in _typefaces.keys(), f'The provided font shape "{family}" is not supported. Supported font shapes are:\n   - "serif"\n   - "cursive"\n   -"sans-serif"\n   -"monospace"\n   -"fantasy"'
+
+        self.config = {f'font.{k}': v for k, v in _typefaces.items()}
+        self.config.update(_math)
+
+        if typeface is not None:
+            family = 'serif'
+            self.config['font.serif'] = [typeface] + [t for t in _typefaces['serif'] if t != typeface]
+
+        self.config['font.family']     = [family]
+        self.config['text.color']      = color
+        self.config['axes.labelcolor'] = color
+
+        self.typeface = self.config[f'font.{family}'][0]
+
+    def changes(self):
+        """
+        Return the entries of the configuration which differ from the
+        active ``rcParams``.
+        """
+        return {k: v for k, v in self.config.items() if mpl.rcParams[k] != v}
+
+    def apply(self):
+        """
+        Write the entries of the configuration which differ from the
+        active ``rcParams``.
+
+        :return: dict of the previous value of each changed entry
+        """
+        changes  = self.changes()
+        previous = {k: mpl.rcParams[k] for k in changes.keys()}
+        for k, v in changes.items():
+            mpl.rcParams[k] = v
+        return previous
+
+    def __enter__(self):
+        typesetting._undo.append(self.apply())
+        return self
+
+    def __exit__(self, *exc):
+        for k, v in typesetting._undo.pop().items():
+            mpl.rcParams[k] = v
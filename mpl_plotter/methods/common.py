@@ -11,7 +11,8 @@ import numpy as np
 import matplotlib as mpl
 from matplotlib.ticker import FormatStrFormatter
 
-from mpl_plotter import figure, get_available_fonts
+from mpl_plotter import figure
+from mpl_plotter.fonts import font, font_available, typesetting
 
 def method_backend(plot):
 
@@ -26,8 +27,9 @@ def method_backend(plot):
 
 def method_figure(plot):
     if plot.style is not None:
-        plot.plt.style.use(plot.style)
-    plot.fig = figure(figsize=plot.figsize)
+        mpl.style.use(plot.style)
+    # The backend is selected by method_backend
+    plot.fig = figure(figsize=plot.figsize, backend=None, pyplot=plot.pyplot)
 
 def method_colorbar(plot):
 
@@ -54,7 +56,7 @@ def method_colorbar(plot):
 
             plot.cb_ax   = plot.fig.add_axes([*plot.cb_floating_coords, *plot.cb_floating_dimensions])
             
-            cb = plot.plt.colorbar(mappable    = plot.cb_mappable,
+            cb = plot.fig.colorbar(mappable    = plot.cb_mappable,
                                    cax         = plot.cb_ax,
                                    orientation = plot.cb_orientation,
                                    shrink      = plot.cb_shrink,
@@ -92,7 +94,7 @@ def method_colorbar(plot):
                                                      'horizontalalignment': 'center'},
                                          rotation = plot.cb_title_rotation)
             
-        title_font = mpl.font_manager.FontProperties(family=plot.cb_title_font if plot.cb_title_font is not None else plot.font_typeface,
+        title_font = mpl.font_manager.FontProperties(family=font(plot.cb_title_font, plot.font_typeface),
                                                      style=plot.cb_title_style,
                                                      size=plot.cb_title_size + plot.font_size_increase,
                                                      weight=plot.cb_title_weight)
@@ -112,7 +114,8 @@ def method_colorbar(plot):
         cb.outline.set_linewidth(plot.cb_outline_width)
         
         # Make plot axis active again
-        plot.plt.sca(plot.ax)
+        if plot.pyplot:
+            plot.plt.sca(plot.ax)
 
 def method_fonts(plot):
     """
@@ -147,10 +150,14 @@ def method_fonts(plot):
     chosen typeface for text in your plot.
     
     Otherwise, that is, if the ``font`` attribute of the plot is **not** one of the
-    families, the provided ``font`` will be ``insert``ed to the *serif* family
+    families, the provided ``font`` will be placed first in the *serif* family
     typeface list, and the ``rcParams`` ``font.family`` entry will be set to *serif*,
     thereby making the provided ``font`` the chosen typeface for text in the plot.
 
+    The configuration is applied through ``mpl_plotter.fonts.typesetting``, which
+    writes only the ``rcParams`` entries that differ from the active ones. It may also
+    be used as a context manager to restore the previous configuration afterwards.
+
     **font_math**
 
     The ``font_math`` attribute of the plot determines the typeface used for math
@@ -185,45 +192,16 @@ def method_fonts(plot):
     afterwards, including but not limited to text color.
     """
 
-    # Defaults - Text
-    mpl.rcParams['font.serif'] = [
-        'DejaVu Serif',
-        'Latin Modern Roman'
-    ]
-    mpl.rcParams['font.cursive'] = [
-        'Apple Chancery'
-    ]
-    mpl.rcParams['font.sans-serif'] = [
-        'DeJaVu'
-    ]
-    mpl.rcParams['font.monospace'] = [
-        'Bitstream Vera Sans Mono'
-    ]
-    mpl.rcParams['font.fantasy'] = [
-        'Chicago'
-    ]
-
-    # Defaults - Math
-    mpl.rcParams['mathtext.fontset']  = 'cm'
-    mpl.rcParams['mathtext.default']  = 'it'
-    mpl.rcParams['mathtext.fallback'] = 'stix'
-    
-    # Shape
-    assert plot.font_family in ['serif', 'cursive', 'sans-serif', 'monospace', 'fantasy'], f'The provided font shape "{plot.font_family}" is not supported. Supported font shapes are:\n   - "serif"\n   - "cursive"\n   -"sans-serif"\n   -"monospace"\n   -"fantasy"'
-    mpl.rcParams['font.family'] = plot.font_family
-    
-    # Typeface
-    if plot.font_typeface is not None:
-        mpl.rcParams['font.family'] = 'serif'
-        typeface = mpl.rcParams['font.serif'].insert(0, plot.font_typeface)
-    else:
-        plot.font_typeface = mpl.rcParams[f'font.{plot.font_family}'][0]
+    # Defaults, shape, typeface and color (applied only if they differ
+    # from the active configuration)
+    config = typesetting(family=plot.font_family,
+                         typeface=plot.font_typeface,
+                         color=plot.font_color)
+    config.apply()
 
-    assert plot.font_typeface in get_available_fonts(True), f'The chosen typeface "{plot.font_typeface}" is not available in your system. You can either install the font on your system, or choose one of the fonts installed in your system (use mpl_plotter.get_available_fonts to list them all).'
-        
-    # Color
-    mpl.rcParams['text.color']      = plot.font_color
-    mpl.rcParams['axes.labelcolor'] = plot.font_color
+    plot.font_typeface = config.typeface
+
+    assert font_available(plot.font_typeface), f'The chosen typeface "{plot.font_typeface}" is not available in your system. You can either install the font on your system, or choose one of the fonts installed in your system (use mpl_plotter.get_available_fonts to list them all).'
 
 def method_workspace_style(plot):
     if plot.light:
@@ -245,8 +223,11 @@ def method_background_color(plot):
     plot.ax.patch.set_alpha(plot.background_alpha)
 
 def method_subplots_adjust(plot):
-    
-    plot.plt.subplots_adjust(
+    # Margins left to the figure (eg: by compositions of plots)
+    if all(getattr(plot, k) is None for k in ['top', 'bottom', 'left', 'right', 'hspace', 'wspace']):
+        return
+
+    plot.fig.subplots_adjust(
         top    = plot.top,
         bottom = plot.bottom,
         left   = plot.left,
@@ -254,12 +235,48 @@ def method_subplots_adjust(plot):
         hspace = plot.hspace,
         wspace = plot.wspace)
 
+def method_blit(plot):
+    """
+    Redraw the artist of a plot over the background of its axes, which is
+    drawn and stored when the plot is first redrawn, or if it is discarded
+    (``plot.background = None``) or the figure has been resized.
+    Canvases which do not support blitting are redrawn in full.
+    """
+    canvas = plot.fig.canvas
+
+    if not hasattr(canvas, 'copy_from_bbox'):
+        canvas.draw_idle()
+        return
+
+    if plot.__dict__.get('background') is None or plot.__dict__.get('background_size') != plot.fig.bbox.size.tolist():
+        method_blit_background(plot)
+    else:
+        canvas.restore_region(plot.background)
+
+    # 3D artists are projected by their axes when the figure is drawn
+    if hasattr(plot.graph, 'do_3d_projection'):
+        plot.graph.do_3d_projection()
+
+    plot.ax.draw_artist(plot.graph)
+    canvas.blit(plot.ax.bbox)
+
+def method_blit_background(plot):
+    """
+    Draw the figure without the artist of the plot, and store the
+    background of its axes.
+    """
+    plot.graph.set_visible(False)
+    plot.fig.canvas.draw()
+    plot.background      = plot.fig.canvas.copy_from_bbox(plot.ax.bbox)
+    plot.background_size = plot.fig.bbox.size.tolist()
+    plot.graph.set_visible(True)
+
 def method_save(plot):
     if plot.filename:
-        plot.plt.savefig(plot.filename, dpi=plot.dpi)
+        plot.fig.savefig(plot.filename, dpi=plot.dpi)
 
 def method_show(plot):
-    if plot.show is True:
+    if plot.show is True and plot.pyplot:
         plot.plt.show()
     else:
         if plot.suppress is False:
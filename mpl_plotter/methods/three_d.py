@@ -14,11 +14,12 @@ import matplotlib as mpl
 from matplotlib import font_manager
 from matplotlib.ticker import FormatStrFormatter
 
+from mpl_plotter.fonts import font
 from mpl_plotter.utils import span, bounds
 
 def method_setup(plot):
     if plot.fig is None:
-        if not plot.plt.get_fignums():
+        if not plot.pyplot or not plot.plt.get_fignums():
             plot.method_figure()
         else:
             plot.fig = plot.plt.gcf()
@@ -183,15 +184,15 @@ def method_resize_axes(plot):
 
 def method_grid(plot):
     if plot.grid:
-        plot.plt.grid(linestyle=plot.grid_lines, color=plot.grid_color)
+        plot.ax.grid(linestyle=plot.grid_lines, color=plot.grid_color)
     else:
         plot.ax.grid(plot.grid)
     if not plot.show_axes:
-        plot.plt.axis('off')
+        plot.ax.set_axis_off()
 
 def method_legend(plot):
     if plot.legend is True:
-        legend_font = font_manager.FontProperties(family=plot.font_typeface,
+        legend_font = font_manager.FontProperties(family=font(plot.font_typeface, plot.font_family),
                                                     weight=plot.legend_weight,
                                                     style=plot.legend_style,
                                                     size=plot.legend_size+plot.font_size_increase)
@@ -294,7 +295,7 @@ def method_title(plot):
 
         plot.ax.set_title(plot.title,
                           y=plot.title_y,
-                          fontname=plot.font if plot.title_font is None else plot.title_font,
+                          fontname=font(plot.title_font, plot.font_typeface),
                           weight=plot.title_weight,
                           color=plot.workspace_color if plot.title_color is None else plot.title_color,
                           size=plot.title_size+plot.font_size_increase)
@@ -15,11 +15,12 @@ import matplotlib as mpl
 from matplotlib import font_manager
 from matplotlib.ticker import FormatStrFormatter
 
+from mpl_plotter.fonts import font
 from mpl_plotter.utils import span, bounds, ensure_ndarray
 
 def method_setup(plot):
     if plot.fig is None:
-        if not plot.plt.get_fignums():
+        if not plot.pyplot or not plot.plt.get_fignums():
             plot.method_figure()
         else:
             plot.fig = plot.plt.gcf()
@@ -46,6 +47,17 @@ def method_spines(plot):
                         top=top, right=right, left=left, bottom=bottom,
                         labeltop=labeltop, labelright=labelright, labelleft=labelleft, labelbottom=labelbottom)
 
+def extent(plot, ax):
+    """
+    Lowest and highest value of the data of a plot along an axis, ignoring NaN.
+    The extent of the data of streaming plots is kept track of by their buffer.
+    """
+    stream = plot.__dict__.get('stream')
+    if stream is not None:
+        return stream.extent(['x', 'y'].index(ax))
+    d = getattr(plot, ax)
+    return np.array([np.nanmin(d), np.nanmax(d)])
+
 def method_resize_axes(plot):
 
     # Bound definition
@@ -62,13 +74,13 @@ def method_resize_axes(plot):
     
     if plot.resize_axes and plot.x.size != 0 and plot.y.size != 0:
 
-        plot.bounds_x, plot.pad_upper_x, plot.pad_lower_x = bounds(plot.x,
+        plot.bounds_x, plot.pad_upper_x, plot.pad_lower_x = bounds(extent(plot, 'x'),
                                                                    plot.bound_upper_x,
                                                                    plot.bound_lower_x,
                                                                    plot.pad_upper_x,
                                                                    plot.pad_lower_x,
                                                                    plot.bounds_x)
-        plot.bounds_y, plot.pad_upper_y, plot.pad_lower_y = bounds(plot.y,
+        plot.bounds_y, plot.pad_upper_y, plot.pad_lower_y = bounds(extent(plot, 'y'),
                                                                    plot.bound_lower_y,
                                                                    plot.bound_lower_y,
                                                                    plot.pad_upper_y,
@@ -144,6 +156,68 @@ def method_resize_axes(plot):
         if plot.scale is not None:
             plot.ax.set_aspect(plot.scale)
 
+def method_rescale(plot, headroom=0.5):
+    """
+    Recompute the bounds and ticks of the axes of a plot after its data has changed.
+
+    The axes are only rescaled when the data leaves their current limits. The
+    bounds, pads and tick bounds found when the plot was drawn are then discarded,
+    so that those in the parameter record of the plot are used again, and each
+    bound the data has crossed is moved past it by a fraction of the span of the
+    data. The limits of growing data thus expand geometrically, and streaming
+    plots are only redrawn in full a logarithmic number of times.
+
+    :param headroom: Fraction of the span of the data left between the data and each bound it has crossed
+
+    :type headroom:  float
+
+    :return: Whether the limits of the axes have changed
+    """
+    if not plot.resize_axes:
+        return False
+
+    data = tuple(extent(plot, 'x')) + tuple(extent(plot, 'y'))
+    if data == plot.__dict__.get('data_extent'):
+        return False
+    plot.data_extent = data
+
+    limits = plot.ax.get_xlim(), plot.ax.get_ylim()
+
+    crossed, kept = {}, {}
+    for ax, (lower, upper) in zip(['x', 'y'], limits):
+        lower, upper = min(lower, upper), max(lower, upper)
+        low, high    = extent(plot, ax)
+        if low < lower or high > upper:
+            room        = headroom * (high - low)
+            crossed[ax] = [low - room if low < lower else lower, high + room if high > upper else upper]
+        else:
+            kept[ax]    = [lower, upper]
+    if not crossed:
+        return False
+
+    for k in ['bounds_x', 'bound_lower_x', 'bound_upper_x', 'pad_lower_x', 'pad_upper_x', 'tick_bounds_x', 'tick_number_x',
+              'bounds_y', 'bound_lower_y', 'bound_upper_y', 'pad_lower_y', 'pad_upper_y', 'tick_bounds_y', 'tick_number_y']:
+        plot.__dict__.pop(k, None)
+
+    # Bounds given in the parameter record take precedence over the headroom
+    for ax, (low, high) in crossed.items():
+        given = getattr(plot, f'bounds_{ax}') or [None, None]
+        lower = getattr(plot, f'bound_lower_{ax}')
+        upper = getattr(plot, f'bound_upper_{ax}')
+        setattr(plot, f'bounds_{ax}', [given[0] if given[0] is not None else lower if lower is not None else low,
+                                       given[1] if given[1] is not None else upper if upper is not None else high])
+
+    # Axes whose limits the data has not crossed keep them
+    for ax, bounds in kept.items():
+        setattr(plot, f'bounds_{ax}', bounds)
+        setattr(plot, f'pad_lower_{ax}', 0)
+        setattr(plot, f'pad_upper_{ax}', 0)
+
+    plot.method_resize_axes()
+    plot.method_tick_locs()
+
+    return limits != (plot.ax.get_xlim(), plot.ax.get_ylim())
+
 def method_grid(plot):
     if plot.grid:
         plot.ax.grid(linestyle=plot.grid_lines, color=plot.grid_color)
@@ -152,7 +226,7 @@ def method_legend(plot):
     if plot.legend:
         lines_labels = [ax.get_legend_handles_labels() for ax in plot.fig.axes]
         lines, labels = [sum(lol, []) for lol in zip(*lines_labels)]
-        legend_font = font_manager.FontProperties(family=plot.font_typeface,
+        legend_font = font_manager.FontProperties(family=font(plot.font_typeface, plot.font_family),
                                                   weight=plot.legend_weight,
                                                   style=plot.legend_style,
                                                   size=plot.legend_size + plot.font_size_increase)
@@ -171,22 +245,25 @@ def method_tick_locs(plot):
         bounds_x = plot.bounds_x if plot.bounds_x is not None else plot.ax.get_xlim()
         bounds_y = plot.bounds_y if plot.bounds_y is not None else plot.ax.get_ylim()
         
-        x_min = max(plot.x.min(), bounds_x[0]) if plot.tick_bounds_fit else bounds_x[0]
-        x_max = min(plot.x.max(), bounds_x[1]) if plot.tick_bounds_fit else bounds_x[1]
-        y_min = max(plot.y.min(), bounds_y[0]) if plot.tick_bounds_fit else bounds_y[0]
-        y_max = min(plot.y.max(), bounds_y[1]) if plot.tick_bounds_fit else bounds_y[1]
+        extent_x = extent(plot, 'x')
+        extent_y = extent(plot, 'y')
+
+        x_min = max(extent_x[0], bounds_x[0]) if plot.tick_bounds_fit else bounds_x[0]
+        x_max = min(extent_x[1], bounds_x[1]) if plot.tick_bounds_fit else bounds_x[1]
+        y_min = max(extent_y[0], bounds_y[0]) if plot.tick_bounds_fit else bounds_y[0]
+        y_max = min(extent_y[1], bounds_y[1]) if plot.tick_bounds_fit else bounds_y[1]
         
         if plot.tick_bounds_x is None:
-            if span(plot.x) != 0:
+            if span(extent_x) != 0:
                 plot.tick_bounds_x = [x_min, x_max]
             else:
-                plot.tick_bounds_x = [plot.x.mean()-1, plot.x.mean() + 1]
+                plot.tick_bounds_x = [extent_x[0] - 1, extent_x[0] + 1]
                 plot.tick_number_x = 1
         if plot.tick_bounds_y is None:
-            if span(plot.y) != 0:
+            if span(extent_y) != 0:
                 plot.tick_bounds_y = [y_min, y_max]
             else:
-                plot.tick_bounds_y = [plot.y.mean()-1, plot.y.mean() + 1]
+                plot.tick_bounds_y = [extent_y[0] - 1, extent_y[0] + 1]
                 plot.tick_number_y = 1
     # Ensure the number of ticks equals the length of the list of
     # tick labels, if provided
@@ -297,6 +374,8 @@ def method_tick_labels(plot):
 
     # Date tick labels
     if plot.tick_labels_dates_x:
+        import pandas as pd
+        import datetime as dt
         fmtd = pd.date_range(start=plot.x[0], end=plot.x[-1], periods=plot.tick_number_x)
         fmtd = [dt.datetime.strftime(d, plot.date_format) for d in fmtd]
         plot.ax.set_xticklabels(fmtd)
@@ -310,7 +389,7 @@ def method_title(plot):
                 break
             
         plot.ax.set_title(plot.title,
-                          fontname=plot.title_font if plot.title_font is not None else plot.font_typeface,
+                          fontname=font(plot.title_font, plot.font_typeface),
                           weight=plot.title_weight,
                           color=color,
                           size=plot.title_size + plot.font_size_increase,
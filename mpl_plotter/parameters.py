@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Parameters
+----------
+"""
+
+import inspect
+
+
+class record:
+    """
+    Parameter record of a plot.
+
+    Records are slotted: each parameter of the plotting class has a slot, and
+    only the slots of the arguments which differ from their defaults are set.
+    The defaults are shared by all records of a plotting class.
+    """
+
+    __slots__ = ()
+
+    # Defaults of the schema of the record
+    defaults  = {}
+
+    def __getattr__(self, name):
+        # Called only for unset slots
+        try:
+            return self.defaults[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
+
+    def overrides(self):
+        """
+        Return the arguments of the record which differ from their defaults.
+
+        :return: dict
+        """
+        overrides = {}
+        for name in self.__slots__:
+            try:
+                overrides[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return overrides
+
+    def __repr__(self):
+        return f'{type(self).__name__}({", ".join(f"{k}={v!r}" for k, v in self.overrides().items())})'
+
+
+class schema:
+
+    def __init__(self, function):
+        """
+        Parameter schema
+        ================
+
+        Names and defaults of the parameters of a plotting class constructor,
+        and the slotted ``record`` class used to store the arguments of each
+        of its instances. Schemas are compiled once, upon class creation.
+
+        :param function: Plotting class constructor
+
+        :type function:  function
+        """
+        parameters    = list(inspect.signature(function).parameters.values())[1:]
+
+        self.names    = tuple(p.name for p in parameters)
+        self.defaults = {p.name: p.default for p in parameters}
+        self.record   = type(f'{function.__qualname__.split(".")[0]}_parameters',
+                             (record,),
+                             {'__slots__': self.names,
+                              'defaults':  self.defaults,
+                              '__module__': function.__module__})
+
+        self._items   = tuple(self.defaults.items())
+
+    def bind(self, values):
+        """
+        Create the parameter record of a plot.
+
+        :param values: Arguments of the plot, usually the ``locals()`` of its constructor
+
+        :type values:  dict
+
+        :return: ``record``
+        """
+        r = self.record()
+        for name, default in self._items:
+            value = values[name]
+            if value is not default:
+                setattr(r, name, value)
+        return r
+
+
+class parametric:
+    """
+    Plotting class mixin.
+
+    The schema of each plotting class is compiled upon class creation from
+    the signature of its constructor. Parameters are then read from the
+    ``parameters`` record of each instance, unless they are overwritten
+    in the instance itself (eg: ``plot.cb_vmin = ...``).
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if '__init__' in cls.__dict__:
+            kinds = [p.kind for p in inspect.signature(cls.__init__).parameters.values()]
+            # Constructors forwarding their arguments (eg: subclasses with
+            # *args, **kwargs) keep the schema of their parent
+            if inspect.Parameter.VAR_KEYWORD not in kinds and inspect.Parameter.VAR_POSITIONAL not in kinds:
+                cls.schema = schema(cls.__init__)
+
+    def __getattr__(self, name):
+        # Called only for attributes not found in the instance or its class
+        try:
+            return getattr(self.__dict__['parameters'], name)
+        except (KeyError, AttributeError):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
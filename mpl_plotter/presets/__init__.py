@@ -4,6 +4,17 @@
 """
 Presets
 -------
+
+Presets, and the plotters they are built on, are imported when first accessed.
 """
 
-from mpl_plotter.presets.preset import preset
\ No newline at end of file
+from mpl_plotter.utils import lazy
+
+
+_exports = {
+    'preset': 'mpl_plotter.presets.preset',
+}
+
+__all__ = list(_exports)
+
+lazy(__name__, _exports)
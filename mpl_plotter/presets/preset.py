@@ -8,7 +8,6 @@ Preset
 
 import os
 import sys
-import toml
 import inspect
 from pathlib import Path
 from importlib import util
@@ -56,6 +55,7 @@ class preset:
         """
         Save MPL Plotter preset in TOML format
         """
+        import toml
 
         # create directories in file path if they do not exist        
         Path(os.path.dirname(file)).mkdir(parents=True, exist_ok=True)
@@ -91,6 +91,8 @@ class preset:
         """
         Load MPL Plotter preset from TOML file
         """
+        import toml
+
         with open(file, 'r') as f:
             _dict = toml.load(f)['MPL PLOTTER PRESET']
         
@@ -0,0 +1,217 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Profiling
+---------
+
+Per-stage profiling of the plot pipeline. While a ``profile`` is active, the
+stages of all 2D and 3D plotters (``main``, ``finish``, ``mock``, ``plot`` and
+every ``method_*``) are instrumented, and each call is recorded as a ``stage``.
+Plotters are instrumented only while a profile is active, so that profiling
+adds no overhead at all when it is not in use.
+
+    with profile() as p:
+        line(x=x, y=y, pyplot=False)
+
+    p.to_csv('line.csv')
+"""
+
+import io
+import sys
+import csv
+import json
+import weakref
+import threading
+
+from time import perf_counter
+from types import FunctionType
+from functools import wraps
+from collections import namedtuple
+from importlib import import_module
+
+
+stage = namedtuple('stage', ['plot', 'plotter', 'stage', 'depth', 'time', 'net_blocks', 'artists'])
+stage.__doc__ = """
+Call of a stage of the pipeline of a plot: the index of the plot in the profile,
+its plotter, the name of the stage, its nesting depth (0 for ``main`` and
+``finish``), its wall time in seconds, and the net change in the number of memory
+blocks allocated by Python (``sys.getallocatedblocks``) and of artists of the
+figure of the plot over the stage.
+
+``net_blocks`` is the number of blocks alive after the stage minus those alive
+before it: memory allocated and freed within the stage is not counted, so it may
+be zero or negative for stages which allocate heavily. It measures the memory a
+stage retains, not its allocations; use ``tracemalloc`` for those.
+"""
+
+
+# Profiles active, and the plotter attributes instrumented for them
+_active       = []
+_instrumented = []
+_lock         = threading.Lock()
+_local        = threading.local()
+
+_modules = ['mpl_plotter.two_d.plotters', 'mpl_plotter.three_d.plotters']
+
+
+def _stage(name):
+    return name in ['main', 'finish', 'mock', 'plot'] or name.startswith('method_')
+
+
+def _artists(plot):
+    """
+    :return: [int] Number of artists of the figure of a plot and of its axes.
+    """
+    fig = getattr(plot, 'fig', None)
+    if fig is None:
+        return 0
+    return len(fig.get_children()) + sum(len(ax.get_children()) for ax in fig.axes)
+
+
+def _wrap(name, f):
+    """
+    Return an instrumented stage method, recording each of its calls in all active profiles.
+    """
+    @wraps(f)
+    def instrumented(self, *args, **kwargs):
+        depth        = getattr(_local, 'depth', 0)
+        _local.depth = depth + 1
+
+        artists = _artists(self)
+        blocks  = sys.getallocatedblocks()
+        t       = perf_counter()
+        try:
+            return f(self, *args, **kwargs)
+        finally:
+            t            = perf_counter() - t
+            blocks       = sys.getallocatedblocks() - blocks
+            artists      = _artists(self) - artists
+            _local.depth = depth
+            for p in list(_active):
+                p.record(self, name, depth, t, blocks, artists)
+
+    instrumented.__wrapped__ = f
+
+    return instrumented
+
+
+def _instrument():
+    """
+    Instrument the stages of all plotters, in the classes defining them.
+    """
+    classes = set()
+    for module in _modules:
+        for obj in vars(import_module(module)).values():
+            if isinstance(obj, type) and obj.__module__ == module:
+                classes.update(obj.__mro__)
+
+    for cls in classes:
+        for name, f in list(vars(cls).items()):
+            if _stage(name) and isinstance(f, FunctionType):
+                _instrumented.append((cls, name, f))
+                setattr(cls, name, _wrap(name, f))
+
+
+def _restore():
+    while _instrumented:
+        cls, name, f = _instrumented.pop()
+        setattr(cls, name, f)
+
+
+class profile:
+
+    def __init__(self, callback=None):
+        """
+        Profile
+        =======
+
+        Context manager recording the stages of the pipeline of all plots created
+        within it (in any thread), in ``records``.
+
+        Plotters are instrumented when the first active profile is entered, and
+        restored when the last one is exited.
+
+        :param callback: Function called with each ``stage`` as it is recorded
+
+        :type callback:  function
+        """
+        self.callback = callback
+        self.records  = []
+        self.plots    = weakref.WeakKeyDictionary()
+        self.count    = 0
+
+    def __enter__(self):
+        with _lock:
+            if not _active:
+                _instrument()
+            _active.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        with _lock:
+            _active.remove(self)
+            if not _active:
+                _restore()
+
+    def record(self, plot, name, depth, time, net_blocks, artists):
+        """
+        Record a call of a stage of a plot.
+        """
+        if plot not in self.plots:
+            # Plots may be garbage collected, so they are numbered by the profile
+            self.plots[plot] = self.count
+            self.count      += 1
+
+        s = stage(self.plots[plot], type(plot).__name__, name, depth, time, net_blocks, artists)
+
+        self.records.append(s)
+
+        if self.callback is not None:
+            self.callback(s)
+
+    def totals(self):
+        """
+        :return: [dict] Number of calls and total time of each stage, by stage, sorted by decreasing time.
+        """
+        totals = {}
+        for r in self.records:
+            calls, time = totals.get(r.stage, (0, 0))
+            totals[r.stage] = (calls + 1, time + r.time)
+        return dict(sorted(totals.items(), key=lambda item: -item[1][1]))
+
+    def to_json(self, file=None):
+        """
+        Export the records as a JSON list of objects.
+
+        :param file: File to write the records to
+
+        :type file:  str
+
+        :return: [str] JSON records.
+        """
+        out = json.dumps([r._asdict() for r in self.records], indent=2)
+        if file is not None:
+            with open(file, 'w') as f:
+                f.write(out)
+        return out
+
+    def to_csv(self, file=None):
+        """
+        Export the records as CSV, with a header row.
+
+        :param file: File to write the records to
+
+        :type file:  str
+
+        :return: [str] CSV records.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(stage._fields)
+        writer.writerows(self.records)
+        out = buffer.getvalue()
+        if file is not None:
+            with open(file, 'w', newline='') as f:
+                f.write(out)
+        return out
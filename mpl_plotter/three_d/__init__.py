@@ -4,6 +4,15 @@
 """
 3D
 --
+
+Plotters are imported from their modules when first accessed.
 """
 
-from mpl_plotter.three_d.plotters import line, scatter, surface
+from mpl_plotter.utils import lazy
+
+
+_exports = dict.fromkeys(['line', 'scatter', 'surface'], 'mpl_plotter.three_d.plotters')
+
+__all__ = list(_exports)
+
+lazy(__name__, _exports)
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Point clouds
+------------
+
+3D scatter plots of very large point clouds. Points are projected and sorted
+by depth with vectorized NumPy operations every time the axes are drawn, and
+drawn as a single 2D collection of markers. Clouds with more points than can
+be told apart on screen can be downsampled on a voxel grid beforehand.
+"""
+
+import numpy as np
+
+from matplotlib.markers import MarkerStyle
+from matplotlib.transforms import IdentityTransform
+from matplotlib.collections import PathCollection
+
+
+def voxel(xyz, budget):
+    """
+    Downsample a point cloud on a uniform voxel grid to at most *budget* points,
+    keeping one point of each occupied voxel.
+
+    The size of the grid is first estimated assuming the points lie on a surface
+    (eg: LiDAR scans of terrain or buildings), and reduced until the number of
+    occupied voxels is within the budget.
+
+    :param xyz:    Points (N, 3)
+    :param budget: Maximum number of points
+
+    :type xyz:     np.ndarray
+    :type budget:  int
+
+    :return: [np.ndarray] Sorted indices of the points kept.
+    """
+    n = len(xyz)
+
+    if n <= budget:
+        return np.arange(n)
+
+    lower = np.nanmin(xyz, axis=0)
+    span  = np.nanmax(xyz, axis=0) - lower
+    span[span == 0] = 1
+
+    # Position of the points in the bounding box of the cloud (0-1)
+    u = (xyz - lower) / span
+
+    def voxels(g):
+        cells = np.minimum((u * g).astype(np.int64), g - 1)
+        return (cells[:, 0] * g + cells[:, 1]) * g + cells[:, 2]
+
+    g = max(int(np.sqrt(budget)), 1)
+
+    while True:
+        ids      = voxels(g)
+        # Sorting alone is cheaper than finding the first point of each voxel
+        occupied = np.unique(ids).size
+
+        if occupied <= budget or g == 1:
+            break
+
+        g = max(min(g - 1, int(g * np.sqrt(budget / occupied))), 1)
+
+    _, keep = np.unique(ids, return_index=True)
+
+    return np.sort(keep)
+
+
+class cloud(PathCollection):
+
+    def __init__(self, x, y, z, values=None, budget=None, size=30, marker='o', **kwargs):
+        """
+        Point cloud
+        ===========
+
+        Collection of markers at a set of 3D points. Its **do_3d_projection** method,
+        called by ``Axes3D`` before it is drawn, projects all points with the
+        projection matrix of the axes at once and sorts them from back to front,
+        so that points closer to the camera are drawn over those behind them.
+
+        The offset transform of the collection must be the data transform of
+        the axes (**offset_transform=ax.transData**).
+
+        :param x:      x coordinates of the points
+        :param y:      y coordinates of the points
+        :param z:      z coordinates of the points
+        :param values: Values of the points, mapped to colors with the colormap and norm of the collection
+        :param budget: Maximum number of points drawn. If the cloud has more, it is downsampled on a voxel grid
+        :param size:   Marker size in points squared
+        :param marker: Matplotlib marker
+        :param kwargs: PathCollection arguments (eg: facecolors, cmap, norm, alpha, offset_transform)
+
+        :type x:       np.ndarray
+        :type y:       np.ndarray
+        :type z:       np.ndarray
+        :type values:  np.ndarray
+        :type budget:  int
+        :type size:    float
+        :type marker:  str
+        """
+        marker = MarkerStyle(marker)
+        path   = marker.get_path().transformed(marker.get_transform())
+
+        # Markers are scaled to their size in display coordinates
+        super().__init__([path], sizes=[size], transform=IdentityTransform(), **kwargs)
+
+        xyz  = np.column_stack([np.ravel(x), np.ravel(y), np.ravel(z)]).astype(np.float64, copy=False)
+        keep = voxel(xyz, budget) if budget is not None else slice(None)
+
+        self.xyz    = xyz[keep]
+        self.values = np.ravel(values)[keep] if values is not None else None
+
+        if self.values is not None:
+            self.set_array(self.values)
+
+    def do_3d_projection(self):
+        """
+        Project the points with the projection matrix of the axes, and sort
+        them from back to front.
+
+        :return: [float] Depth of the point closest to the camera, by which ``Axes3D`` sorts its collections.
+        """
+        M = self.axes.M
+
+        # Homogeneous projection of all points: (M @ [x, y, z, 1]^T)^T
+        p = self.xyz @ M[:, :3].T + M[:, 3]
+        p = p[:, :3] / p[:, 3:]
+
+        order = np.argsort(p[:, 2])[::-1]
+        p     = p[order]
+
+        PathCollection.set_offsets(self, p[:, :2])
+
+        if self.values is not None:
+            self.set_array(self.values[order])
+
+        return np.min(p[:, 2]) if p.size else np.nan
@@ -18,7 +18,8 @@ from mpl_plotter.methods.common import method_backend, \
                                        method_background_color, \
                                        method_subplots_adjust, \
                                        method_save, \
-                                       method_show 
+                                       method_show, \
+                                       method_blit
 
 # 3D
 from mpl_plotter.methods.three_d import method_setup, \
@@ -46,6 +47,7 @@ class canvas:
     method_subplots_adjust  = method_subplots_adjust
     method_save             = method_save
     method_show             = method_show
+    method_blit             = method_blit
 
     # 3D
     method_setup            = method_setup
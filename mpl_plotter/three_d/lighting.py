@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Lighting
+--------
+
+Hillshading of surfaces, computed once and cached by the contents of the
+surface, the colormap and the parameters of the light source, so that the
+same surface can be drawn from any number of view angles without being
+shaded again.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import matplotlib as mpl
+
+from matplotlib.colors import LightSource
+
+from mpl_plotter.utils import fingerprint
+
+
+# Shading of the most recently drawn surfaces
+cache      = OrderedDict()
+cache_size = 16
+
+
+def shade(z, cmap, azdeg=270, altdeg=45, blend_mode='soft', vert_exag=0.1, cached=True):
+    """
+    Return the RGBA colors of a surface lit by a light source,
+    shading it only if it is not cached with the same parameters.
+
+    Cached colors are shared by all plots of the same surface, and are read-only.
+
+    :param z:          Surface heights
+    :param cmap:       Colormap or colormap name
+    :param azdeg:      Azimuth of the light source (0-360, degrees clockwise from North)
+    :param altdeg:     Altitude of the light source (0-90, degrees up from horizontal)
+    :param blend_mode: Blend mode of the colormap and the illumination ('hsv', 'overlay', 'soft')
+    :param vert_exag:  Vertical exaggeration of the surface heights
+    :param cached:     Whether to use (and fill) the cache
+
+    :type z:           np.ndarray
+    :type cmap:        str or mpl.colors.Colormap
+    :type azdeg:       float
+    :type altdeg:      float
+    :type blend_mode:  str
+    :type vert_exag:   float
+    :type cached:      bool
+
+    :return: [np.ndarray] RGBA colors of the surface, of shape (rows, columns, 4).
+    """
+    cmap = cmap if isinstance(cmap, mpl.colors.Colormap) else mpl.colormaps.get_cmap(cmap)
+
+    # Colormaps are hashed by their colors, as they may be modified or created on the fly
+    key = fingerprint(np.asarray(z), cmap(np.linspace(0, 1, cmap.N)), azdeg, altdeg, blend_mode, vert_exag)
+
+    if cached and key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    rgba = LightSource(azdeg, altdeg).shade(z,
+                                            cmap=cmap,
+                                            vert_exag=vert_exag,
+                                            blend_mode=blend_mode)
+
+    if cached:
+        rgba.setflags(write=False)
+        cache[key] = rgba
+        while len(cache) > cache_size:
+            cache.popitem(last=False)
+
+    return rgba
@@ -9,8 +9,19 @@ Placeholders
 import numpy as np
 from matplotlib import cbook
 
+from mpl_plotter.utils import placeholder
 
-def hill():
+
+@placeholder
+def hill(size=45, step=1):
+    """
+    Region of a digital elevation model of the Jacksboro fault, from Matplotlib's sample data.
+
+    :param size: Number of rows and columns
+    :param step: Stride of the rows and columns in the model (inverse resolution)
+
+    :return: [tuple of np.ndarray] x, y meshgrids and z.
+    """
     with cbook.get_sample_data('jacksboro_fault_dem.npz', np_load=True) as dem:
         z = dem['elevation']
         nrows, ncols = z.shape
@@ -18,7 +29,8 @@ def hill():
         y = np.linspace(dem['ymin'], dem['ymax'], nrows)
         x, y = np.meshgrid(x, y)
 
-    region = np.s_[5:50, 5:50]
-    x, y, z = x[region], y[region], z[region]
+    region = np.s_[5:5 + size*step:step, 5:5 + size*step:step]
+    # Copied, so as not to keep the whole model in memory
+    x, y, z = x[region].copy(), y[region].copy(), z[region].copy()
 
     return x, y, z
@@ -6,14 +6,10 @@ Plotting Methods
 ----------------
 """
 
-import inspect
-import difflib
 import warnings
 import numpy as np
 import matplotlib as mpl
 
-from matplotlib.colors import LightSource
-
 from importlib import import_module
 
 # METHODS
@@ -22,18 +18,25 @@ from mpl_plotter.three_d.components import guides
 from mpl_plotter.three_d.components import framing
 from mpl_plotter.three_d.components import text
 
-from mpl_plotter.three_d.mock import hill
+from mpl_plotter.parameters import parametric
 
-from mpl_plotter.utils import ensure_ndarray
+from mpl_plotter.three_d.lighting import shade
+from mpl_plotter.three_d.cloud import cloud
 
+from mpl_plotter.color.maps import colormap
 
-class plot(canvas, guides, framing, text):
+from mpl_plotter.utils import ensure_ndarray, lod
 
-    def init(self):
 
-        self.method_backend()
+class plot(parametric, canvas, guides, framing, text):
+
+    def init(self):
 
-        self.plt = import_module("matplotlib.pyplot")
+        if self.pyplot:
+            self.method_backend()
+            self.plt = import_module("matplotlib.pyplot")
+        else:
+            self.plt = None
 
         self.run()
 
@@ -92,7 +95,7 @@ class line(plot):
                  scale_y=None,
                  scale_z=None,
                  # Backend
-                 backend='Qt5Agg',
+                 backend='Qt5Agg', pyplot=True,
                  # Fonts
                  font_typeface=None, font_family='serif', font_math="dejavuserif", font_color="black", font_size_increase=0,
                  # Figure, axis
@@ -178,11 +181,16 @@ class line(plot):
                             ... stackoverflow
                         Plotting window freezes even if trying different backends with no backend error: python configuration problem
                             backend=None
+        :param pyplot:  Whether to use the Pyplot state machine. If False, the plot is drawn exclusively
+                        through its Figure and Axes on an Agg canvas, with no Pyplot figure management
+                        involved (the figure is not registered, and **backend** and **show** are ignored).
+                        Plots can then be drawn in parallel threads, and their figures are garbage
+                        collected as soon as they are no longer referenced
         """
 
-        # Turn all instance arguments to instance attributes
-        for item in inspect.signature(line).parameters:
-            setattr(self, item, eval(item))
+        # Parameter record: instance arguments, of which only those which
+        # differ from their defaults are stored
+        self.parameters = line.schema.bind(locals())
 
         # Coordinates
         self.x = ensure_ndarray(self.x) if self.x is not None else self.x
@@ -209,6 +217,7 @@ class scatter(plot):
                  # Specifics
                  x=None, y=None, z=None, scatter_size=30, scatter_marker="o", 
                  scatter_facecolors=None, color_rule=None, scatter_alpha=1,
+                 scatter_point_cloud=False, scatter_point_budget=None,
                  # Color
                  color='darkred', cmap='RdBu_r',
                  # Color bar
@@ -229,7 +238,7 @@ class scatter(plot):
                  scale_y=None,
                  scale_z=None,
                  # Backend
-                 backend='Qt5Agg',
+                 backend='Qt5Agg', pyplot=True,
                  # Fonts
                  font_typeface=None, font_family='serif', font_math="dejavuserif", font_color="black", font_size_increase=0,
                  # Figure, axis
@@ -301,6 +310,13 @@ class scatter(plot):
         :param z: z
         :param scatter_size: Point size
         :param scatter_marker: Dot scatter_marker
+        :param scatter_point_cloud: Draw the points as a point cloud: projected and sorted by depth
+                                    with vectorized operations on every draw, which is much faster
+                                    than Matplotlib for large numbers of points. Points are drawn
+                                    with a single color or color rule, and without depth shading
+        :param scatter_point_budget: Maximum number of points drawn in a point cloud. Larger clouds are
+                                     downsampled on a voxel grid, keeping one point per voxel. If 'auto',
+                                     one point for each 2x2 pixel area of the figure. Default: all points
 
         Color:
         :param color: Solid color
@@ -316,11 +332,16 @@ class scatter(plot):
                             ... stackoverflow
                         Plotting window freezes even if trying different backends with no backend error: python configuration problem
                             backend=None
+        :param pyplot:  Whether to use the Pyplot state machine. If False, the plot is drawn exclusively
+                        through its Figure and Axes on an Agg canvas, with no Pyplot figure management
+                        involved (the figure is not registered, and **backend** and **show** are ignored).
+                        Plots can then be drawn in parallel threads, and their figures are garbage
+                        collected as soon as they are no longer referenced
         """
 
-        # Turn all instance arguments to instance attributes
-        for item in inspect.signature(scatter).parameters:
-            setattr(self, item, eval(item))
+        # Parameter record: instance arguments, of which only those which
+        # differ from their defaults are stored
+        self.parameters = scatter.schema.bind(locals())
 
         # Coordinates
         self.x = ensure_ndarray(self.x) if self.x is not None else self.x
@@ -331,7 +352,9 @@ class scatter(plot):
 
     def plot(self):
 
-        if self.color_rule is not None:
+        if self.scatter_point_cloud:
+            self.method_point_cloud()
+        elif self.color_rule is not None:
             self.graph = self.ax.scatter(self.x, self.y, self.z, label=self.plot_label,
                                          s=self.scatter_size, marker=self.scatter_marker, facecolors=self.scatter_facecolors,
                                          c=self.color_rule, cmap=self.cmap,
@@ -343,6 +366,28 @@ class scatter(plot):
                                          color=self.color,
                                          alpha=self.scatter_alpha)
 
+    def method_point_cloud(self):
+
+        budget = self.scatter_point_budget
+        if budget == 'auto':
+            budget = int(self.fig.get_figwidth() * self.fig.get_figheight() * self.fig.dpi**2 / 4)
+
+        self.graph = cloud(self.x, self.y, self.z,
+                           values=self.color_rule,
+                           budget=budget,
+                           size=self.scatter_size,
+                           marker=self.scatter_marker,
+                           facecolors=self.color if self.color_rule is None else None,
+                           edgecolors='face',
+                           cmap=self.cmap if self.color_rule is not None else None,
+                           alpha=self.scatter_alpha,
+                           label=self.plot_label,
+                           offset_transform=self.ax.transData)
+        self.ax.add_collection(self.graph, autolim=False)
+
+        if self.color_rule is not None:
+            self.method_colorbar()
+
     def mock(self):
         if self.x is None and self.y is None and self.z is None:
             self.x = np.linspace(-2, 2, 20)
@@ -357,8 +402,10 @@ class surface(plot):
                  # Specifics
                  x=None, y=None, z=None, surface_rstride=1, surface_cstride=1, surface_wire_width=0.1,
                  surface_lighting=False, surface_antialiased=False, surface_shade=False, surface_alpha=1,
-                 surface_cmap_lighting=None,
+                 surface_cmap_lighting=None, surface_light_azdeg=270, surface_light_altdeg=45,
+                 surface_blend_mode='soft', surface_vert_exag=0.1, surface_lighting_cache=True,
                  surface_edge_color='black', surface_edges_to_rgba=False,
+                 surface_lod=None, surface_lod_budget=None,
                  # Color
                  cmap='RdBu_r', color=None, color_rule=None,
                  # Color bar
@@ -379,7 +426,7 @@ class surface(plot):
                  scale_y=None,
                  scale_z=None,
                  # Backend
-                 backend='Qt5Agg',
+                 backend='Qt5Agg', pyplot=True,
                  # Fonts
                  font_typeface=None, font_family='serif', font_math="dejavuserif", font_color="black", font_size_increase=0,
                  # Figure, axis
@@ -457,11 +504,23 @@ class surface(plot):
         :param surface_rstride: Surface grid definition
         :param surface_cstride: Surface grid definition
         :param surface_wire_width: Width of interpolating lines
+        :param surface_lod: Level of detail. 'stride' or 'curvature' to draw the surface on a subset of
+                            the rows and columns of its grid, of at most **surface_lod_budget** cells,
+                            chosen at a uniform stride or where the surface bends the most respectively.
+                            The color rule and lighting are reduced alike. **surface_rstride** and
+                            **surface_cstride** are then ignored
+        :param surface_lod_budget: Maximum number of polygons drawn. Default: one for each 4x4 pixel area of the figure
 
         - Lighting
         :param surface_lighting: Apply lighting
         :param surface_antialiased: Apply antialiasing
         :param surface_shade: Apply shading
+        :param surface_light_azdeg: Azimuth of the light source (0-360, degrees clockwise from North)
+        :param surface_light_altdeg: Altitude of the light source (0-90, degrees up from horizontal)
+        :param surface_blend_mode: Blend mode of the colormap and the lighting ('hsv', 'overlay', 'soft')
+        :param surface_vert_exag: Vertical exaggeration of the surface for lighting
+        :param surface_lighting_cache: Reuse the lighting of surfaces lit before with the same colormap
+                                       and light source (eg: when drawing a surface from several view angles)
 
         - Color
         :param surface_edge_color:    Color of surface plot edges
@@ -478,11 +537,16 @@ class surface(plot):
                             ... stackoverflow
                         Plotting window freezes even if trying different backends with no backend error: python configuration problem
                             backend=None
+        :param pyplot:  Whether to use the Pyplot state machine. If False, the plot is drawn exclusively
+                        through its Figure and Axes on an Agg canvas, with no Pyplot figure management
+                        involved (the figure is not registered, and **backend** and **show** are ignored).
+                        Plots can then be drawn in parallel threads, and their figures are garbage
+                        collected as soon as they are no longer referenced
         """
 
-        # Turn all instance arguments to instance attributes
-        for item in inspect.signature(surface).parameters:
-            setattr(self, item, eval(item))
+        # Parameter record: instance arguments, of which only those which
+        # differ from their defaults are stored
+        self.parameters = surface.schema.bind(locals())
 
         # Coordinates
         self.x = ensure_ndarray(self.x) if self.x is not None else self.x
@@ -492,12 +556,66 @@ class surface(plot):
         self.init()
 
     def plot(self):
+
+        self.method_lod()
+
+        self.graph = self.method_surface()
+        
+        self.method_colorbar()
+        self.method_edges_to_rgba()
+
+    def update(self, z=None, color_rule=None):
+        """
+        Replace the data of the surface, keeping the rest of the figure as is.
+        The surface is colored with the norm of the first frame.
+
+        :param z: z
+        :param color_rule: Color rule, if one was provided
+
+        :type z: np.ndarray
+        :type color_rule: np.ndarray
+        """
+        self.z          = self.method_lod_reduce(ensure_ndarray(z)) if z is not None else self.z
+        self.color_rule = self.method_lod_reduce(ensure_ndarray(color_rule)) if color_rule is not None else self.color_rule
+
+        # Surfaces are triangulated and shaded upon creation, so they are replaced
+        self.graph.remove()
+        self.graph = self.method_surface()
+        self.method_edges_to_rgba()
+
+    def method_lod(self):
+        """
+        Reduce the grid of the surface to its level of detail (see ``utils.lod``).
+        """
+        self.lod = None
+
+        if self.surface_lod is None:
+            return
+
+        if self.surface_lod_budget is not None:
+            budget = self.surface_lod_budget
+        else:
+            dpi    = self.dpi if self.dpi is not None else self.fig.dpi
+            budget = int(self.fig.get_figwidth() * self.fig.get_figheight() * dpi**2 / 16)
+
+        self.lod = np.ix_(*lod(self.z, budget, self.surface_lod))
+
+        self.x = self.method_lod_reduce(self.x)
+        self.y = self.method_lod_reduce(self.y)
+        self.z = self.method_lod_reduce(self.z)
+        if isinstance(self.color_rule, np.ndarray) and self.color_rule.ndim == 2:
+            self.color_rule = self.method_lod_reduce(self.color_rule)
+
+    def method_lod_reduce(self, a):
+        return a[self.lod] if self.lod is not None else a
+
+    def method_surface(self):
         
         kwargs = {
             "alpha":          self.surface_alpha,
             "edgecolors":     self.surface_edge_color,
-            "rstride":        self.surface_rstride,
-            "cstride":        self.surface_cstride,
+            "rstride":        self.surface_rstride if self.lod is None else 1,
+            "cstride":        self.surface_cstride if self.lod is None else 1,
             "linewidth":      self.surface_wire_width,
             "antialiased":    self.surface_antialiased,
             "shade":          self.surface_shade
@@ -529,44 +647,32 @@ class surface(plot):
                 "norm":       self.cb_norm
             })
             
-        self.graph = self.ax.plot_surface(self.x, self.y, self.z, **kwargs)
-        
-        self.method_colorbar()
-        self.method_edges_to_rgba()
+        return self.ax.plot_surface(self.x, self.y, self.z, **kwargs)
         
     def mock(self):
         if self.x is None and self.y is None and self.z is None:
+            from mpl_plotter.three_d.mock import hill
             self.x, self.y, self.z = hill()
 
     def method_lighting(self):
-        
-        ls = LightSource(270, 45)
-
-        if self.color is not None:
-            if self.surface_cmap_lighting is None:
-                try:
-                    cmap = difflib.get_close_matches(self.color, self.plt.colormaps())[0]
-                    print(f'You have selected the solid **color** "{self.color}" for your surface, and set **lighting** as **True**\n\n'
-                          f'   The search for Matplotlib colormaps similar to "{self.color}" has resulted in: \n')
-                    print(f'       "{cmap}"\n')
-                    print('   Specify a custom colormap for the lighting function with the **surface_cmap_lighting** attribute.\n'
-                          '   NOTE: This will overrule your monochrome color, however. Set **lighting** to **False** if this is undesired.')
-                except IndexError:
-                    cmap = "Greys"
-                    print(f'You have selected the solid _color_ "{self.color}" for your surface, and set _lighting_ as True\n\n'
-                          f'   The search for Matplotlib colormaps similar to "{self.color}" has failed. Reverting to\n')
-                    print(f'       "{cmap}"\n')
-                    print('   Specify a custom colormap for the lighting function with the _surface_cmap_lighting_ attribute.\n'
-                          '   NOTE: This will overrule your monochrome color, however. Set _lighting_ to False if this is undesired.')
-            else:
-                cmap = self.surface_cmap_lighting if self.surface_cmap_lighting is not None else self.cmap
+
+        if self.color is not None and self.surface_cmap_lighting is None:
+            cmap = colormap(self.color)
+            print(f'You have selected the solid **color** "{self.color}" for your surface, and set **lighting** as **True**\n\n'
+                  f'   The Matplotlib colormap matching "{self.color}" is: \n')
+            print(f'       "{cmap}"\n')
+            print('   Specify a custom colormap for the lighting function with the **surface_cmap_lighting** attribute.\n'
+                  '   NOTE: This will overrule your monochrome color, however. Set **lighting** to **False** if this is undesired.')
         else:
             cmap = self.surface_cmap_lighting if self.surface_cmap_lighting is not None else self.cmap
-            
-        rgb = ls.shade(self.z,
-                       cmap=mpl.colormaps.get_cmap(cmap),
-                       vert_exag=0.1,
-                       blend_mode='soft')
+
+        rgb = shade(self.z,
+                    cmap=cmap,
+                    azdeg=self.surface_light_azdeg,
+                    altdeg=self.surface_light_altdeg,
+                    blend_mode=self.surface_blend_mode,
+                    vert_exag=self.surface_vert_exag,
+                    cached=self.surface_lighting_cache)
 
         return rgb
 
@@ -4,8 +4,20 @@
 """
 2D
 --
+
+Plotters are imported from their modules when first accessed.
 """
 
-from mpl_plotter.two_d.plotters import line, scatter, heatmap, contour, quiver, streamline, fill_area
-from mpl_plotter.two_d.comparison import comparison
-from mpl_plotter.two_d.panes import panes
+from mpl_plotter.utils import lazy
+
+
+_exports = {
+    **dict.fromkeys(['line', 'scatter', 'heatmap', 'contour', 'quiver', 'streamline', 'fill_area'],
+                    'mpl_plotter.two_d.plotters'),
+    'comparison': 'mpl_plotter.two_d.comparison',
+    'panes':      'mpl_plotter.two_d.panes',
+}
+
+__all__ = list(_exports)
+
+lazy(__name__, _exports)
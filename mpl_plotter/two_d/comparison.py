@@ -6,8 +6,6 @@ Composition: ``comparison``
 ---------------------------
 """
 
-import os
-
 import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -15,7 +13,7 @@ import matplotlib.pyplot as plt
 from mpl_plotter.two_d import line
 from mpl_plotter.color.schemes import colorscheme_one
 
-from mpl_plotter.utils import tmp
+from mpl_plotter.utils import fit_legend
 
 
 def comparison(x,
@@ -23,12 +21,14 @@ def comparison(x,
                f=None,
                show=False,
                autocolor=True,
+               bulk=False,
                top=None,
                bottom=None,
                left=None,
                right=None,
                wspace=None,
                hspace=None,
+               _compose=False,
                **kwargs):
     """
     .. raw:: latex
@@ -105,6 +105,11 @@ def comparison(x,
     :param y:         Values.
     :param f:         Functions used to plot y(x)
     :param autocolor: Whether to automatically assign different colors to each curve
+    :param bulk:      Whether to draw all curves at once, as a single collection of a single
+                      ``line`` plot, decorating the axes only once. Curves of different length
+                      are padded with NaN. Only ``line`` curves are supported, and only the
+                      ``colors``, ``line_widths``, ``line_styles``, ``alphas`` and ``plot_labels``
+                      plural arguments
     :param show:      plt.show() after plotting (thereby finishing the plot)
     :param top:       plt.subplots_adjust parameter
     :param bottom:    plt.subplots_adjust parameter
@@ -118,6 +123,7 @@ def comparison(x,
     :type y:          list of list or list of np.ndarray
     :type f:          list of plot
     :type autocolor:  bool
+    :type bulk:       bool
     :type show:       bool
     :type top:        float
     :type bottom:     float
@@ -125,6 +131,10 @@ def comparison(x,
     :type right:      float
     :type wspace:     float
     :type hspace:     float
+
+    **Output**
+
+    :return: Figure object
     """
 
     ###############################
@@ -152,6 +162,10 @@ def comparison(x,
     ###############################
     #          ARGUMENTS          #
     ###############################
+    # Compositions (``panes``) set the margins of the figure themselves, once
+    if _compose:
+        kwargs.update(dict.fromkeys(['top', 'bottom', 'left', 'right', 'wspace', 'hspace']))
+
     # figure ----------------------------------------------------------
     fig_par = [                                                         # Get figure specific parameters
                 'backend',
@@ -226,12 +240,15 @@ def comparison(x,
     ###############################
     #           LIMITS            #
     ###############################
-    y_max = max(y[n].max() for n in range(len(y)))
-    y_min = min(y[n].min() for n in range(len(y)))
+    curves_x = [x] if single_x else x
+    curves_y = [y] if single_y else y
+
+    y_max = max(np.nanmax(curve) for curve in curves_y)
+    y_min = min(np.nanmin(curve) for curve in curves_y)
     span_y = abs(y_max - y_min)
 
-    x_max = max(x[n].max() for n in range(len(x)))
-    x_min = min(x[n].min() for n in range(len(x)))
+    x_max = max(np.nanmax(curve) for curve in curves_x)
+    x_min = min(np.nanmin(curve) for curve in curves_x)
     span_x = abs(x_max - x_min)
 
     bounds_x      = kwargs.pop('bounds_x',      [x_min - 0.05 * span_x, x_max + 0.05 * span_x])
@@ -245,43 +262,98 @@ def comparison(x,
     n_curves = len(y) if not single_y else len(x) if not single_x else 1
     f        = f if isinstance(f, list) else [f]*n_curves if f is not None else [line]*n_curves
 
+    # All curves are drawn on the figure and axes of the first
+    fig      = kwargs.pop('fig', None)
+    ax       = kwargs.pop('ax',  None)
+    pyplot   = kwargs.get('pyplot', True)
+
     ###############################
     #            PLOT             #
     ###############################
-    for n in range(n_curves):
+    if bulk:
+
+        if not all(fn is line for fn in f):
+            raise ValueError('Only line curves can be drawn in bulk.')
+
+        unsupported = [k for k in plurals.keys() if k[:-1] not in ['color', 'line_width', 'line_style', 'alpha', 'plot_label']]
+        if unsupported:
+            raise ValueError(f'The following plural arguments are not supported in bulk: {", ".join(unsupported)}')
+
+        # Curves as rows of 2D arrays, padded with NaN
+        def rows(curves):
+            length = max(len(curve) for curve in curves)
+            a = np.full((len(curves), length), np.nan)
+            for n, curve in enumerate(curves):
+                a[n, :len(curve)] = curve
+            return a
+
+        plot = line(x=x if single_x else rows(curves_x),
+                    y=rows(curves_y*n_curves if single_y else curves_y),
+
+                    bounds_x=bounds_x,
+                    bounds_y=bounds_y,
+
+                    tick_bounds_x=tick_bounds_x,
+                    tick_bounds_y=tick_bounds_y,
+
+                    resize_axes=kwargs.pop('resize_axes', True),
+                    grid=kwargs.pop('grid', True),
 
-        args = {**kwargs, **plural(n), **cparam(n)} if n != n_curves - 1 else {**kwargs, **plural(n), **cparam(n), **fargs}
+                    fig=fig,
+                    ax=ax,
 
-        f[n](x=x[n] if not single_x else x,
-             y=y[n] if not single_y else y,
+                    **{k[:-1]: list(v) for k, v in plurals.items()},
+                    **cargs,
+                    **kwargs,
+                    **fargs,
+                    )
+
+        fig, ax = plot.fig, plot.ax
+
+    else:
+
+        for n in range(n_curves):
+
+            args = {**kwargs, **plural(n), **cparam(n)} if n != n_curves - 1 else {**kwargs, **plural(n), **cparam(n), **fargs}
+
+            plot = f[n](x=x[n] if not single_x else x,
+                        y=y[n] if not single_y else y,
              
-             bounds_x=bounds_x,
-             bounds_y=bounds_y,
+                        bounds_x=bounds_x,
+                        bounds_y=bounds_y,
              
-             tick_bounds_x=tick_bounds_x,
-             tick_bounds_y=tick_bounds_y,
+                        tick_bounds_x=tick_bounds_x,
+                        tick_bounds_y=tick_bounds_y,
              
-             resize_axes=kwargs.pop('resize_axes', True) if n == n_curves - 1 else False,   # Avoid conflict
-             grid=kwargs.pop('grid', True) if n == n_curves - 1 else False,                 # Avoid conflict
+                        resize_axes=kwargs.pop('resize_axes', True) if n == n_curves - 1 else False,   # Avoid conflict
+                        grid=kwargs.pop('grid', True) if n == n_curves - 1 else False,                 # Avoid conflict
              
-             **args,
-             )
+                        fig=fig,
+                        ax=ax,
+
+                        **args,
+                        )
+
+            # Custom plotting functions may not return their plot
+            fig, ax = (plot.fig, plot.ax) if hasattr(plot, 'fig') else (plt.gcf(), plt.gca())
+
+    # Compositions (``panes``) place the margins and legend of the figure once, for all its panes
+    if _compose:
+        return fig
 
     # Margins
-    plt.subplots_adjust(top=     0.95                             if top    is None else top,
+    fig.subplots_adjust(top=     0.95                             if top    is None else top,
                         bottom=  0.11                             if bottom is None else bottom,
                         left=    0.05                             if left   is None else left,
                         right=   0.85                             if right  is None else right,
                         wspace=  0.35                             if wspace is None else wspace,
                         hspace=  0.6                              if hspace is None else hspace)
 
-    if fargs['legend']:
-        # Legend placement
-        legend = (c for c in plt.gca().get_children() if isinstance(c, mpl.legend.Legend))
+    if fargs['legend'] and fig.legends:
+        # Legend placement: keep the legend within the figure
+        fit_legend(fig.legends[-1])
 
-        plt.savefig(os.path.join(tmp(), 'tmp.pdf'),
-                    bbox_extra_artists=legend,      # Expand figure to fit legend
-                    )
-
-    if show:
+    if show and pyplot:
         plt.show()
+
+    return fig
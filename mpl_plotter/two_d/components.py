@@ -18,12 +18,14 @@ from mpl_plotter.methods.common import method_backend, \
                                        method_background_color, \
                                        method_subplots_adjust, \
                                        method_save, \
+                                       method_blit, \
                                        method_show 
 
 # 2D
 from mpl_plotter.methods.two_d import method_setup, \
                                       method_spines, \
                                       method_resize_axes, \
+                                      method_rescale, \
                                       method_grid, \
                                       method_legend, \
                                       method_tick_locs, \
@@ -41,6 +43,7 @@ class canvas:
     method_subplots_adjust  = method_subplots_adjust
     method_save             = method_save
     method_show             = method_show
+    method_blit             = method_blit
 
     # 2D
     method_setup            = method_setup
@@ -51,6 +54,7 @@ class framing:
 
     # 2D
     method_resize_axes      = method_resize_axes
+    method_rescale          = method_rescale
 
 
 class guides:
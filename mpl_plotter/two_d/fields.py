@@ -0,0 +1,300 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Fields
+------
+
+Scalar fields on rectilinear grids too large to be held in memory, stored as
+NumPy ``.npy`` files or raw binary files, and read through memory maps. Only
+the part of a field within the bounds of a plot is read, and it is reduced
+block by block to the resolution of the plot as it is read.
+"""
+
+import os
+import weakref
+
+import numpy as np
+
+from mpl_plotter.utils import ensure_ndarray, grid_edges
+
+
+reductions = ['mean', 'min', 'max', 'stride']
+
+
+def load(z, shape=None, dtype=None, offset=0):
+    """
+    Return a field as an array, memory-mapping it if it is stored in a file.
+
+    :param z:      Field: array, ``np.memmap``, or path of a ``.npy`` file or raw binary file
+    :param shape:  Shape of the field (rows, columns). Required for raw binary files
+    :param dtype:  Data type of the field. Required for raw binary files
+    :param offset: Offset of the field in raw binary files, in bytes
+
+    :type z:       np.ndarray or str or os.PathLike
+    :type shape:   tuple
+    :type dtype:   np.dtype
+    :type offset:  int
+
+    :return: np.ndarray
+    """
+    if isinstance(z, (str, os.PathLike)):
+        if str(z).endswith('.npy'):
+            return np.load(z, mmap_mode='r')
+        assert shape is not None and dtype is not None, 'The **shape** and **dtype** of raw binary fields must be provided.'
+        return np.memmap(z, dtype=dtype, mode='r', shape=shape, offset=offset)
+    return ensure_ndarray(z)
+
+
+def window(c, bounds):
+    """
+    Return the slice of a monotonic coordinate array covering a pair of bounds,
+    including the cells immediately outside of them.
+
+    :param c:      Coordinates
+    :param bounds: Lower and upper bounds, either of which may be None
+
+    :type c:       np.ndarray
+    :type bounds:  list
+
+    :return: slice
+    """
+    if bounds is None:
+        return slice(None)
+
+    lower = bounds[0] if bounds[0] is not None else -np.inf
+    upper = bounds[1] if bounds[1] is not None else np.inf
+
+    inside = np.flatnonzero((c >= lower) & (c <= upper))
+
+    if inside.size == 0:
+        return slice(None)
+
+    return slice(max(inside[0] - 1, 0), inside[-1] + 2)
+
+
+def block_reduce(a, factors, how='mean', chunk=2**24):
+    """
+    Reduce a 2D array by blocks of ``factors`` rows and columns.
+
+    The array is read by bands of rows of about **chunk** bytes, so that memory-mapped
+    arrays are never read into memory as a whole. Blocks at the end of each axis may be
+    smaller than the rest.
+
+    :param a:       Array
+    :param factors: Rows and columns of each block
+    :param how:     Reduction: 'mean', 'min' or 'max' of each block (ignoring NaN for
+                    the latter), or 'stride' to sample the first element of each block
+    :param chunk:   Size of the bands of rows read at once, in bytes
+
+    :type a:        np.ndarray
+    :type factors:  tuple of int
+    :type how:      str
+    :type chunk:    int
+
+    :return: np.ndarray
+    """
+    assert how in reductions, f'The reduction must be one of {reductions}.'
+
+    fy, fx = factors
+
+    if how == 'stride':
+        return np.array(a[::fy, ::fx])
+
+    ufunc  = {'mean': np.add, 'min': np.fmin, 'max': np.fmax}[how]
+    dtype  = np.float64 if how == 'mean' else a.dtype
+
+    rows, cols = a.shape
+    columns    = np.arange(0, cols, fx)
+
+    out   = np.empty((-(-rows // fy), columns.size), dtype=dtype)
+    band  = max(chunk // max(fy * cols * a.itemsize, 1), 1) * fy
+
+    for r in range(0, rows, band):
+        block = np.asarray(a[r:r + band])
+        block = ufunc.reduceat(block, np.arange(0, len(block), fy), axis=0, dtype=dtype)
+        block = ufunc.reduceat(block, columns, axis=1, dtype=dtype)
+        out[r // fy:r // fy + len(block)] = block
+
+    if how == 'mean':
+        out /= np.diff(np.append(np.arange(0, rows, fy), rows))[:, None]
+        out /= np.diff(np.append(columns, cols))[None, :]
+        # Keep the precision of the field
+        if np.issubdtype(a.dtype, np.floating):
+            out = out.astype(a.dtype, copy=False)
+
+    return out
+
+
+def coordinates(x, y, shape, edges=False):
+    """
+    Return the 1D coordinates of the rows and columns of a field of a given shape.
+
+    Coordinates may be those of the centers of the cells of the field, or of their
+    edges (one more than cells), in which case those of the centers, halfway
+    between the edges, are returned.
+
+    :param x:     x coordinates of the field: 1D, or a 2D ``np.meshgrid`` (xy indexing).
+                  If None, the column indices
+    :param y:     y coordinates of the field: 1D, or a 2D ``np.meshgrid`` (xy indexing).
+                  If None, the row indices
+    :param shape: Shape of the field (rows, columns)
+    :param edges: Whether to return the coordinates of the edges of the cells instead
+                  (see ``utils.grid_edges``)
+
+    :return: [tuple of np.ndarray] x and y coordinates.
+    """
+    rows, cols = shape
+
+    # Rectilinear grid coordinates, read without reading the full meshgrid
+    x = np.arange(cols) if x is None else np.asarray(x[0] if np.ndim(x) == 2 else x)
+    y = np.arange(rows) if y is None else np.asarray(y[:, 0] if np.ndim(y) == 2 else y)
+
+    if edges:
+        return grid_edges(x, y, shape)
+
+    # Cell centers, halfway between their edges
+    x = (x[1:] + x[:-1]) / 2 if x.size == cols + 1 else x
+    y = (y[1:] + y[:-1]) / 2 if y.size == rows + 1 else y
+
+    assert x.size == cols and y.size == rows, 'Field coordinates must be those of the centers or of the edges of its cells.'
+
+    return x, y
+
+
+def fit(x, y, z, shape, how='mean', bounds_x=None, bounds_y=None):
+    """
+    Read the part of a field within a pair of bounds, reduced to at most a given shape.
+
+    :param x:        x coordinates of the field: 1D, or a 2D ``np.meshgrid`` (xy indexing).
+                     If None, the column indices
+    :param y:        y coordinates of the field: 1D, or a 2D ``np.meshgrid`` (xy indexing).
+                     If None, the row indices
+    :param z:        Field
+    :param shape:    Maximum shape of the result (rows, columns), eg: the pixel size of the axes
+    :param how:      Block reduction (see ``block_reduce``)
+    :param bounds_x: x bounds
+    :param bounds_y: y bounds
+
+    :type x:         np.ndarray
+    :type y:         np.ndarray
+    :type z:         np.ndarray
+    :type shape:     tuple of int
+    :type how:       str
+    :type bounds_x:  list
+    :type bounds_y:  list
+
+    :return: [tuple of np.ndarray] 1D x and y coordinates of the reduced field, and the reduced field.
+    """
+    x, y = coordinates(x, y, z.shape)
+
+    i, j = window(y, bounds_y), window(x, bounds_x)
+    x, y = x[j], y[i]
+    z    = z[i, j]
+
+    factors = (max(int(np.ceil(y.size / shape[0])), 1),
+               max(int(np.ceil(x.size / shape[1])), 1))
+
+    z = block_reduce(z, factors, how)
+
+    if how == 'stride':
+        x, y = x[::factors[1]], y[::factors[0]]
+    else:
+        # Block centers
+        x = block_reduce(x[None, :], (1, factors[1]))[0]
+        y = block_reduce(y[:, None], (factors[0], 1))[:, 0]
+
+    return x, y, z
+
+
+class pyramid:
+
+    def __init__(self, z, how='mean'):
+        """
+        Field pyramid
+        =============
+
+        Multi-resolution pyramid of a field: level *k* is the field reduced by blocks
+        of 2^k x 2^k cells. Levels are built only when first requested, each from the
+        finest level already built.
+
+        Pyramids are shared by all plots of the same array (see ``pyramid.of``).
+
+        :param z:   Field
+        :param how: Block reduction (see ``block_reduce``)
+
+        :type z:    np.ndarray
+        :type how:  str
+        """
+        self.how    = how
+        self.levels = {0: z}
+        self.depth  = int(np.ceil(np.log2(max(max(z.shape), 1))))
+
+    # Pyramids by identity of the array and reduction, kept while in use
+    cache = weakref.WeakValueDictionary()
+
+    @classmethod
+    def of(cls, z, how='mean'):
+        """
+        Return the pyramid of a field, creating it if it does not exist.
+
+        :param z:   Field
+        :param how: Block reduction
+
+        :return: ``pyramid``
+        """
+        key = (id(z), how)
+        p   = cls.cache.get(key)
+        if p is None:
+            p = cls.cache[key] = cls(z, how)
+        return p
+
+    def level(self, k):
+        """
+        :return: [np.ndarray] Level *k* of the pyramid.
+        """
+        k = min(max(k, 0), self.depth)
+        if k not in self.levels:
+            j = max(i for i in self.levels if i < k)
+            self.levels[k] = block_reduce(self.levels[j], (2**(k - j),)*2, self.how)
+        return self.levels[k]
+
+    def view(self, xe, ye, bounds_x, bounds_y, shape):
+        """
+        Read the coarsest level of the pyramid with at least the resolution of a
+        given shape within a pair of bounds.
+
+        :param xe:       x edges of the cells of the field
+        :param ye:       y edges of the cells of the field
+        :param bounds_x: x bounds
+        :param bounds_y: y bounds
+        :param shape:    Resolution (rows, columns), eg: the pixel size of the axes
+
+        :type xe:        np.ndarray
+        :type ye:        np.ndarray
+        :type bounds_x:  list
+        :type bounds_y:  list
+        :type shape:     tuple of int
+
+        :return: [tuple of np.ndarray] x and y edges of the cells of the level within the bounds, and the level.
+        """
+        i = window((ye[1:] + ye[:-1]) / 2, bounds_y).indices(ye.size - 1)
+        j = window((xe[1:] + xe[:-1]) / 2, bounds_x).indices(xe.size - 1)
+
+        rows, cols = i[1] - i[0], j[1] - j[0]
+
+        k = int(np.floor(np.log2(max(rows / max(shape[0], 1), cols / max(shape[1], 1), 1))))
+        k = min(k, self.depth)
+        f = 2**k
+
+        z = self.level(k)
+
+        # Window of the level
+        i = slice(i[0] // f, -(-i[1] // f))
+        j = slice(j[0] // f, -(-j[1] // f))
+
+        # Edges of the blocks of the level
+        xe = np.append(xe[:-1:f], xe[-1])
+        ye = np.append(ye[:-1:f], ye[-1])
+
+        return xe[j.start:j.stop + 1], ye[i.start:i.stop + 1], np.asarray(z[i, j])
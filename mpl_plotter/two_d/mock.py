@@ -8,14 +8,21 @@ Placeholders
 
 
 import numpy as np
-import pandas as pd
 
 from numpy import sin, cos
 
+from mpl_plotter.utils import placeholder
 
-def diff_field():
-    x1 = np.linspace(-2, 2, 250)
-    x2 = np.linspace(-2, 2, 250)
+
+@placeholder
+def diff_field(n=250):
+    """
+    :param n: Resolution (points per side)
+
+    :return: [tuple of np.ndarray] x, y meshgrids, vector field components and log10 of its magnitude.
+    """
+    x1 = np.linspace(-2, 2, n)
+    x2 = np.linspace(-2, 2, n)
     x1, x2 = np.meshgrid(x1, x2)
 
     dx1 = x1**2-x2**3
@@ -25,33 +32,40 @@ def diff_field():
 
     return x1, x2, dx1, dx2, dx
 
-def spirograph():
-    # Plot a spirograph
+@placeholder
+def spirograph(dtheta=0.2):
+    """
+    :param dtheta: Angle step (resolution)
+
+    :return: [tuple of np.ndarray] x, y.
+    """
     R = 125
     d = 200
     r = 50
-    dtheta = 0.2
     steps = 8 * int(6 * 3.14 / dtheta)
-    x = np.zeros(shape=(steps, 1))
-    y = np.zeros(shape=(steps, 1))
-    theta = 0
-    for step in range(0, steps):
-        theta = theta + dtheta
-        x[step] = (R - r) * cos(theta) + d * cos(((R - r) / r) * theta)
-        y[step] = (R - r) * sin(theta) - d * sin(((R - r) / r) * theta)
+    theta = dtheta * np.arange(1, steps + 1)
 
-    return x.flatten(), y.flatten()
+    x = (R - r) * cos(theta) + d * cos(((R - r) / r) * theta)
+    y = (R - r) * sin(theta) - d * sin(((R - r) / r) * theta)
 
-def waterdrop():
+    return x, y
 
-    d = 1000
+@placeholder
+def waterdrop(d=1000):
+    """
+    :param d: Resolution (points per side)
 
+    :return: [tuple of np.ndarray] x, y meshgrids and z.
+    """
     x = np.linspace(-3, 3, d)
     y = np.linspace(-3, 3, d)
 
-    x, y = np.meshgrid(x, y)
+    # Evaluated on the outer sum of the coordinates rather than on the meshgrids
+    r2 = x[None, :]**2 + y[:, None]**2
+
+    z = -(1 + cos(12 * np.sqrt(r2))) / (0.5 * r2 + 2)
 
-    z = -(1 + cos(12 * np.sqrt(x * x + y * y))) / (0.5 * (x * x + y * y) + 2)
+    x, y = np.meshgrid(x, y)
 
     return x, y, z
 
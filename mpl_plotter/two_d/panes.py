@@ -6,8 +6,6 @@ Composition: ``panes``
 ----------------------
 """
 
-import os
-
 import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -19,7 +17,8 @@ from mpl_plotter import figure
 from mpl_plotter.two_d import line
 from mpl_plotter.two_d.comparison import comparison
 
-from mpl_plotter.utils import tmp
+from mpl_plotter.fonts import typesetting
+from mpl_plotter.utils import fit_legend
 
 
 def panes(x,
@@ -36,6 +35,9 @@ def panes(x,
           right=None,
           wspace=None,
           hspace=None,
+          share_x=False,
+          share_y=False,
+          workers=None,
           **kwargs):
     """
     .. raw:: latex
@@ -144,6 +146,12 @@ def panes(x,
     :param right:    plt.subplots_adjust parameter
     :param wspace:   plt.subplots_adjust parameter
     :param hspace:   plt.subplots_adjust parameter
+    :param share_x:  Whether all panes share the limits of the x axis, computed from all their curves
+    :param share_y:  Whether all panes share the limits of the y axis, computed from all their curves
+    :param workers:  Number of worker processes to render the panes in. If provided, each pane is
+                     drawn in a worker on a figure of its own, and the resulting rasters are
+                     composited into a single image filling the figure. The plotting functions
+                     used must then be importable (eg: MPL Plotter plotting classes)
     :param kwargs:   MPL Plotter plotting class keyword arguments for further customization
 
     :type x:         list of list or list of np.ndarray or np.ndarray
@@ -159,10 +167,13 @@ def panes(x,
     :type right:     float
     :type wspace:    float
     :type hspace:    float
+    :type share_x:   bool
+    :type share_y:   bool
+    :type workers:   int
 
     **Output**
 
-    :param panes:    list of lists, each containing the objects output by each Matplotlib plotting function used
+    :return: Figure object
     """
 
     ###############################
@@ -270,35 +281,25 @@ def panes(x,
 
     height = 3.5 if M == 1 else 4
 
+    pyplot = kwargs.get('pyplot', True)
+
     if fig is None:
         if figsize is None:
-            fig = figure((5 * N, height * M), backend=fargs['backend'])
+            fig = figure((5 * N, height * M), backend=fargs['backend'], pyplot=pyplot)
         else:
-            fig = figure(figsize)
+            fig = figure(figsize, pyplot=pyplot)
 
     ###############################
-    #            PLOT             #
+    #            PANES            #
     ###############################
-    
     shape = (M, N) if shape is None else shape
-    
+
+    panes = []
+
     for n in range(n_plots):
         
         coords = (floor(n/(N)), (n % (N)))
 
-        ax_transient = plt.subplot2grid(shape,
-                                        coords,
-                                        rowspan=1,
-                                        colspan=1)
-
-        # Margins
-        plt.subplots_adjust(top=     0.88,
-                            bottom=  0.11,
-                            left=    0.1                              if left   is not None else left,
-                            right=   0.85 if M == 1 else 0.75         if right  is not None else right,
-                            wspace=  0.6                              if wspace is not None else wspace,
-                            hspace=  0.35                             if hspace is not None else hspace)
-
         # Retrieve curve arguments
         _cargs = {}
         for k in cargs.keys():
@@ -353,32 +354,196 @@ def panes(x,
                 f if f is not None else\
                 line
 
-        comparison(X,
-                   Y,
-                   F,
-                   ax=ax_transient, fig=fig,
-                   
-                   legend=args.pop('legend') if n == n_plots-1 else False,         # Avoid conflict
-                   
-                   **args
-                   )
-
-    # Margins
-    plt.subplots_adjust(top=     1.00                             if top    is None else top,
-                        bottom=  0.11                             if bottom is None else bottom,
-                        left=    0.1                              if left   is None else left,
-                        right=   (0.85 if M == 1 else 0.75)       if right  is None else right,
-                        wspace=  0.6                              if wspace is None else wspace,
-                        hspace=  0.35                             if hspace is None else hspace)
-
-    if fargs['legend']:
-
-        # Legend placement
-        legend = (c for c in plt.gca().get_children() if isinstance(c, mpl.legend.Legend))
-
-        # Save figure (necessary step for correct legend positioning, thanks to
-        # the _bbox_extra_artists_ argument of _plt.savefig_)
-        plt.savefig(os.path.join(tmp(), 'tmp.pdf'),
-                    bbox_extra_artists=legend)
-    if show:
+        args['legend'] = args.pop('legend') if n == n_plots-1 else False         # Avoid conflict
+
+        panes.append((coords, X, Y, F, args))
+
+    ###############################
+    #         SHARED AXES         #
+    ###############################
+    for axis, share, i in [('x', share_x, 1), ('y', share_y, 2)]:
+        if share:
+            curves = [curve for pane in panes for curve in (pane[i] if isinstance(pane[i], list) else [pane[i]])]
+            lower  = min(np.nanmin(curve) for curve in curves)
+            upper  = max(np.nanmax(curve) for curve in curves)
+            span   = abs(upper - lower)
+            for pane in panes:
+                pane[4].setdefault(f'bounds_{axis}',      [lower - 0.05 * span, upper + 0.05 * span])
+                pane[4].setdefault(f'tick_bounds_{axis}', [lower, upper])
+
+    ###############################
+    #            PLOT             #
+    ###############################
+    margins = dict(top=     1.00                             if top    is None else top,
+                   bottom=  0.11                             if bottom is None else bottom,
+                   left=    0.1                              if left   is None else left,
+                   right=   (0.85 if M == 1 else 0.75)       if right  is None else right,
+                   wspace=  0.6                              if wspace is None else wspace,
+                   hspace=  0.35                             if hspace is None else hspace)
+
+    if workers is None:
+
+        grid = fig.add_gridspec(*shape)
+
+        for coords, X, Y, F, args in panes:
+            comparison(X,
+                       Y,
+                       F,
+                       ax=fig.add_subplot(grid[coords]), fig=fig,
+                       _compose=True,
+                       **args
+                       )
+
+        # Margins
+        fig.subplots_adjust(**margins)
+
+        if fargs['legend'] and fig.legends:
+            # Legend placement: keep the legend within the figure
+            fit_legend(fig.legends[-1])
+
+    else:
+
+        _composite(fig, shape, margins, panes, workers)
+
+    if show and pyplot:
         plt.show()
+
+    return fig
+
+
+def _pane(figsize, dpi, shape, margins, coords, X, Y, F, args):
+    """
+    Render a pane on a transparent figure of its own, with the layout it
+    has in the composite figure.
+
+    The legend is drawn in the composite figure, from the handles of all panes.
+
+    :return: row and column of the top left corner of the pane in the figure
+             raster, RGBA raster of the pane, cropped to its content, face
+             color of the figure, and legend handles and labels of the pane
+    """
+    fig = figure(figsize, pyplot=False)
+    fig.set_dpi(dpi)
+
+    ax  = fig.add_subplot(fig.add_gridspec(*shape)[coords])
+
+    comparison(X,
+               Y,
+               F,
+               ax=ax, fig=fig,
+               _compose=True,
+               **{**args, 'pyplot': False, 'legend': False}
+               )
+
+    fig.subplots_adjust(**margins)
+
+    # Only the content of the pane is composited
+    facecolor = fig.patch.get_facecolor()
+    fig.patch.set_alpha(0)
+
+    fig.canvas.draw()
+    image = np.asarray(fig.canvas.buffer_rgba())
+
+    handles, labels = ax.get_legend_handles_labels()
+    handles = [_proxy(handle) for handle in handles]
+
+    rows = np.flatnonzero(image[..., 3].any(axis=1))
+    cols = np.flatnonzero(image[..., 3].any(axis=0))
+
+    if rows.size == 0:
+        return 0, 0, image[:0, :0].copy(), facecolor, handles, labels
+
+    return rows[0], cols[0], image[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1].copy(), facecolor, handles, labels
+
+
+def _proxy(handle):
+    """
+    Return a legend handle detached from its axes, so that it can be sent
+    to another process.
+    """
+    if isinstance(handle, mpl.lines.Line2D):
+        return mpl.lines.Line2D([], [],
+                                color=handle.get_color(),
+                                linewidth=handle.get_linewidth(),
+                                linestyle=handle.get_linestyle(),
+                                marker=handle.get_marker(),
+                                markersize=handle.get_markersize(),
+                                markerfacecolor=handle.get_markerfacecolor(),
+                                markeredgecolor=handle.get_markeredgecolor(),
+                                alpha=handle.get_alpha())
+    if isinstance(handle, mpl.collections.PathCollection):
+        return mpl.collections.PathCollection(handle.get_paths(),
+                                              sizes=handle.get_sizes(),
+                                              facecolors=handle.get_facecolors(),
+                                              edgecolors=handle.get_edgecolors(),
+                                              linewidths=handle.get_linewidths(),
+                                              alpha=handle.get_alpha())
+    if isinstance(handle, mpl.collections.Collection):
+        return mpl.patches.Patch(facecolor=handle.get_facecolor()[0] if len(handle.get_facecolor()) else 'none',
+                                 edgecolor=handle.get_edgecolor()[0] if len(handle.get_edgecolor()) else 'none',
+                                 alpha=handle.get_alpha())
+    return mpl.patches.Patch(facecolor=handle.get_facecolor(),
+                             edgecolor=handle.get_edgecolor(),
+                             alpha=handle.get_alpha())
+
+
+def _composite(fig, shape, margins, panes, workers):
+    """
+    Render panes in parallel worker processes, and composite them into
+    a single image filling the figure.
+
+    :param fig:     Figure
+    :param shape:   Shape of the pane grid
+    :param margins: Figure margins (plt.subplots_adjust parameters)
+    :param panes:   (coords, x, y, f, kwargs) tuple of each pane
+    :param workers: Number of worker processes
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from mpl_plotter.batch import initialize
+
+    figsize = tuple(fig.get_size_inches())
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initialize) as pool:
+        futures = [pool.submit(_pane, figsize, fig.dpi, shape, margins, *p) for p in panes]
+        results = [future.result() for future in futures]
+
+    handles = [handle for result in results for handle in result[4]]
+    labels  = [label  for result in results for label  in result[5]]
+
+    # Alpha compositing of the panes, in order
+    image = np.zeros((int(round(figsize[1] * fig.dpi)), int(round(figsize[0] * fig.dpi)), 4))
+
+    for i, j, crop, facecolor, _, _ in results:
+        src = crop / 255
+        dst = image[i:i + src.shape[0], j:j + src.shape[1]]
+
+        a_src = src[..., 3:]
+        a_dst = dst[..., 3:] * (1 - a_src)
+        a     = a_src + a_dst
+
+        dst[..., :3] = np.divide(src[..., :3] * a_src + dst[..., :3] * a_dst, a,
+                                 out=np.zeros_like(dst[..., :3]), where=a > 0)
+        dst[..., 3:] = a
+
+    fig.patch.set_facecolor(facecolor)
+
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.imshow(image, aspect='auto', interpolation='none')
+    ax.set_axis_off()
+
+    # Legend, as drawn by the last plot of the last pane
+    p = {**line.schema.defaults, **panes[-1][4]}
+
+    if p['legend'] and handles:
+        config = typesetting(family=p['font_family'], typeface=p['font_typeface'], color=p['font_color'])
+        legend = fig.legend(handles, labels,
+                            loc=p['legend_loc'],
+                            bbox_to_anchor=p['legend_bbox_to_anchor'],
+                            prop=mpl.font_manager.FontProperties(family=config.typeface,
+                                                                 weight=p['legend_weight'],
+                                                                 style=p['legend_style'],
+                                                                 size=p['legend_size'] + p['font_size_increase']),
+                            labelcolor=p['font_color'],
+                            handleheight=p['legend_handleheight'],
+                            ncol=p['legend_ncol'])
+        fit_legend(legend)
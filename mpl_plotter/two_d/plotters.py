@@ -7,14 +7,12 @@ Plotting Methods
 """
 
 import re
-import inspect
 import warnings
 import numpy as np
-import pandas as pd
-import datetime as dt
 from importlib import import_module
 
 import matplotlib as mpl
+from matplotlib.image import PcolorImage
 
 # METHODS
 from mpl_plotter.two_d.components import canvas
@@ -22,22 +20,27 @@ from mpl_plotter.two_d.components import guides
 from mpl_plotter.two_d.components import framing
 from mpl_plotter.two_d.components import text
 
-from mpl_plotter.two_d.mock import spirograph, waterdrop, diff_field, boltzmann
+from mpl_plotter.parameters import parametric
 
-from mpl_plotter.utils import ensure_ndarray
+from mpl_plotter.two_d import fields
+from mpl_plotter.two_d import streamlines
+
+from mpl_plotter.utils import ensure_ndarray, crossings, envelope, decimate, segments_view, polylines, ring, grid_edges, uniform
 
 
 # Override NumPy ufunc size changed warning (https://stackoverflow.com/questions/40845304/runtimewarning-numpy-dtype-size-changed-may-indicate-binary-incompatibility)
 warnings.filterwarnings("ignore", message="numpy.ufunc size changed")
 
 
-class plot(canvas, guides, framing, text):
+class plot(parametric, canvas, guides, framing, text):
 
     def init(self):
 
-        self.method_backend()
-
-        self.plt = import_module("matplotlib.pyplot")
+        if self.pyplot:
+            self.method_backend()
+            self.plt = import_module("matplotlib.pyplot")
+        else:
+            self.plt = None
 
         """
         Run
@@ -85,16 +88,71 @@ class plot(canvas, guides, framing, text):
 
         self.method_show()
 
+    def method_stream(self, capacity, *columns):
+        """
+        Append data to the buffer of a streaming plot.
+
+        Upon the first call the buffer is created, and the data of the plot is
+        copied into it. Subsequent calls only write the data appended.
+
+        :param capacity: Number of points held by the buffer. If None, no points are discarded
+        :param columns:  Data appended, one array per column of the buffer
+
+        :return: [np.ndarray] Read-only view of the data in the buffer
+        """
+        if self.__dict__.get('stream') is None:
+            self.stream = ring(capacity, len(columns))
+            self.stream.extend(np.column_stack(self.method_stream_data()))
+
+        self.stream.extend(np.column_stack([np.atleast_1d(c) for c in columns]))
+
+        return self.stream.view()
+
+    def method_stream_update(self):
+        """
+        Update the axes of a streaming plot and redraw it.
+        """
+        if self.method_rescale():
+            self.background = None
+        self.method_blit()
+
+    def method_field(self, reduction):
+        """
+        Reduce the field of the plot to the pixel resolution of its axes, reading
+        only the part of it within the bounds of the plot (see ``fields.fit``).
+
+        :param reduction: Block reduction. 'auto' to reduce memory-mapped fields by
+                          their mean, and not to reduce fields in memory. If None, the
+                          field is not reduced
+        """
+        if reduction == 'auto':
+            reduction = 'mean' if isinstance(self.z, np.memmap) else None
+
+        if reduction is None:
+            # Row and column indices
+            self.x = self.x if self.x is not None else np.arange(self.z.shape[1])
+            self.y = self.y if self.y is not None else np.arange(self.z.shape[0])
+            return
+
+        dpi   = self.dpi if self.dpi is not None else self.fig.dpi
+        box   = self.ax.get_position()
+        shape = (int(np.ceil(box.height * self.fig.get_figheight() * dpi)),
+                 int(np.ceil(box.width * self.fig.get_figwidth() * dpi)))
+
+        self.x, self.y, self.z = fields.fit(self.x, self.y, self.z, shape, reduction,
+                                            bounds_x=self.bounds_x, bounds_y=self.bounds_y)
+
 
 class line(plot):
 
     def __init__(self,
                  # Specifics
                  x=None, y=None, line_width=2, line_style=None, line_dashes=None,
+                 line_decimate=False, line_compact=False, line_buffer=None,
                  # Color
                  color='darkred', cmap='RdBu_r', alpha=None, color_rule=None,
                  # Backend
-                 backend='Qt5Agg',
+                 backend='Qt5Agg', pyplot=True,
                  # Fonts
                  font_typeface=None, font_family='serif', font_math="dejavuserif", font_color="black", font_size_increase=0,
                  # Figure, axes
@@ -174,8 +232,18 @@ class line(plot):
 
         Specifics
         :param x: x
-        :param y: y
+        :param y: y. If 2D, each row is drawn as a curve (see **method_curves**)
         :param line_width: Line width
+        :param line_decimate: Level of detail. If True, curves with more points than the pixel width
+                              of the axes are decimated before drawing, keeping the first, last,
+                              lowest and highest point of each pixel column (and NaN gaps), so that the
+                              drawn envelope is unchanged. An integer sets the number of columns.
+                              Requires monotonic x
+        :param line_compact: If a **color_rule** is provided, draw consecutive segments which fall in
+                             the same color of the colormap as a single polyline, rather than drawing
+                             one segment per pair of points
+        :param line_buffer: Number of points kept when data is appended to the plot (see **extend**),
+                            the oldest being discarded first. If None, all points are kept
 
         Color:
         :param color: Solid color
@@ -192,11 +260,16 @@ class line(plot):
                             ... stackoverflow
                         Plotting window freezes even if trying different backends with no backend error: python configuration problem
                             backend=None
+        :param pyplot:  Whether to use the Pyplot state machine. If False, the plot is drawn exclusively
+                        through its Figure and Axes on an Agg canvas, with no Pyplot figure management
+                        involved (the figure is not registered, and **backend** and **show** are ignored).
+                        Plots can then be drawn in parallel threads, and their figures are garbage
+                        collected as soon as they are no longer referenced
         """
 
-        # Turn all instance arguments to instance attributes
-        for item in inspect.signature(line).parameters:
-            setattr(self, item, eval(item))
+        # Parameter record: instance arguments, of which only those which
+        # differ from their defaults are stored
+        self.parameters = line.schema.bind(locals())
 
         # Ensure x and y are NumPy arrays
         self.x = ensure_ndarray(self.x) if self.x is not None else None
@@ -211,8 +284,17 @@ class line(plot):
         if self.line_dashes is not None:
             kwargs.update({'dashes': self.line_dashes})
         
+        # Multiple curves
+        if self.y.ndim == 2:
+            return self.method_curves()
+
+        # Level of detail
+        i = self.method_decimate()
+        x = self.x[i] if i is not None else self.x
+        y = self.y[i] if i is not None else self.y
+
         if self.color_rule is None:
-            self.graph = self.ax.plot(self.x, self.y, label=self.plot_label,
+            self.graph = self.ax.plot(x, y, label=self.plot_label,
                                       linewidth=self.line_width,
                                       linestyle=self.line_style,
                                       color=self.color,
@@ -222,24 +304,146 @@ class line(plot):
                                       )[0]
         else:
             # Create a set of line segments so that we can color them individually
-            # This creates the points as a N x 1 x 2 array so that we can stack points
-            # together easily to get the segments. The segments array for line collection
-            # needs to be (numlines) x (points per line) x 2 (for x and y)
-            points = np.array([self.x, self.y]).T.reshape(-1, 1, 2)
-            segments = np.concatenate([points[:-1], points[1:]], axis=1)
+            # The segments array for line collection needs to be (numlines) x
+            # (points per line) x 2 (for x and y), and is built as a view of the
+            # N x 2 points array, without copying them
+            points   = np.column_stack([x, y])
+            segments = segments_view(points)
             
             # Create a continuous norm to map from data points to colors
-            color_range = self.color_rule(self.x) if hasattr(self.color_rule, '__call__') else self.color_rule
-            norm        = self.plt.Normalize(color_range.min(), color_range.max())
-            lc          = mpl.collections.LineCollection(segments, cmap=self.cmap, norm=norm)
+            color_range = self.color_rule(self.x) if hasattr(self.color_rule, '__call__') else ensure_ndarray(self.color_rule)
+            color_range = color_range[i] if i is not None else color_range
+            norm        = mpl.colors.Normalize(color_range.min(), color_range.max())
+            lc          = mpl.collections.LineCollection([], cmap=self.cmap, norm=norm)
+
+            # Merge consecutive segments of the same color into polylines
+            if self.line_compact:
+                segments, color_range = polylines(points, color_range, lc.norm, lc.cmap.N)
             
             # Set the values used for colormapping
-            lc.set_array(self.color_rule)
+            lc.set_segments(segments)
+            lc.set_array(color_range)
             lc.set_linewidth(self.line_width)
             self.graph = self.ax.add_collection(lc)
         
+    def method_curves(self):
+        """
+        Draw each row of a 2D **y** as a curve, all in a single collection.
+
+        **x** may be a single domain or a 2D array with a domain per curve, and
+        rows may be padded with NaN. Lists of **color**, **line_width**,
+        **line_style**, **alpha** and **plot_label** set the value of each curve.
+        """
+        assert self.color_rule is None, '**color_rule** is not supported for multiple curves.'
+
+        n = len(self.y)
+
+        each = lambda v: [v[i % len(v)] for i in range(n)] if isinstance(v, list) else [v]*n
+
+        colors = [mpl.colors.to_rgba(c, a) for c, a in zip(each(self.color), each(self.alpha))]
+        widths = each(self.line_width)
+        styles = [s if s is not None else 'solid' for s in each(self.line_style)]
+        labels = each(self.plot_label)
+
+        # Curves x points x 2 (for x and y)
+        segments = np.stack(np.broadcast_arrays(self.x, self.y), axis=-1)
+
+        lc = mpl.collections.LineCollection(segments,
+                                            colors=colors,
+                                            linewidths=widths,
+                                            linestyles=styles,
+                                            zorder=self.zorder if self.zorder is not None else 2)
+        self.graph = self.ax.add_collection(lc)
+
+        # Legend handles
+        for c, w, s, l in zip(colors, widths, styles, labels):
+            if l is not None:
+                self.ax.plot([], [], color=c, linewidth=w, linestyle=s, label=l)
+
+    def method_decimate(self):
+        """
+        Indices of the points of the curve to be drawn, or None
+        if it is to be drawn in full.
+        """
+        if self.line_decimate is False or self.line_decimate is None or self.y.ndim != 1:
+            return None
+
+        if self.line_decimate is True:
+            # Pixel width of the axes in the saved figure
+            dpi = self.dpi if self.dpi is not None else self.fig.dpi
+            n   = self.ax.get_position().width * self.fig.get_figwidth() * dpi
+        else:
+            n   = self.line_decimate
+
+        d = np.diff(self.x)
+        if not (np.all(d >= 0) or np.all(d <= 0)):
+            return None
+
+        return decimate(self.x, self.y, int(np.ceil(n)))
+
+    def update(self, x=None, y=None, color_rule=None):
+        """
+        Replace the data of the curve, keeping the rest of the figure as is.
+        Curves are updated in full, without decimation.
+
+        :param x: x
+        :param y: y
+        :param color_rule: Color rule values, if one was provided
+
+        :type x: np.ndarray
+        :type y: np.ndarray
+        :type color_rule: np.ndarray
+        """
+        assert self.y.ndim == 1, 'Multiple curves cannot be updated.'
+        assert not self.line_compact, 'Compact curves cannot be updated.'
+
+        self.x = ensure_ndarray(x) if x is not None else self.x
+        self.y = ensure_ndarray(y) if y is not None else self.y
+
+        if self.color_rule is None:
+            self.graph.set_data(self.x, self.y)
+        else:
+            self.graph.set_segments(segments_view(np.column_stack([self.x, self.y])))
+            if color_rule is not None:
+                self.color_rule = ensure_ndarray(color_rule)
+                self.graph.set_array(self.color_rule)
+
+    def extend(self, x, y):
+        """
+        Append points to the curve, and redraw it without redrawing the
+        rest of the figure, unless the axes must be resized to fit them.
+
+        The curve is kept in a preallocated buffer of **line_buffer** points,
+        so the cost of each update does not grow with the length of its history.
+
+        :param x: x
+        :param y: y
+
+        :type x: float or np.ndarray
+        :type y: float or np.ndarray
+        """
+        assert self.color_rule is None, '**color_rule** is not supported for streaming line plots.'
+        assert self.y.ndim == 1, 'Multiple curves are not supported for streaming line plots.'
+
+        view = self.method_stream(self.line_buffer, x, y)
+
+        self.x, self.y = view[:, 0], view[:, 1]
+        self.graph.set_data(self.x, self.y)
+
+        self.method_stream_update()
+
+    def append(self, x, y):
+        """
+        Append a point to the curve (see **extend**).
+        """
+        self.extend([x], [y])
+
+    def method_stream_data(self):
+        return [self.x, self.y]
+
     def mock(self):
         if isinstance(self.x, type(None)) and isinstance(self.y, type(None)):
+            from mpl_plotter.two_d.mock import spirograph
             self.x, self.y = spirograph()
             if self.color_rule:
                 self.color_rule = self.y
@@ -250,10 +454,11 @@ class scatter(plot):
     def __init__(self,
                  # Specifics
                  x=None, y=None, scatter_size=5, scatter_marker='o', scatter_facecolors=None,
+                 scatter_buffer=None,
                  # Specifics: color
                  color="C0", cmap='RdBu_r', alpha=None, color_rule=None,
                  # Backend
-                 backend='Qt5Agg',
+                 backend='Qt5Agg', pyplot=True,
                  # Fonts
                  font_typeface=None, font_family='serif', font_math="dejavuserif", font_color="black", font_size_increase=0,
                  # Figure, axes
@@ -336,6 +541,8 @@ class scatter(plot):
         :param y: y
         :param scatter_size: Point size
         :param scatter_marker: Dot scatter_marker
+        :param scatter_buffer: Number of points kept when data is appended to the plot (see **extend**),
+                               the oldest being discarded first. If None, all points are kept
 
         Color:
         :param color: Solid color
@@ -352,11 +559,16 @@ class scatter(plot):
                             ... stackoverflow
                         Plotting window freezes even if trying different backends with no backend error: python configuration problem
                             backend=None
+        :param pyplot:  Whether to use the Pyplot state machine. If False, the plot is drawn exclusively
+                        through its Figure and Axes on an Agg canvas, with no Pyplot figure management
+                        involved (the figure is not registered, and **backend** and **show** are ignored).
+                        Plots can then be drawn in parallel threads, and their figures are garbage
+                        collected as soon as they are no longer referenced
         """
 
-        # Turn all instance arguments to instance attributes
-        for item in inspect.signature(scatter).parameters:
-            setattr(self, item, eval(item))
+        # Parameter record: instance arguments, of which only those which
+        # differ from their defaults are stored
+        self.parameters = scatter.schema.bind(locals())
 
         # Ensure x and y are NumPy arrays
         self.x = ensure_ndarray(self.x) if self.x is not None else None
@@ -381,8 +593,70 @@ class scatter(plot):
                                      alpha=self.alpha,
                                      **kwargs)
 
+    def update(self, x=None, y=None, color_rule=None):
+        """
+        Replace the data of the scatter, keeping the rest of the figure as is.
+        Points are colored with the norm of the first frame.
+
+        :param x: x
+        :param y: y
+        :param color_rule: Color rule values, if one was provided
+
+        :type x: np.ndarray
+        :type y: np.ndarray
+        :type color_rule: np.ndarray
+        """
+        self.x = ensure_ndarray(x) if x is not None else self.x
+        self.y = ensure_ndarray(y) if y is not None else self.y
+
+        self.graph.set_offsets(np.column_stack([self.x, self.y]))
+
+        if color_rule is not None:
+            self.color_rule = ensure_ndarray(color_rule)
+            self.graph.set_array(self.color_rule)
+
+    def extend(self, x, y, c=None):
+        """
+        Append points to the scatter, and redraw it without redrawing the
+        rest of the figure, unless the axes must be resized to fit them.
+
+        The points are kept in a preallocated buffer of **scatter_buffer** points,
+        so the cost of each update does not grow with the length of its history.
+
+        :param x: x
+        :param y: y
+        :param c: Values of the **color_rule** of the points, if one is provided
+
+        :type x: float or np.ndarray
+        :type y: float or np.ndarray
+        :type c: float or np.ndarray
+        """
+        if self.color_rule is not None and self.scatter_facecolors is None:
+            assert c is not None, 'The **color_rule** values of the points appended must be provided.'
+            view = self.method_stream(self.scatter_buffer, x, y, c)
+            self.graph.set_array(view[:, 2])
+        else:
+            view = self.method_stream(self.scatter_buffer, x, y)
+
+        self.x, self.y = view[:, 0], view[:, 1]
+        self.graph.set_offsets(view[:, :2])
+
+        self.method_stream_update()
+
+    def append(self, x, y, c=None):
+        """
+        Append a point to the scatter (see **extend**).
+        """
+        self.extend([x], [y], [c] if c is not None else None)
+
+    def method_stream_data(self):
+        if self.color_rule is not None and self.scatter_facecolors is None:
+            return [self.x, self.y, np.broadcast_to(self.color_rule, self.x.shape)]
+        return [self.x, self.y]
+
     def mock(self):
         if isinstance(self.x, type(None)) and isinstance(self.y, type(None)):
+            from mpl_plotter.two_d.mock import spirograph
             self.x, self.y  = spirograph()
             self.color_rule = self.y
 
@@ -392,10 +666,12 @@ class heatmap(plot):
     def __init__(self,
                  # Specifics
                  x=None, y=None, z=None, heatmap_normvariant='SymLog',
+                 heatmap_renderer='auto', heatmap_rasterized=False, heatmap_reduction='auto',
+                 heatmap_pyramid=False,
                  # Specifics: color
                  color=None, cmap='RdBu_r', alpha=None, color_rule=None,
                  # Backend
-                 backend='Qt5Agg',
+                 backend='Qt5Agg', pyplot=True,
                  # Fonts
                  font_typeface=None, font_family='serif', font_math="dejavuserif", font_color="black", font_size_increase=0,
                  # Figure, axes
@@ -476,8 +752,24 @@ class heatmap(plot):
         Specifics
         :param x: x
         :param y: y
-        :param z: z
+        :param z: z. May be a ``np.memmap``, or the path of a ``.npy`` file, which is memory-mapped
         :param heatmap_normvariant: Detailed information in the Matplotlib documentation
+        :param heatmap_renderer: 'mesh' to draw each cell as a quadrilateral (``pcolormesh``), or 'image' to
+                                 draw the heatmap as an image, which is only possible for rectilinear grids:
+                                 uniform grids are drawn with ``imshow``, and non-uniform ones as a
+                                 ``PcolorImage``. With 'auto', uniform grids are drawn with ``imshow``,
+                                 which draws the same cells, and all others with ``pcolormesh``
+        :param heatmap_rasterized: Rasterize the mesh in vector outputs (PDF, SVG). Images are always rasterized
+        :param heatmap_reduction: Reduction of the field to the pixel resolution of the axes, block by block:
+                                  'mean', 'min', 'max', or 'stride' (sampling). Only the part of the field
+                                  within **bounds_x** and **bounds_y** is read. With 'auto', memory-mapped
+                                  fields are reduced by their mean, and fields in memory are not reduced
+        :param heatmap_pyramid: Draw the heatmap from a multi-resolution pyramid of the field (see ``fields.pyramid``),
+                                reading the coarsest level which matches the resolution of the axes within their
+                                limits every time these change, so that large fields can be zoomed and panned
+                                interactively. Levels are built by **heatmap_reduction** ('mean' if 'auto' or None)
+                                when first needed, and are shared by all heatmaps of the same array.
+                                Requires a rectilinear grid
 
         Color:
         :param color: Solid color
@@ -494,33 +786,124 @@ class heatmap(plot):
                             ... stackoverflow
                         Plotting window freezes even if trying different backends with no backend error: python configuration problem
                             backend=None
+        :param pyplot:  Whether to use the Pyplot state machine. If False, the plot is drawn exclusively
+                        through its Figure and Axes on an Agg canvas, with no Pyplot figure management
+                        involved (the figure is not registered, and **backend** and **show** are ignored).
+                        Plots can then be drawn in parallel threads, and their figures are garbage
+                        collected as soon as they are no longer referenced
         """
-        # Turn all instance arguments to instance attributes
-        for item in inspect.signature(heatmap).parameters:
-            setattr(self, item, eval(item))
+        # Parameter record: instance arguments, of which only those which
+        # differ from their defaults are stored
+        self.parameters = heatmap.schema.bind(locals())
 
-        # Ensure x and y are NumPy arrays
+        # Ensure x and y are NumPy arrays, and memory-map z if it is stored in a file
         self.x = ensure_ndarray(self.x) if self.x is not None else None
         self.y = ensure_ndarray(self.y) if self.y is not None else None
-        self.z = ensure_ndarray(self.z) if self.z is not None else None
+        self.z = fields.load(self.z) if self.z is not None else None
 
         self.init()
 
     def plot(self):
+
+        if self.heatmap_pyramid:
+            return self.method_pyramid()
+
+        self.method_field(self.heatmap_reduction)
         
         if self.color_rule is None: self.color_rule = self.z
-        
-        self.graph = self.ax.pcolormesh(self.x, self.y, self.z, cmap=self.cmap,
-                                        zorder=self.zorder,
-                                        alpha=self.alpha,
-                                        label=self.plot_label,
-                                        shading='auto'
+
+        kwargs = {'cmap':   self.cmap,
+                  'zorder': self.zorder,
+                  'alpha':  self.alpha,
+                  'label':  self.plot_label}
+
+        assert self.heatmap_renderer in ['auto', 'mesh', 'image'], "**heatmap_renderer** must be 'auto', 'mesh' or 'image'."
+
+        edges = grid_edges(self.x, self.y, self.z.shape) if self.heatmap_renderer != 'mesh' else None
+
+        assert edges is not None or self.heatmap_renderer != 'image', 'Only rectilinear grids can be drawn as an image.'
+
+        # Only uniform grids are drawn as images unless requested
+        if edges is not None and self.heatmap_renderer == 'auto' and not (uniform(edges[0]) and uniform(edges[1])):
+            edges = None
+
+        if edges is None:
+            self.graph = self.ax.pcolormesh(self.x, self.y, self.z,
+                                            shading='auto',
+                                            rasterized=self.heatmap_rasterized,
+                                            **kwargs
+                                            )
+        elif uniform(edges[0]) and uniform(edges[1]):
+            xe, ye = edges
+            self.graph = self.ax.imshow(self.z,
+                                        extent=(xe[0], xe[-1], ye[0], ye[-1]),
+                                        origin='lower',
+                                        interpolation='nearest',
+                                        aspect=self.ax.get_aspect(),
+                                        **kwargs
                                         )
+        else:
+            self.graph = self.ax.pcolorfast(*edges, self.z, **kwargs)
+
         # Resize axes
         self.method_resize_axes()
 
+    def method_pyramid(self):
+        """
+        Draw the heatmap from the pyramid of its field, and redraw it
+        whenever the limits of the axes change.
+        """
+        how            = self.heatmap_reduction if self.heatmap_reduction not in ['auto', None] else 'mean'
+
+        self.edges     = fields.coordinates(self.x, self.y, self.z.shape, edges=True)
+        self.x, self.y = fields.coordinates(self.x, self.y, self.z.shape)
+        self.pyramid   = fields.pyramid.of(self.z, how)
+
+        assert self.edges is not None, 'Only rectilinear grids can be drawn from a pyramid.'
+
+        self.graph = PcolorImage(self.ax, *self.method_pyramid_view(),
+                                 cmap=self.cmap,
+                                 alpha=self.alpha,
+                                 zorder=self.zorder,
+                                 label=self.plot_label)
+        self.ax.add_image(self.graph)
+        self.graph.autoscale_None()
+
+        self.ax.callbacks.connect('xlim_changed', self.method_pyramid_update)
+        self.ax.callbacks.connect('ylim_changed', self.method_pyramid_update)
+
+        # Resize axes
+        self.method_resize_axes()
+
+    def method_pyramid_view(self):
+        """
+        :return: [tuple of np.ndarray] Cell edges and values of the level of the pyramid matching the view of the axes.
+        """
+        bbox = self.ax.bbox
+        return self.pyramid.view(*self.edges,
+                                 sorted(self.ax.get_xlim()), sorted(self.ax.get_ylim()),
+                                 (int(np.ceil(bbox.height)), int(np.ceil(bbox.width))))
+
+    def method_pyramid_update(self, ax=None):
+        xe, ye, z = self.method_pyramid_view()
+        if z.size:
+            self.graph.set_data(xe, ye, z)
+
+    def update(self, z=None):
+        """
+        Replace the values of the heatmap, keeping the rest of the figure as is.
+        The grid is kept, and values are colored with the norm of the first frame.
+
+        :param z: z
+
+        :type z: np.ndarray
+        """
+        self.z = ensure_ndarray(z) if z is not None else self.z
+        self.graph.set_array(self.z)
+
     def mock(self):
-        if isinstance(self.x, type(None)) and isinstance(self.y, type(None)):
+        if isinstance(self.z, type(None)):
+            from mpl_plotter.two_d.mock import waterdrop
             self.x, self.y, self.z = waterdrop()
 
 
@@ -533,11 +916,11 @@ class contour(plot):
                  contour_clabels=None, contour_clabels_fontsize=None, contour_clabels_colors=None,
                  contour_clabels_inline=True, contour_clabels_inline_spacing=5,
                  contour_clabels_fmt=None, contour_clabels_use_clabeltext=False,
-                 contour_clabels_zorder=2,
+                 contour_clabels_zorder=2, contour_reduction='auto',
                  # Specifics: color
                  color=None, cmap='RdBu_r', alpha=None, color_rule=None,
                  # Backend
-                 backend='Qt5Agg',
+                 backend='Qt5Agg', pyplot=True,
                  # Fonts
                  font_typeface=None, font_family='serif', font_math="dejavuserif", font_color="black", font_size_increase=0,
                  # Figure, axes
@@ -618,7 +1001,7 @@ class contour(plot):
         Specifics
         :param x: x
         :param y: y
-        :param z: z
+        :param z: z. May be a ``np.memmap``, or the path of a ``.npy`` file, which is memory-mapped
         :param contour_filled: Whether to fill the areas between contour lines
         :param contour_levels: Number of contour levels
         :param contour_colors: Sequence of colors, one for each contour level
@@ -632,6 +1015,10 @@ class contour(plot):
         :param contour_clabels_fmt: Number format of contour level labels
         :param contour_clabels_use_clabeltext: Check documentation
         :param contour_clabels_zorder: zorder of contour level labels
+        :param contour_reduction: Reduction of the field to the pixel resolution of the axes, block by block:
+                                  'mean', 'min', 'max', or 'stride' (sampling). Only the part of the field
+                                  within **bounds_x** and **bounds_y** is read. With 'auto', memory-mapped
+                                  fields are reduced by their mean, and fields in memory are not reduced
         
         Color:
         :param color: Solid color
@@ -648,19 +1035,26 @@ class contour(plot):
                             ... stackoverflow
                         Plotting window freezes even if trying different backends with no backend error: python configuration problem
                             backend=None
+        :param pyplot:  Whether to use the Pyplot state machine. If False, the plot is drawn exclusively
+                        through its Figure and Axes on an Agg canvas, with no Pyplot figure management
+                        involved (the figure is not registered, and **backend** and **show** are ignored).
+                        Plots can then be drawn in parallel threads, and their figures are garbage
+                        collected as soon as they are no longer referenced
         """
-        # Turn all instance arguments to instance attributes
-        for item in inspect.signature(contour).parameters:
-            setattr(self, item, eval(item))
+        # Parameter record: instance arguments, of which only those which
+        # differ from their defaults are stored
+        self.parameters = contour.schema.bind(locals())
 
-        # Ensure x and y are NumPy arrays
+        # Ensure x and y are NumPy arrays, and memory-map z if it is stored in a file
         self.x = ensure_ndarray(self.x) if self.x is not None else None
         self.y = ensure_ndarray(self.y) if self.y is not None else None
-        self.z = ensure_ndarray(self.z) if self.z is not None else None
+        self.z = fields.load(self.z) if self.z is not None else None
 
         self.init()
 
     def plot(self):
+
+        self.method_field(self.contour_reduction)
         
         if self.contour_filled and (self.contour_clabels is not None and self.contour_clabels):
             print("WARNING: Filled contour plots do not support **clabels**. Plotting will proceed **without filled contour levels**")
@@ -669,7 +1063,7 @@ class contour(plot):
         if self.color_rule is None:
             self.color_rule = self.z
         
-        contourf = getattr(self.plt, "contourf" if self.contour_filled else "contour")
+        contourf = getattr(self.ax, "contourf" if self.contour_filled else "contour")
         
         self.graph = contourf(self.x, self.y, self.z,
                               levels=self.contour_levels,
@@ -695,7 +1089,8 @@ class contour(plot):
         self.method_resize_axes()
 
     def mock(self):
-        if isinstance(self.x, type(None)) and isinstance(self.y, type(None)):
+        if isinstance(self.z, type(None)):
+            from mpl_plotter.two_d.mock import diff_field
             self.x, self.y, _, _, self.z = diff_field()
 
 
@@ -706,10 +1101,11 @@ class quiver(plot):
                  x=None, y=None, u=None, v=None,
                  quiver_rule=None, quiver_custom_rule=None,
                  quiver_vector_width=0.01, quiver_vector_min_shaft=2, quiver_vector_length_threshold=0.1,
+                 quiver_stride=None, quiver_max_arrows=None,
                  # Color
                  color=None, cmap='RdBu_r', alpha=None, color_rule=None,
                  # Backend
-                 backend='Qt5Agg',
+                 backend='Qt5Agg', pyplot=True,
                  # Fonts
                  font_typeface=None, font_family='serif', font_math="dejavuserif", font_color="black", font_size_increase=0,
                  # Figure, axes
@@ -798,6 +1194,11 @@ class quiver(plot):
         :param quiver_vector_width: Vector width
         :param quiver_vector_min_shaft: Minimum vector shaft
         :param quiver_vector_length_threshold: Minimum vector length
+        :param quiver_stride: Draw one of every **quiver_stride** vectors. For fields on a 2D grid, an
+                              integer or a (rows, columns) tuple, applied along each axis of the grid
+        :param quiver_max_arrows: Maximum number of vectors drawn. Fields with more vectors are thinned:
+                                  fields on a 2D grid by a uniform stride, and scattered vectors by
+                                  keeping a single vector in each cell of a uniform grid over their extent
 
         Color:
         :param color: Solid color
@@ -814,24 +1215,39 @@ class quiver(plot):
                             ... stackoverflow
                         Plotting window freezes even if trying different backends with no backend error: python configuration problem
                             backend=None
+        :param pyplot:  Whether to use the Pyplot state machine. If False, the plot is drawn exclusively
+                        through its Figure and Axes on an Agg canvas, with no Pyplot figure management
+                        involved (the figure is not registered, and **backend** and **show** are ignored).
+                        Plots can then be drawn in parallel threads, and their figures are garbage
+                        collected as soon as they are no longer referenced
         """
-        # Turn all instance arguments to instance attributes
-        for item in inspect.signature(quiver).parameters:
-            setattr(self, item, eval(item))
+        # Parameter record: instance arguments, of which only those which
+        # differ from their defaults are stored
+        self.parameters = quiver.schema.bind(locals())
 
 
-        # Ensure x and y are NumPy arrays
+        # Ensure x, y, u and v are NumPy arrays
         self.x = ensure_ndarray(self.x) if self.x is not None else None
         self.y = ensure_ndarray(self.y) if self.y is not None else None
+        self.u = ensure_ndarray(self.u) if self.u is not None else None
+        self.v = ensure_ndarray(self.v) if self.v is not None else None
         self.init()
 
     def plot(self):
 
         # Color rule
-        self.method_rule()
+        c = self.method_rule()
+
+        # Thinning
+        self.method_thin()
+        self.x, self.y = self.thin_xy(self.x, self.y)
+        self.u, self.v, c = self.thin_uv(self.u), self.thin_uv(self.v), self.thin_uv(c)
+
+        # Colors are mapped by the Quiver from the scalar values of the rule
+        norm = self.cb_norm if self.cb_norm is not None else mpl.colors.Normalize(np.nanmin(c), np.nanmax(c))
 
-        self.graph = self.ax.quiver(self.x, self.y, self.u, self.v,
-                                    color=self.color, cmap=self.cmap,
+        self.graph = self.ax.quiver(self.x, self.y, self.u, self.v, c,
+                                    cmap=self.cmap, norm=norm,
                                     width=self.quiver_vector_width,
                                     minshaft=self.quiver_vector_min_shaft,
                                     minlength=self.quiver_vector_length_threshold,
@@ -840,6 +1256,31 @@ class quiver(plot):
                                     alpha=self.alpha
                                     )
 
+    def update(self, u=None, v=None):
+        """
+        Replace the vectors of the field, keeping the rest of the figure as is.
+
+        Vectors are thinned as in the plot, and colored with the norm of the first frame.
+
+        :param u: u (of the full field)
+        :param v: v (of the full field)
+
+        :type u: np.ndarray
+        :type v: np.ndarray
+        """
+        u = ensure_ndarray(u) if u is not None else self.u_full
+        v = ensure_ndarray(v) if v is not None else self.v_full
+
+        self.u_full, self.v_full = u, v
+
+        # Evaluate the color rule of the plot again
+        self.__dict__.pop('quiver_rule', None)
+        self.u, self.v = u, v
+        c = self.method_rule()
+
+        self.u, self.v = self.thin_uv(u), self.thin_uv(v)
+        self.graph.set_UVC(self.u, self.v, self.thin_uv(c))
+
     def mock(self):
         if isinstance(self.x, type(None)) and isinstance(self.y, type(None)):
             self.x = np.random.random(100)
@@ -857,15 +1298,45 @@ class quiver(plot):
         else:
             self.quiver_rule = self.quiver_custom_rule
 
-        # Color determined by rule function
-        c = self.quiver_rule
-        # Flatten and normalize
-        c = (c.ravel() - c.min())/c.ptp()
-        # Repeat for each body line and two head lines
-        c = np.concatenate((c, np.repeat(c, 2)))
-        # Colormap
-        cmap = mpl.colormaps.get_cmap(self.cmap)
-        self.color = cmap(c)
+        # Color determined by rule function, with the shape of the field
+        return np.broadcast_to(ensure_ndarray(self.quiver_rule), np.shape(self.u))
+
+    def method_thin(self):
+        """
+        Select the vectors drawn, according to **quiver_stride** and **quiver_max_arrows**,
+        and store the functions selecting them from x and y, and from arrays with the
+        shape of u and v: ``thin_xy`` and ``thin_uv``.
+        """
+        self.u_full, self.v_full = self.u, self.v
+
+        shape = np.shape(self.u)
+        n     = int(np.prod(shape))
+
+        if len(shape) == 2:
+            # Field on a grid: stride along each axis
+            stride = self.quiver_stride if self.quiver_stride is not None else 1
+            sr, sc = stride if isinstance(stride, (tuple, list)) else (stride, stride)
+            if self.quiver_max_arrows is not None and n/(sr*sc) > self.quiver_max_arrows:
+                s  = int(np.ceil(np.sqrt(n/(sr*sc)/self.quiver_max_arrows)))
+                sr, sc = sr*s, sc*s
+
+            grid = (slice(None, None, sr), slice(None, None, sc))
+
+            self.thin_uv = lambda a: a[grid]
+            self.thin_xy = lambda x, y: (x[grid], y[grid]) if np.ndim(x) == 2 else (x[::sc], y[::sr])
+        else:
+            # Scattered vectors
+            i = np.arange(n)[::self.quiver_stride if self.quiver_stride is not None else 1]
+            if self.quiver_max_arrows is not None and i.size > self.quiver_max_arrows:
+                x, y = self.x.ravel()[i], self.y.ravel()[i]
+                # Keep the first vector in each cell of a grid of about quiver_max_arrows cells
+                k    = max(int(np.sqrt(self.quiver_max_arrows)), 1)
+                cx   = np.clip(((x - x.min())/max(np.ptp(x), np.finfo(float).tiny)*k).astype(int), 0, k - 1)
+                cy   = np.clip(((y - y.min())/max(np.ptp(y), np.finfo(float).tiny)*k).astype(int), 0, k - 1)
+                i    = i[np.sort(np.unique(cy*k + cx, return_index=True)[1])]
+
+            self.thin_uv = lambda a: a.ravel()[i] if np.ndim(a) else a
+            self.thin_xy = lambda x, y: (x.ravel()[i], y.ravel()[i])
 
 
 class streamline(plot):
@@ -873,10 +1344,11 @@ class streamline(plot):
     def __init__(self,
                  # Specifics
                  x=None, y=None, u=None, v=None, streamline_line_width=1, streamline_line_density=2, streamline_broken_streamlines=True,
+                 streamline_seeds=None, streamline_cache=True, streamline_workers=None,
                  # Specifics: color
                  color=None, cmap='RdBu_r', alpha=None, color_rule=None,
                  # Backend
-                 backend='Qt5Agg',
+                 backend='Qt5Agg', pyplot=True,
                  # Fonts
                  font_typeface=None, font_family='serif', font_math="dejavuserif", font_color="black", font_size_increase=0,
                  # Figure, axes
@@ -962,6 +1434,13 @@ class streamline(plot):
         :param streamline_line_width: Streamline width
         :param streamline_density: Measure of the amount of streamlines displayed. Low value (default=2)
         :param streamline_broken_streamlines: Whether to allow breaks in the streamlines
+        :param streamline_seeds: Starting points of the streamlines (N x 2). If provided, all are integrated at
+                                 once with vectorized Runge-Kutta steps, and **streamline_line_density** and
+                                 **streamline_broken_streamlines** are ignored
+        :param streamline_cache: Whether to reuse the trajectories computed for previous plots of the same field,
+                                 density and seeds (see ``streamlines.streamlines``), so that fields can be
+                                 drawn again with different styles without integrating them again
+        :param streamline_workers: Number of threads to integrate the **streamline_seeds** in, in batches
 
 
         Color:
@@ -979,11 +1458,16 @@ class streamline(plot):
                             ... stackoverflow
                         Plotting window freezes even if trying different backends with no backend error: python configuration problem
                             backend=None
+        :param pyplot:  Whether to use the Pyplot state machine. If False, the plot is drawn exclusively
+                        through its Figure and Axes on an Agg canvas, with no Pyplot figure management
+                        involved (the figure is not registered, and **backend** and **show** are ignored).
+                        Plots can then be drawn in parallel threads, and their figures are garbage
+                        collected as soon as they are no longer referenced
         """
 
-        # Turn all instance arguments to instance attributes
-        for item in inspect.signature(streamline).parameters:
-            setattr(self, item, eval(item))
+        # Parameter record: instance arguments, of which only those which
+        # differ from their defaults are stored
+        self.parameters = streamline.schema.bind(locals())
 
         # Ensure x and y are NumPy arrays
         self.x = ensure_ndarray(self.x) if self.x is not None else None
@@ -998,18 +1482,24 @@ class streamline(plot):
         # Color rule
         self.method_rule()
 
+        # Trajectories
+        self.trajectories = streamlines.streamlines(self.x, self.y, self.u, self.v,
+                                                    density=self.streamline_line_density,
+                                                    broken_streamlines=self.streamline_broken_streamlines,
+                                                    seeds=self.streamline_seeds,
+                                                    cached=self.streamline_cache,
+                                                    workers=self.streamline_workers)
+
         # Plot
-        self.graph = self.ax.streamplot(self.x, self.y, self.u, self.v,
-                                        color=self.color,
-                                        cmap=self.cmap,
-                                        linewidth=self.streamline_line_width,
-                                        density=self.streamline_line_density,
-                                        zorder=self.zorder,
-                                        broken_streamlines=self.streamline_broken_streamlines
-                                        ).lines
+        self.graph = streamlines.draw(self.ax, self.trajectories, self.x, self.y,
+                                      color=self.color,
+                                      cmap=self.cmap,
+                                      linewidth=self.streamline_line_width,
+                                      zorder=self.zorder)
         
     def mock(self):
         if isinstance(self.x, type(None)) and isinstance(self.y, type(None)):
+            from mpl_plotter.two_d.mock import diff_field
             self.x, self.y, self.u, self.v, self.color_rule = diff_field()
             
     def method_rule(self):
@@ -1027,7 +1517,7 @@ class fill_area(plot):
                  # Specifics: color
                  color=None, cmap='RdBu_r', alpha=None, color_rule=None,
                  # Backend
-                 backend='Qt5Agg',
+                 backend='Qt5Agg', pyplot=True,
                  # Fonts
                  font_typeface=None, font_family='serif', font_math="dejavuserif", font_color="black", font_size_increase=0,
                  # Figure, axes
@@ -1132,11 +1622,16 @@ class fill_area(plot):
                             ... stackoverflow
                         Plotting window freezes even if trying different backends with no backend error: python configuration problem
                             backend=None
+        :param pyplot:  Whether to use the Pyplot state machine. If False, the plot is drawn exclusively
+                        through its Figure and Axes on an Agg canvas, with no Pyplot figure management
+                        involved (the figure is not registered, and **backend** and **show** are ignored).
+                        Plots can then be drawn in parallel threads, and their figures are garbage
+                        collected as soon as they are no longer referenced
         """
 
-        # Turn all instance arguments to instance attributes
-        for item in inspect.signature(fill_area).parameters:
-            setattr(self, item, eval(item))
+        # Parameter record: instance arguments, of which only those which
+        # differ from their defaults are stored
+        self.parameters = fill_area.schema.bind(locals())
 
         # Ensure x and y are NumPy arrays
         self.x = ensure_ndarray(self.x) if self.x is not None else None
@@ -1155,43 +1650,47 @@ class fill_area(plot):
                 self.ax.fill_between(self.x, self.y, self.z, facecolor=self.color,
                                      alpha=self.alpha, label=self.plot_label)
             if self.fill_area_below:
-                self.ax.fill_between(self.x, self.i_below(), np.zeros(self.y.shape), facecolor=self.color,
+                x, c = envelope(self.x, self.y, self.z, np.minimum)
+                self.ax.fill_between(x, c, 0, where=~np.isnan(c), facecolor=self.color,
                                      alpha=self.alpha, label=self.plot_label)
             if self.fill_area_above:
-                self.ax.fill_between(self.x, self.i_above(), np.zeros(self.y.shape), facecolor=self.color,
+                x, c = envelope(self.x, self.y, self.z, np.maximum)
+                self.ax.fill_between(x, c, 0, where=~np.isnan(c), facecolor=self.color,
                                      alpha=self.alpha, label=self.plot_label)
             if not self.fill_area_between and not self.fill_area_below and not self.fill_area_above:
-                print_color('No area chosen to fill: specify whether to fill "between", "below" or "above" the curves',
-                            'grey')
+                print('No area chosen to fill: specify whether to fill "between", "below" or "above" the curves')
         else:
-            self.ax.fill_between(self.x, self.y, np.zeros(self.y.shape), facecolor=self.color, alpha=self.alpha)
+            self.ax.fill_between(self.x, self.y, 0, facecolor=self.color, alpha=self.alpha)
 
     def i_below(self):
         # Curve
-        c = np.zeros(self.y.shape, dtype=float)
-        for i in range(len(c)):
-            c[i] = self.y[i] if self.y[i] <= self.z[i] else self.z[i]
-        return c
+        return np.minimum(self.y, self.z)
 
     def i_above(self):
         # Curve
-        c = np.zeros(self.y.shape, dtype=float)
-        for i in range(len(c)):
-            c[i] = self.y[i] if self.y[i] >= self.z[i] else self.z[i]
-        return c
+        return np.maximum(self.y, self.z)
 
     def intersection(self):
-        return np.nonzero(np.absolute(self.y - self.z) == min(np.absolute(self.y - self.z)))[0]
+        d = np.absolute(self.y - self.z)
+        return np.nonzero(d == np.nanmin(d))[0]
+
+    def crossings(self):
+        """
+        Interpolated crossings of S and Z: index of the sample
+        preceding each crossing, and its abscissa and ordinate.
+        """
+        return crossings(self.x, self.y, self.z)
 
     def mock(self):
         if isinstance(self.x, type(None)) and isinstance(self.y, type(None)):
+            from mpl_plotter.two_d.mock import boltzmann
             self.x = np.arange(-6, 6, .01)
             self.y = boltzmann(self.x, 0, 1)
             self.z = 1 - boltzmann(self.x, 0.5, 1)
             line(x=self.x, y=self.y,
                  grid=False, resize_axes=False,
-                 ax=self.ax, fig=self.fig)
+                 ax=self.ax, fig=self.fig, pyplot=self.pyplot)
             line(x=self.x, y=self.z,
                  grid=False, resize_axes=False,
-                 ax=self.ax, fig=self.fig)
+                 ax=self.ax, fig=self.fig, pyplot=self.pyplot)
             self.fill_area_below = True
@@ -0,0 +1,360 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""
+Streamlines
+-----------
+
+Streamline trajectories of vector fields on uniform grids, computed once and
+cached by the contents of the field and the parameters of the integration,
+so that they can be drawn any number of times with different styles.
+
+Trajectories are seeded either by density, with Matplotlib's ``streamplot``
+algorithm, or from a set of seed points, which are integrated in batches with
+vectorized fourth order Runge-Kutta steps, optionally in parallel threads.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import matplotlib as mpl
+
+from matplotlib.lines import Line2D
+from matplotlib.patches import FancyArrowPatch
+from matplotlib.collections import LineCollection
+
+from mpl_plotter.utils import fingerprint, segments_view
+from mpl_plotter.two_d.fields import coordinates
+
+
+# Trajectories of the most recently drawn fields
+cache      = OrderedDict()
+cache_size = 32
+
+
+class trajectories:
+
+    def __init__(self, points, offsets):
+        """
+        Streamline trajectories
+        =======================
+
+        Trajectories are stored as a single array of points, in data coordinates,
+        trajectory *i* being ``points[offsets[i]:offsets[i+1]]``.
+
+        :param points:  Points of all trajectories
+        :param offsets: Index of the first point of each trajectory, and number of points
+
+        :type points:   np.ndarray
+        :type offsets:  np.ndarray
+        """
+        self.points  = points
+        self.offsets = offsets
+
+        for a in [self.points, self.offsets]:
+            a.flags.writeable = False
+
+        # Segments joining consecutive points of the same trajectory, by their first point
+        starts       = np.ones(len(points), dtype=bool)
+        starts[offsets[1:] - 1] = False
+        self.starts  = np.flatnonzero(starts)
+
+        # Arrow halfway along each trajectory
+        d            = np.hypot(*np.diff(points, axis=0).T)
+        self.arrows  = np.empty(len(offsets) - 1, dtype=int)
+        for i, (a, b) in enumerate(zip(offsets[:-1], offsets[1:])):
+            if b - a < 2:
+                self.arrows[i] = a
+                continue
+            s = np.cumsum(d[a:b - 1])
+            self.arrows[i] = a + min(np.searchsorted(s, s[-1] / 2.), b - a - 2)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.points[self.offsets[i]:self.offsets[i + 1]]
+
+    def segments(self):
+        """
+        :return: [np.ndarray] Segments of all trajectories.
+        """
+        return segments_view(self.points)[self.starts]
+
+
+def streamlines(x, y, u, v, density=1, broken_streamlines=True, seeds=None, cached=True, workers=None):
+    """
+    Return the streamline trajectories of a vector field on a uniform grid, computing
+    them only if those of the same field and parameters are not cached.
+
+    :param x:                  x coordinates: 1D, or a 2D ``np.meshgrid`` (xy indexing)
+    :param y:                  y coordinates: 1D, or a 2D ``np.meshgrid`` (xy indexing)
+    :param u:                  u
+    :param v:                  v
+    :param density:            Density of the streamlines, as in ``streamplot``. Ignored if **seeds** are provided
+    :param broken_streamlines: Whether streamlines may end when they come too close to others.
+                               Ignored if **seeds** are provided
+    :param seeds:              Starting points of the streamlines (N x 2), in data coordinates
+    :param cached:             Whether to use (and fill) the cache
+    :param workers:            Number of threads to integrate the **seeds** in
+
+    :type x:                   np.ndarray
+    :type y:                   np.ndarray
+    :type u:                   np.ndarray
+    :type v:                   np.ndarray
+    :type density:             float or tuple of float
+    :type broken_streamlines:  bool
+    :type seeds:               np.ndarray
+    :type cached:              bool
+    :type workers:             int
+
+    :return: ``trajectories``
+    """
+    seeds = np.asarray(seeds, dtype=float).reshape(-1, 2) if seeds is not None else None
+
+    key = fingerprint(x, y, u, v, seeds, density if seeds is None else None, broken_streamlines if seeds is None else None)
+
+    if cached and key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    if seeds is None:
+        t = seed_density(x, y, u, v, density, broken_streamlines)
+    else:
+        t = seed_points(x, y, u, v, seeds, workers=workers)
+
+    if cached:
+        cache[key] = t
+        while len(cache) > cache_size:
+            cache.popitem(last=False)
+
+    return t
+
+
+def seed_density(x, y, u, v, density=1, broken_streamlines=True):
+    """
+    Compute streamline trajectories with Matplotlib's ``streamplot``, on an
+    axes which is never drawn, and read them from the segments it returns.
+
+    :return: ``trajectories``
+    """
+    from matplotlib.figure import Figure
+
+    lines = Figure().add_subplot().streamplot(x, y, u, v, density=density,
+                                              broken_streamlines=broken_streamlines).lines
+
+    segments = np.asarray(lines.get_segments(), dtype=float).reshape(-1, 2, 2)
+
+    if len(segments) == 0:
+        return trajectories(np.empty((0, 2)), np.zeros(1, dtype=int))
+
+    # Trajectories are consecutive in the segments: a trajectory ends
+    # where a segment does not start at the end of the previous one
+    ends    = np.append(np.flatnonzero(np.any(segments[1:, 0] != segments[:-1, 1], axis=1)), len(segments) - 1)
+    points  = np.insert(segments[:, 0], ends + 1, segments[ends, 1], axis=0)
+    offsets = np.concatenate([[0], ends + 1 + np.arange(1, len(ends) + 1)])
+
+    return trajectories(points, offsets)
+
+
+def seed_points(x, y, u, v, seeds, maxlength=4.0, minlength=0.1, step=2, workers=None):
+    """
+    Integrate the streamlines passing through a set of seed points, forwards and backwards.
+
+    The streamlines of each batch of seeds are advanced at once with fourth order Runge-Kutta steps
+    along the normalized field, in the coordinates of the domain scaled to a unit square (as in
+    ``streamplot``), until they leave the domain, reach a point of null velocity, or a length of
+    **maxlength**. With **workers**, the seeds are split in as many batches, integrated in parallel
+    threads (NumPy releases the GIL in the array operations of each step).
+
+    :param x:         x coordinates: 1D, or a 2D ``np.meshgrid`` (xy indexing)
+    :param y:         y coordinates: 1D, or a 2D ``np.meshgrid`` (xy indexing)
+    :param u:         u
+    :param v:         v
+    :param seeds:     Starting points (N x 2), in data coordinates
+    :param maxlength: Maximum length of each streamline, in domain units
+    :param minlength: Minimum length of each streamline, in domain units. Shorter streamlines are discarded
+    :param step:      Integration step, in grid cells
+    :param workers:   Number of threads to integrate the seeds in. Default: a single batch, in this thread
+
+    :return: ``trajectories``
+    """
+    x, y = coordinates(x, y, np.shape(u))
+    u    = np.ma.filled(np.ma.asarray(u, dtype=float), np.nan)
+    v    = np.ma.filled(np.ma.asarray(v, dtype=float), np.nan)
+
+    ny, nx = u.shape
+    origin = np.array([x[0], y[0]])
+    size   = np.array([x[-1] - x[0], y[-1] - y[0]])
+
+    # Velocity in unit square coordinates
+    un = u / size[0]
+    vn = v / size[1]
+
+    def direction(p, sign):
+        gx = p[:, 0] * (nx - 1)
+        gy = p[:, 1] * (ny - 1)
+        d  = np.stack([interpolate(un, gx, gy), interpolate(vn, gx, gy)], axis=-1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return sign * d / np.hypot(d[:, 0], d[:, 1])[:, None]
+
+    h     = step / max(nx - 1, ny - 1, 1)
+    steps = int(np.ceil(maxlength / h))
+
+    p0 = (seeds - origin) / size
+    p0 = p0[np.all((p0 >= 0) & (p0 <= 1), axis=1)]
+
+    def integrate(p0):
+        """
+        Streamlines through a batch of seeds, in unit square coordinates, in order.
+        """
+        branches = []
+        for sign in [1, -1]:
+            path   = np.full((steps + 1,) + p0.shape, np.nan)
+            path[0] = p0
+            active = np.arange(len(p0))
+            for k in range(steps):
+                p  = path[k, active]
+                k1 = direction(p, sign)
+                k2 = direction(p + h/2*k1, sign)
+                k3 = direction(p + h/2*k2, sign)
+                k4 = direction(p + h*k3, sign)
+                q  = p + h/6*(k1 + 2*k2 + 2*k3 + k4)
+
+                inside = np.all(np.isfinite(q) & (q >= 0) & (q <= 1), axis=1)
+
+                path[k + 1, active[inside]] = q[inside]
+                active = active[inside]
+                if active.size == 0:
+                    break
+            branches.append(path[:k + 2])
+
+        forward, backward = branches
+        n_f = np.sum(~np.isnan(forward[:, :, 0]), axis=0)
+        n_b = np.sum(~np.isnan(backward[:, :, 0]), axis=0)
+
+        return [np.concatenate([backward[n_b[i] - 1:0:-1, i], forward[:n_f[i], i]])
+                for i in range(len(p0)) if (n_f[i] + n_b[i] - 2) * h >= minlength]
+
+    batches = [b for b in np.array_split(p0, workers if workers else 1) if len(b)]
+
+    if workers and len(batches) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            lines = [t for batch in pool.map(integrate, batches) for t in batch]
+    else:
+        lines = [t for batch in batches for t in integrate(batch)]
+
+    points  = [origin + t * size for t in lines]
+    offsets = np.concatenate([[0], np.cumsum([len(t) for t in lines], dtype=int)])
+
+    return trajectories(np.concatenate(points) if points else np.empty((0, 2)), offsets.astype(int))
+
+
+def interpolate(a, gx, gy):
+    """
+    Bilinear interpolation of a 2D array at grid coordinates, clipped to the array.
+
+    :param a:  Array
+    :param gx: Column coordinates
+    :param gy: Row coordinates
+
+    :return: np.ndarray
+    """
+    ny, nx = a.shape
+
+    gx = np.clip(gx, 0, nx - 1)
+    gy = np.clip(gy, 0, ny - 1)
+
+    i  = np.minimum(gx.astype(int), nx - 2) if nx > 1 else np.zeros(gx.shape, dtype=int)
+    j  = np.minimum(gy.astype(int), ny - 2) if ny > 1 else np.zeros(gy.shape, dtype=int)
+    tx = gx - i
+    ty = gy - j
+
+    i1 = np.minimum(i + 1, nx - 1)
+    j1 = np.minimum(j + 1, ny - 1)
+
+    return (a[j, i]  * (1 - tx) + a[j, i1]  * tx) * (1 - ty) + \
+           (a[j1, i] * (1 - tx) + a[j1, i1] * tx) * ty
+
+
+def draw(ax, t, x, y, color=None, cmap=None, norm=None, linewidth=None, zorder=None, arrowsize=1, arrowstyle='-|>'):
+    """
+    Draw a set of trajectories as ``streamplot`` does: as a single line collection,
+    colored and sized by the values of **color** and **linewidth** along them if these are
+    arrays on the grid of the field, with an arrow halfway along each trajectory.
+
+    :param ax:         Axes
+    :param t:          Trajectories
+    :param x:          x coordinates of the field: 1D, or a 2D ``np.meshgrid`` (xy indexing)
+    :param y:          y coordinates of the field: 1D, or a 2D ``np.meshgrid`` (xy indexing)
+    :param color:      Color, or array of values on the grid of the field, mapped to the colormap
+    :param cmap:       Colormap
+    :param norm:       Norm. Default: the range of **color**
+    :param linewidth:  Line width, or array of line widths on the grid of the field
+    :param zorder:     zorder
+    :param arrowsize:  Arrow size
+    :param arrowstyle: Arrow style
+
+    :return: ``matplotlib.collections.LineCollection``
+    """
+    zorder    = zorder if zorder is not None else Line2D.zorder
+    # First color of the property cycle
+    color     = color if color is not None else 'C0'
+    linewidth = linewidth if linewidth is not None else mpl.rcParams['lines.linewidth']
+
+    multicolor = isinstance(color, np.ndarray)
+
+    # Grid coordinates of the first point of each segment, for the values of fields along the trajectories
+    if multicolor or isinstance(linewidth, np.ndarray):
+        shape = (color if multicolor else linewidth).shape
+        xc, yc = coordinates(x, y, shape)
+        p      = t.points[t.starts]
+        gx     = (p[:, 0] - xc[0]) / (xc[-1] - xc[0]) * (shape[1] - 1)
+        gy     = (p[:, 1] - yc[0]) / (yc[-1] - yc[0]) * (shape[0] - 1)
+
+    line_kw  = {'zorder': zorder}
+    arrow_kw = {'zorder': zorder, 'arrowstyle': arrowstyle, 'mutation_scale': 10 * arrowsize}
+
+    # Index of the segment of each arrow
+    arrows = np.searchsorted(t.starts, t.arrows)
+
+    if isinstance(linewidth, np.ndarray):
+        widths = interpolate(linewidth, gx, gy)
+        line_kw['linewidth'] = widths
+    else:
+        line_kw['linewidth'] = arrow_kw['linewidth'] = linewidth
+
+    if multicolor:
+        values = interpolate(color, gx, gy)
+        norm   = norm if norm is not None else mpl.colors.Normalize(color.min(), color.max())
+        cmap   = mpl.colormaps[cmap] if isinstance(cmap, str) else cmap
+    else:
+        line_kw['color'] = arrow_kw['color'] = color
+
+    lc = LineCollection(t.segments(), **line_kw)
+    if len(t):
+        xs, ys = t.points.T
+        lc.sticky_edges.x[:] = [xs.min(), xs.max()]
+        lc.sticky_edges.y[:] = [ys.min(), ys.max()]
+    if multicolor:
+        lc.set_array(values)
+        lc.set_cmap(cmap)
+        lc.set_norm(norm)
+    ax.add_collection(lc)
+
+    for i, s in enumerate(arrows):
+        a = t.arrows[i]
+        if s >= len(t.starts) or t.starts[s] != a:
+            # Single point trajectory
+            continue
+        if isinstance(linewidth, np.ndarray):
+            arrow_kw['linewidth'] = widths[s]
+        if multicolor:
+            arrow_kw['color'] = cmap(norm(values[s]))
+        ax.add_patch(FancyArrowPatch(tuple(t.points[a]), tuple(t.points[a:a + 2].mean(axis=0)),
+                                                 transform=ax.transData, **arrow_kw))
+
+    ax.autoscale_view()
+
+    return lc
@@ -1,7 +1,13 @@
 import os
+import sys
+import hashlib
+import inspect
 
 from sys import platform
 from pathlib import Path
+from types import ModuleType
+from functools import lru_cache, wraps
+from importlib import import_module
 
 import numpy as np
 
@@ -18,6 +24,87 @@ def tmp():
     return tmp
 
 
+def lazy(package, exports):
+    """
+    Make a package import the objects it exports from their modules only when
+    they are first accessed. To be called in the ``__init__`` of the package.
+
+    Importing a module binds it to its package under its own name. Exported
+    objects sharing their name with their module (eg: ``comparison``) are
+    kept bound to the package instead.
+
+    :param package: Package name
+    :param exports: Module of each object exported by the package
+
+    :type package:  str
+    :type exports:  dict
+    """
+    module = sys.modules[package]
+
+    class lazy_package(type(module)):
+
+        def __getattr__(self, name):
+            if name not in exports:
+                raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+            import_module(exports[name])
+
+            for key, source in exports.items():
+                # Modules still being imported may not define their objects yet
+                if source in sys.modules and hasattr(sys.modules[source], key):
+                    self.__dict__[key] = getattr(sys.modules[source], key)
+
+            return self.__dict__[name]
+
+        def __setattr__(self, name, value):
+            if name in exports and isinstance(value, ModuleType):
+                return
+            super().__setattr__(name, value)
+
+        def __dir__(self):
+            return sorted(set(self.__dict__) | set(exports))
+
+    module.__class__ = lazy_package
+
+
+# Placeholder data generators by name
+placeholders = {}
+
+
+def placeholder(f):
+    """
+    Register a placeholder data generator, memoizing it: calls with the same
+    arguments (eg: resolution) return the same arrays, computed only once,
+    however the arguments are passed (positionally, by keyword or by default).
+    As they are shared, the arrays are read-only.
+
+    :param f: Generator of an array or tuple of arrays, of hashable arguments
+
+    :return: function
+    """
+    signature = inspect.signature(f)
+
+    @lru_cache(maxsize=32)
+    def memoized(*args, **kwargs):
+        data = f(*args, **kwargs)
+        for a in (data if isinstance(data, tuple) else (data,)):
+            a.setflags(write=False)
+        return data
+
+    @wraps(f)
+    def generator(*args, **kwargs):
+        # Calls are cached by the values of all arguments of the generator
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return memoized(*bound.args, **bound.kwargs)
+
+    generator.cache_clear = memoized.cache_clear
+    generator.cache_info  = memoized.cache_info
+    placeholders[f.__name__] = generator
+
+    return generator
+
+
 def ensure_ndarray(a):
     """
     Return _a_ if it is a NumPy array, or else return _a_
@@ -48,11 +135,11 @@ def span(a):
 def bounds(d, u, l, up, lp, v):
         # Upper and lower bounds
         if isinstance(u, type(None)):
-            u = d.max()
+            u = np.nanmax(d)
         else:
             up = 0
         if isinstance(l, type(None)):
-            l = d.min()
+            l = np.nanmin(d)
         else:
             lp = 0
         # Bounds vector
@@ -63,3 +150,429 @@ def bounds(d, u, l, up, lp, v):
         if isinstance(v[1], type(None)):
             v[1] = u
         return v, up, lp
+
+
+def crossings(x, y, z):
+    """
+    Find the points at which two curves sampled at the same
+    abscissae cross, linearly interpolated between samples.
+
+    Samples at which either curve is NaN are never part of a crossing,
+    and samples at which both curves are equal are not reported,
+    as they already are points of both curves.
+
+    :param x: Abscissae
+    :param y: Curve 1
+    :param z: Curve 2
+
+    :type x: np.ndarray
+    :type y: np.ndarray
+    :type z: np.ndarray
+
+    :return: [np.ndarray, np.ndarray, np.ndarray] Index of the sample
+             preceding each crossing, and abscissae and ordinates of the crossings.
+    """
+    d = y - z
+
+    # Change of sign between consecutive samples (False if either is NaN)
+    i = np.nonzero(d[:-1] * d[1:] < 0)[0]
+
+    t = d[i] / (d[i] - d[i + 1])
+
+    return i, x[i] + t * (x[i + 1] - x[i]), y[i] + t * (y[i + 1] - y[i])
+
+
+def envelope(x, y, z, op=np.minimum):
+    """
+    Find the lower (``op=np.minimum``) or upper (``op=np.maximum``)
+    envelope of two curves sampled at the same abscissae, including
+    the points at which they cross.
+
+    The envelope is NaN wherever either curve is.
+
+    :param x:  Abscissae
+    :param y:  Curve 1
+    :param z:  Curve 2
+    :param op: Element-wise NumPy function choosing the envelope
+
+    :type x:  np.ndarray
+    :type y:  np.ndarray
+    :type z:  np.ndarray
+    :type op: np.ufunc
+
+    :return: [np.ndarray, np.ndarray] Abscissae and ordinates of the envelope.
+    """
+    i, xc, yc = crossings(x, y, z)
+
+    e = op(y, z)
+
+    # Integer curves may cross between integers
+    x = x.astype(np.result_type(x, xc), copy=False)
+    e = e.astype(np.result_type(e, yc), copy=False)
+
+    return np.insert(x, i + 1, xc), np.insert(e, i + 1, yc)
+
+
+def decimate(x, y, n):
+    """
+    Find the indices of the samples of a curve needed to draw it
+    with *n* columns (eg: pixels) without altering its envelope.
+
+    The span of the abscissae, which must be monotonic, is split in
+    *n* columns of equal width, and of the samples in each column the
+    first, last, lowest and highest are kept, as well as the first NaN,
+    so that gaps in the curve are preserved.
+
+    :param x: Abscissae
+    :param y: Curve
+    :param n: Number of columns
+
+    :type x: np.ndarray
+    :type y: np.ndarray
+    :type n: int
+
+    :return: [np.ndarray] Sorted indices of the samples to keep.
+    """
+    N = len(y)
+
+    # At most 5 samples are kept per column
+    if N <= 5 * max(n, 1):
+        return np.arange(N)
+
+    x = x if x[0] <= x[-1] else -x
+
+    # First sample of each column holding any
+    edges  = np.linspace(x[0], x[-1], n + 1)[1:-1]
+    starts = np.unique(np.concatenate([[0], np.searchsorted(x, edges)]))
+    starts = starts[starts < N]
+    ends   = np.append(starts[1:], N) - 1
+    column = np.repeat(np.arange(starts.size), np.diff(np.append(starts, N)))
+
+    def first(mask):
+        # First sample of each column for which mask is True
+        i = np.flatnonzero(mask)
+        c = column[i]
+        return i[np.concatenate([c[:1] == c[:1], c[1:] != c[:-1]])]
+
+    nan = np.isnan(y)
+    lo  = np.where(nan, np.inf, y)
+    hi  = np.where(nan, -np.inf, y)
+
+    lo = first(lo == np.minimum.reduceat(lo, starts)[column])
+    hi = first(hi == np.maximum.reduceat(hi, starts)[column])
+
+    return np.unique(np.concatenate([starts, ends, lo, hi, first(nan)]))
+
+
+def segments_view(points):
+    """
+    Return the segments joining consecutive points of a curve as a
+    read-only (N-1) x 2 x 2 view of its N x 2 points array.
+
+    :param points: Points of the curve
+
+    :type points: np.ndarray
+
+    :return: [np.ndarray] Segments.
+    """
+    points = np.ascontiguousarray(points)
+    return np.lib.stride_tricks.as_strided(points,
+                                           shape=(max(len(points) - 1, 0), 2, 2),
+                                           strides=(points.strides[0],) + points.strides,
+                                           writeable=False)
+
+
+def polylines(points, c, norm, n):
+    """
+    Merge the consecutive segments of a color-ruled curve which fall in
+    the same of the *n* colors of a colormap into polylines.
+
+    As in a Matplotlib ``LineCollection``, segment *i* is colored by *c[i]*.
+
+    :param points: Points of the curve
+    :param c:      Values used for colormapping
+    :param norm:   Norm mapping the values to the colormap
+    :param n:      Number of colors of the colormap
+
+    :type points: np.ndarray
+    :type c:      np.ndarray
+    :type norm:   matplotlib.colors.Normalize
+    :type n:      int
+
+    :return: [list of np.ndarray, np.ndarray] Polylines (views of *points*),
+             and the value used to color each.
+    """
+    v = np.ma.filled(np.ma.asarray(norm(c[:len(points) - 1]), dtype=float), np.nan)
+
+    # Colormap index of each segment (see matplotlib.colors.Colormap.__call__),
+    # with under, over and invalid values in bins of their own
+    q = np.floor(v * n)
+    q[v == 1] = n - 1
+    q = np.clip(q, -1, n)
+    q[np.isnan(v)] = -2
+
+    start = np.concatenate([[0], np.flatnonzero(q[1:] != q[:-1]) + 1]) if q.size else np.empty(0, dtype=int)
+    end   = np.append(start[1:], q.size)
+
+    return [points[s:e + 1] for s, e in zip(start, end)], c[start]
+
+
+def grid_edges(x, y, shape):
+    """
+    Return the cell edges of a rectilinear grid, or None if the grid is not rectilinear.
+
+    The grid may be given by 1D coordinates or by 2D ``np.meshgrid`` (xy indexing)
+    arrays, of either the cell centers or the cell edges of an array of the given
+    shape. As in ``pcolormesh(shading='auto')``, the edges of cells given by their
+    centers lie halfway between them.
+
+    :param x:     x coordinates
+    :param y:     y coordinates
+    :param shape: Shape of the array on the grid (rows, columns)
+
+    :type x:      np.ndarray
+    :type y:      np.ndarray
+    :type shape:  tuple
+
+    :return: [tuple of np.ndarray] x and y edges, monotonic, of lengths columns + 1 and rows + 1.
+    """
+
+    def edges(c, n):
+        if c.size == n + 1:
+            e = c.astype(float)
+        elif c.size == n and n > 1:
+            m = (c[1:] + c[:-1]) / 2
+            e = np.concatenate([[2*c[0] - m[0]], m, [2*c[-1] - m[-1]]])
+        else:
+            return None
+        d = np.diff(e)
+        return e if np.all(d > 0) or np.all(d < 0) else None
+
+    if x.ndim == 2 and y.ndim == 2:
+        # Meshgrid: all rows of x and all columns of y must be equal
+        if x.shape != y.shape or np.any(x != x[:1]) or np.any(y != y[:, :1]):
+            return None
+        x, y = x[0], y[:, 0]
+    elif x.ndim != 1 or y.ndim != 1:
+        return None
+
+    xe, ye = edges(x, shape[1]), edges(y, shape[0])
+
+    return (xe, ye) if xe is not None and ye is not None else None
+
+
+def uniform(edges, rtol=1e-6):
+    """
+    :return: [bool] Whether a set of edges is uniformly spaced.
+    """
+    d = np.diff(edges)
+    return bool(np.allclose(d, d[0], rtol=rtol, atol=0))
+
+
+def fit_legend(legend, pad=0.01):
+    """
+    Shift a figure legend so that it lies within its figure.
+
+    The legend is laid out with the figure's renderer, which measures its
+    text without drawing the figure, and is then moved by the distance
+    by which it overflows the figure, if any.
+
+    :param legend: Figure legend
+    :param pad:    Minimum distance from the legend to the edges of the figure, in figure coordinates
+
+    :type legend:  matplotlib.legend.Legend
+    :type pad:     float
+
+    :return: [bool] Whether the legend was moved.
+    """
+    fig    = legend.figure
+    to_fig = fig.transFigure.inverted()
+
+    extent = legend.get_window_extent().transformed(to_fig)
+
+    dx = max(pad - extent.x0, 0) or min(1 - pad - extent.x1, 0)
+    dy = max(pad - extent.y0, 0) or min(1 - pad - extent.y1, 0)
+
+    if dx == 0 and dy == 0:
+        return False
+
+    # Translate the box the legend is anchored to
+    anchor = legend.get_bbox_to_anchor().transformed(to_fig)
+    legend.set_bbox_to_anchor(anchor.translated(dx, dy), transform=fig.transFigure)
+
+    return True
+
+
+class ring:
+
+    def __init__(self, capacity=None, columns=1):
+        """
+        Ring buffer
+        ===========
+
+        Buffer of rows of float data holding the last *capacity* rows
+        appended to it. Every row is written twice, *capacity* rows apart,
+        so that the contents of the buffer are always available as a
+        contiguous view, in order, without copying them.
+
+        The lowest and highest value of each column are kept track of as
+        rows are appended, and are only searched for again when a row holding
+        either of them is overwritten.
+
+        :param capacity: Number of rows held. If None, the capacity of the
+                         buffer is doubled whenever it is full, so no rows
+                         are discarded
+        :param columns:  Number of columns
+
+        :type capacity:  int
+        :type columns:   int
+        """
+        self.growing  = capacity is None
+        self.capacity = capacity if capacity is not None else 1024
+        self.columns  = columns
+
+        self._data    = np.empty((2 * self.capacity, columns))
+        self._start   = 0
+        self._size    = 0
+
+        self._lower   = np.full(columns, np.inf)
+        self._upper   = np.full(columns, -np.inf)
+        self._stale   = False
+
+    def __len__(self):
+        return self._size
+
+    def view(self):
+        """
+        :return: [np.ndarray] Read-only view of the rows in the buffer, oldest first.
+        """
+        view = self._data[self._start:self._start + self._size]
+        view.flags.writeable = False
+        return view
+
+    def extend(self, rows):
+        """
+        Append rows to the buffer, discarding the oldest if it is full.
+
+        :param rows: Rows
+
+        :type rows: np.ndarray
+        """
+        rows = np.asarray(rows, dtype=float).reshape(-1, self.columns)
+
+        if self.growing and self._size + len(rows) > self.capacity:
+            self._grow(self._size + len(rows))
+
+        rows = rows[-self.capacity:]
+        n    = len(rows)
+
+        # Overwritten rows
+        evicted = self.view()[:max(self._size + n - self.capacity, 0)]
+        if len(evicted) and (np.any(evicted <= self._lower) or np.any(evicted >= self._upper)):
+            self._stale = True
+
+        i = (self._start + self._size + np.arange(n)) % self.capacity
+        self._data[i]                 = rows
+        self._data[i + self.capacity] = rows
+
+        self._start = (self._start + len(evicted)) % self.capacity
+        self._size  = self._size + n - len(evicted)
+
+        if not self._stale and n:
+            self._lower = np.fmin(self._lower, np.fmin.reduce(rows, axis=0))
+            self._upper = np.fmax(self._upper, np.fmax.reduce(rows, axis=0))
+
+    def extent(self, column=0):
+        """
+        :return: [np.ndarray] Lowest and highest value of a column, ignoring NaN.
+        """
+        if self._stale:
+            view = self.view()
+            self._lower = np.fmin.reduce(view, axis=0)
+            self._upper = np.fmax.reduce(view, axis=0)
+            self._stale = False
+        return np.array([self._lower[column], self._upper[column]])
+
+    def _grow(self, size):
+        view = self.view().copy()
+
+        self.capacity = max(2 * self.capacity, size)
+        self._data    = np.empty((2 * self.capacity, self.columns))
+
+        self._data[:len(view)]                                = view
+        self._data[self.capacity:self.capacity + len(view)]   = view
+        self._start   = 0
+
+
+def fingerprint(*objects):
+    """
+    Return a hash of the contents of a set of arrays and other objects,
+    such as parameters. Arrays are hashed by their data type, shape and
+    data, and other objects by their representation.
+
+    :param objects: Arrays and other objects
+
+    :return: [str] Hexadecimal digest.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for o in objects:
+        if isinstance(o, np.ndarray):
+            h.update(f'{o.dtype.str}{o.shape}'.encode())
+            h.update(np.ascontiguousarray(o).data)
+        else:
+            h.update(repr(o).encode())
+        h.update(b'|')
+    return h.hexdigest()
+
+
+def lod(z, budget, method='stride'):
+    """
+    Choose the rows and columns of a grid to be kept so that it has at most
+    *budget* cells, keeping the aspect ratio of the grid and its edges.
+
+    With 'stride', rows and columns are kept at a uniform stride. With 'curvature',
+    they are distributed according to the curvature of *z* across them (its second
+    differences), so that detail is kept where the surface bends, while flat regions
+    are still sampled at no less than half the density of a uniform stride.
+
+    :param z:      Values on the grid
+    :param budget: Maximum number of cells
+    :param method: 'stride' or 'curvature'
+
+    :type z:       np.ndarray
+    :type budget:  int
+    :type method:  str
+
+    :return: [tuple of np.ndarray] Indices of the rows and columns kept.
+    """
+    assert method in ['stride', 'curvature'], "The level of detail method must be either 'stride' or 'curvature'."
+
+    rows, cols = z.shape
+
+    cells = (rows - 1) * (cols - 1)
+    if cells <= budget:
+        return np.arange(rows), np.arange(cols)
+
+    s  = np.sqrt(cells / budget)
+    nr = max(int((rows - 1) / s), 1) + 1
+    nc = max(int((cols - 1) / s), 1) + 1
+
+    if method == 'stride':
+        return np.unique(np.linspace(0, rows - 1, nr).round().astype(int)), \
+               np.unique(np.linspace(0, cols - 1, nc).round().astype(int))
+
+    def distribute(w, n):
+        # Inverse of the cumulative weight, with a uniform floor
+        w = np.nan_to_num(w) + np.nanmean(w) + np.finfo(float).tiny
+        c = np.concatenate([[0], np.cumsum((w[1:] + w[:-1]) / 2)])
+        i = np.searchsorted(c, np.linspace(0, c[-1], n)).clip(0, len(w) - 1)
+        return np.unique(np.concatenate([[0], i, [len(w) - 1]]))
+
+    wr = np.zeros(rows)
+    wc = np.zeros(cols)
+    if rows > 2:
+        wr[1:-1] = np.nansum(np.abs(np.diff(z, n=2, axis=0)), axis=1)
+    if cols > 2:
+        wc[1:-1] = np.nansum(np.abs(np.diff(z, n=2, axis=1)), axis=0)
+
+    return distribute(wr, nr), distribute(wc, nc)
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import io
+import unittest
+
+import numpy as np
+
+from mpl_plotter.two_d import line, scatter, heatmap, quiver
+from mpl_plotter.three_d import surface
+from mpl_plotter.animation import animation
+
+
+def redrawn(plot):
+    plot.fig.canvas.draw()
+    return np.asarray(plot.fig.canvas.buffer_rgba()).astype(int)
+
+
+class TestAnimation(unittest.TestCase):
+
+    def test_frames(self):
+        x    = np.linspace(0, 2*np.pi, 500)
+        plot = line(x=x, y=np.sin(x), bounds_y=[-1.5, 1.5], pyplot=False)
+
+        anim   = animation(plot, lambda i: {'y': np.sin(x + i/10)}, n=50)
+        buffer = io.BytesIO()
+
+        assert anim.save(pipe=buffer) == 50
+
+        w, h   = anim.size()
+        frames = np.frombuffer(buffer.getvalue(), np.uint8).reshape(50, h, w, 4)
+
+        # Blitted frames match a full redraw of the figure
+        assert np.abs(frames[-1] - redrawn(plot)).mean() < 0.01
+        assert np.any(frames[0] != frames[-1])
+
+    def test_plotters(self):
+        z = np.random.rand(20, 20)
+
+        for plot, frame in [(scatter(pyplot=False),  {'x': np.random.rand(50), 'y': np.random.rand(50)}),
+                            (heatmap(x=np.arange(20), y=np.arange(20), z=z, pyplot=False), {'z': z.T}),
+                            (quiver(pyplot=False),   {'u': np.random.rand(100), 'v': np.random.rand(100)}),
+                            (surface(pyplot=False),  {'z': surface(pyplot=False).z[::-1]})]:
+            buffer = io.BytesIO()
+            animation(plot, [frame]).save(pipe=buffer)
+
+            w, h  = plot.fig.canvas.get_width_height(physical=True)
+            frame = np.frombuffer(buffer.getvalue(), np.uint8).reshape(h, w, 4)
+
+            # The artist is drawn over the background, grid lines included
+            assert np.abs(frame - redrawn(plot)).mean() < 1
+
+    def test_command(self):
+        anim    = animation(line(pyplot=False), [], fps=60)
+        command = anim.command('out.mp4', bitrate=2000)
+
+        assert command[-1] == 'out.mp4'
+        assert command[command.index('-s') + 1] == '{}x{}'.format(*anim.size())
+        assert '-b:v' in command
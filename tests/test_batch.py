@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import os
+import unittest
+import tempfile
+
+import numpy as np
+
+from mpl_plotter.batch import render
+from mpl_plotter.two_d import line, scatter, heatmap, comparison
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_render(self):
+
+        x = np.linspace(0, 2*np.pi, 100)
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            jobs = [
+                (line,       {'x': x, 'y': np.sin(x)},                      os.path.join(tmp, 'line.png')),
+                (scatter,    {'x': x, 'y': np.cos(x), 'color_rule': x},     os.path.join(tmp, 'scatter.png')),
+                (heatmap,    {},                                            os.path.join(tmp, 'heatmap.png')),
+                (comparison, {'x': x, 'y': [np.sin(x), np.cos(x)]},         os.path.join(tmp, 'comparison.png')),
+                (line,       {'x': x, 'y': np.sin(x), 'not_an_arg': True},  os.path.join(tmp, 'failure.png')),
+            ]
+
+            results = sorted(render(jobs, workers=2), key=lambda r: r.index)
+
+            assert [r.index for r in results] == list(range(len(jobs)))
+
+            for r in results[:-1]:
+                assert r.error is None, r.error
+                assert os.path.getsize(r.filename) > 0
+
+            assert 'not_an_arg' in results[-1].error
+            assert not os.path.exists(results[-1].filename)
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import os
+import json
+import tempfile
+import unittest
+
+from benchmarks import run
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_measure(self):
+        result = run.measure('line', 'small', repeat=1)
+        assert set(result) == set(run.phases) | {'peak'}
+        assert all(result[phase] > 0 for phase in run.phases) and result['peak'] > 0
+
+        # Compositions are timed as a whole
+        assert set(run.measure('panes', 'small', repeat=1)) == {'construct', 'savefig', 'peak'}
+
+    def test_compare(self):
+        baseline = {'line': {'small': {'main': 0.1, 'peak': 1000}}}
+
+        assert run.compare({'line': {'small': {'main': 0.11, 'peak': 1100}}}, baseline) == []
+        assert len(run.compare({'line': {'small': {'main': 0.2, 'peak': 2000}}}, baseline)) == 2
+        # Cases without a baseline are not compared
+        assert run.compare({'heatmap': {'small': {'main': 1.0}}}, baseline) == []
+
+    def test_baseline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = os.path.join(tmp, 'baseline.json')
+            args     = ['--cases', 'scatter', '--sizes', 'small', '--repeat', '1', '--baseline', baseline]
+
+            # Results of other environments are never compared against
+            with open(baseline, 'w') as f:
+                json.dump({'elsewhere': {'scatter': {'small': {'main': 0, 'peak': 0}}}}, f)
+            assert run.main(args) == 0
+
+            assert run.main(args + ['--save']) == 0
+            with open(baseline) as f:
+                baselines = json.load(f)
+                assert set(baselines) == {'elsewhere', run.environment()}
+                assert set(baselines[run.environment()]['scatter']['small']) == set(run.phases) | {'peak'}
+
+            # Far above any noise
+            assert run.main(args + ['--threshold', '100']) == 0
@@ -3,6 +3,7 @@
 
 import unittest
 import numpy as np
+import matplotlib.pyplot as plt
 
 from mpl_plotter.two_d import comparison, line, scatter
 
@@ -97,3 +98,51 @@ class TestsPlotters(unittest.TestCase):
                    show=show, backend=backend,
                    aspect=1
                    )
+
+
+class TestsLegend(unittest.TestCase):
+
+    def test_legend_fit(self):
+
+        fig = comparison(x, [u, v, w],
+                         plot_labels=["A rather long label for a curve", "cos", "tan"],
+                         pyplot=False)
+
+        extent = fig.legends[-1].get_window_extent().transformed(fig.transFigure.inverted())
+
+        assert extent.x0 >= 0 and extent.x1 <= 1
+        assert extent.y0 >= 0 and extent.y1 <= 1
+
+
+class TestsBulk(unittest.TestCase):
+
+    def setUp(self):
+        # Draw on a figure of its own, rather than on the axes left open by earlier tests
+        plt.close('all')
+
+    def test_bulk(self):
+
+        t = np.linspace(0, 1, 100)
+        curves = [np.sin(2*np.pi*k*t) for k in range(500)]
+
+        fig = comparison(t, curves, bulk=True, pyplot=False)
+
+        ax = fig.axes[0]
+        assert len(ax.collections) == 1
+        assert len(ax.collections[0].get_segments()) == 500
+
+    def test_bulk_labels(self):
+
+        comparison([x, x[:25], x],
+                   [u, v[:25], w],
+                   bulk=True,
+                   plot_labels=["sin", "cos", "tan"],
+                   line_widths=[1, 2, 3],
+                   alphas=[0.5, 0.5, 1],
+                   show=show, backend=backend,
+                   )
+
+    def test_bulk_unsupported(self):
+
+        with self.assertRaises(ValueError):
+            comparison(x, [u, v], bulk=True, zorders=[1, 2], pyplot=False)
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from mpl_plotter.two_d import fill_area
+from mpl_plotter.utils import crossings, envelope
+
+from tests.setup import show, backend
+
+
+class TestFillArea(unittest.TestCase):
+
+    def setUp(self):
+        # Draw on a figure of its own, rather than on the axes left open by earlier tests
+        plt.close('all')
+
+    def test_crossings(self):
+        x = np.arange(6)
+        y = np.array([0, 2, 0, 2, np.nan, 0])
+        z = np.ones(6)
+
+        i, xc, yc = crossings(x, y, z)
+
+        np.testing.assert_array_equal(i,  [0, 1, 2])
+        np.testing.assert_allclose(xc, [0.5, 1.5, 2.5])
+        np.testing.assert_allclose(yc, [1, 1, 1])
+
+    def test_envelope(self):
+        x = np.linspace(0, 4*np.pi, 1000)
+        y = np.sin(x)
+        z = np.cos(x)
+
+        xe, below = envelope(x, y, z, np.minimum)
+        _,  above = envelope(x, y, z, np.maximum)
+
+        assert np.all(np.diff(xe) > 0)
+        assert len(xe) == len(x) + 4
+        np.testing.assert_allclose(below, np.minimum(np.sin(xe), np.cos(xe)), atol=1e-4)
+        np.testing.assert_allclose(above, np.maximum(np.sin(xe), np.cos(xe)), atol=1e-4)
+
+    def test_fill(self):
+        x = np.linspace(0, 4*np.pi, 1000)
+        y = np.sin(x)
+        z = np.cos(x)
+        y[400:450] = np.nan
+
+        fill_area(x=x, y=y, z=z, fill_area_below=True, fill_area_above=True,
+                  show=show, backend=backend)
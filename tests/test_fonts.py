@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+from matplotlib import font_manager
+
+from mpl_plotter import get_available_fonts
+from mpl_plotter.fonts import font_registry, font_available, font, typesetting
+
+from tests.setup import show, backend
+
+
+class TestFontRegistry(unittest.TestCase):
+
+    def test_registry_cached(self):
+        assert font_registry() is font_registry()
+
+    def test_registry_contents(self):
+        assert set(get_available_fonts(True)) == set(font_manager.get_font_names())
+
+    def test_lookup(self):
+        assert font_available('DejaVu Serif')
+        assert font('dejavu serif') == 'DejaVu Serif'
+        assert font('serif') == 'serif'
+        assert font('Not A Typeface', 'DejaVu Serif') == 'DejaVu Serif'
+        assert font(None, 'DejaVu Serif') == 'DejaVu Serif'
+
+
+class TestTypesetting(unittest.TestCase):
+
+    def setUp(self):
+        # Draw on a figure of its own, rather than on the axes left open by earlier tests
+        plt.close('all')
+
+    def test_idempotent(self):
+        config = typesetting(typeface='DejaVu Sans')
+        config.apply()
+        serif = list(mpl.rcParams['font.serif'])
+        assert config.changes() == {}
+        assert config.apply() == {}
+        assert mpl.rcParams['font.serif'] == serif
+
+    def test_scoped(self):
+        typesetting().apply()
+        before = dict(mpl.rcParams)
+        with typesetting(family='monospace', color='red') as config:
+            assert mpl.rcParams['font.family'] == ['monospace']
+            assert mpl.rcParams['text.color'] == 'red'
+            assert config.typeface == 'Bitstream Vera Sans Mono'
+        assert dict(mpl.rcParams) == before
+
+    def test_plots(self):
+        from mpl_plotter.two_d import line
+
+        for _ in range(3):
+            line(font_typeface='DejaVu Sans', show=show, backend=backend)
+        assert mpl.rcParams['font.serif'] == ['DejaVu Sans', 'DejaVu Serif', 'Latin Modern Roman']
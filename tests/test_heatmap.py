@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import gc
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from mpl_plotter.two_d import heatmap, contour
+from mpl_plotter.two_d import fields
+from mpl_plotter.two_d.fields import load, block_reduce, pyramid
+from mpl_plotter.utils import grid_edges
+
+
+def render(plot):
+    plot.fig.canvas.draw()
+    return np.asarray(plot.fig.canvas.buffer_rgba()).astype(int)
+
+
+class TestRenderer(unittest.TestCase):
+
+    def test_edges(self):
+        x, y = np.meshgrid(np.linspace(0, 1, 11), np.linspace(0, 2, 5))
+
+        xe, ye = grid_edges(x, y, x.shape)
+        np.testing.assert_allclose(xe, np.linspace(-0.05, 1.05, 12))
+        np.testing.assert_allclose(ye, np.linspace(-0.25, 2.25, 6))
+
+        # Edges
+        assert grid_edges(np.arange(12), np.arange(6), (5, 11)) is not None
+        # Curvilinear grid
+        assert grid_edges(x + y, y, x.shape) is None
+
+    def test_renderers(self):
+        z = np.sin(np.linspace(0, 3, 50)) * np.cos(np.linspace(0, 3, 40))[:, None]
+
+        for x, y, graph in [(np.linspace(0, 1, 50),   np.linspace(0, 2, 40), 'AxesImage'),
+                            (np.geomspace(1, 10, 50), np.linspace(0, 2, 40), 'PcolorImage')]:
+            image = heatmap(x=x, y=y, z=z, heatmap_renderer='image', pyplot=False)
+            mesh  = heatmap(x=x, y=y, z=z, heatmap_renderer='mesh', pyplot=False)
+
+            assert type(image.graph).__name__ == graph
+            assert type(mesh.graph).__name__  == 'QuadMesh'
+
+            # Cells are drawn in the same place, up to pixel snapping at their edges
+            assert np.abs(render(image) - render(mesh)).mean() < 1
+
+    def test_auto(self):
+        z    = np.sin(np.linspace(0, 3, 50)) * np.cos(np.linspace(0, 3, 40))[:, None]
+        x, y = np.meshgrid(np.linspace(0, 1, 50), np.linspace(0, 2, 40))
+
+        # Only uniform grids are drawn as images by default
+        for x, y, graph in [(x[0],                    y[:, 0],  'AxesImage'),
+                            (x,                       y,        'AxesImage'),
+                            (np.geomspace(1, 10, 50), y[:, 0],  'QuadMesh'),
+                            (x + y,                   y,        'QuadMesh')]:
+            assert type(heatmap(x=x, y=y, z=z, pyplot=False).graph).__name__ == graph
+
+    def test_vector(self):
+        image = heatmap(pyplot=False)
+        mesh  = heatmap(x=image.x[::10, ::10], y=image.y[::10, ::10], z=image.z[::10, ::10],
+                        heatmap_renderer='mesh', heatmap_rasterized=True, pyplot=False)
+
+        for plot in [image, mesh]:
+            buffer = io.BytesIO()
+            plot.fig.savefig(buffer, format='pdf')
+            assert len(buffer.getvalue()) < 500_000
+
+
+class TestFields(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp  = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'field.npy')
+
+        y, x   = np.mgrid[0:1000, 0:1200]
+        self.z = (np.sin(x/100) * np.cos(y/150)).astype(np.float32)
+        np.save(self.path, self.z)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_block_reduce(self):
+        z = load(self.path)
+        assert isinstance(z, np.memmap)
+
+        # Bands of rows smaller than the field
+        np.testing.assert_allclose(block_reduce(z, (10, 12), 'mean', chunk=2**16),
+                                   self.z.reshape(100, 10, 100, 12).mean(axis=(1, 3)), rtol=1e-5)
+        np.testing.assert_array_equal(block_reduce(z, (10, 12), 'max', chunk=2**16),
+                                      self.z.reshape(100, 10, 100, 12).max(axis=(1, 3)))
+        # Uneven blocks
+        assert block_reduce(z, (300, 500), 'min').shape == (4, 3)
+
+    def test_plotters(self):
+        for plotter in [heatmap, contour]:
+            plot = plotter(z=self.path, pyplot=False)
+
+            assert plot.z.shape[0] < 1000 and plot.z.shape[1] < 1200
+            assert plot.z.dtype == np.float32
+
+        # Only the field within the bounds is read
+        plot = heatmap(z=self.path, bounds_x=[100, 200], bounds_y=[0, 50], pyplot=False)
+        assert plot.x.min() >= 99 and plot.x.max() <= 201
+        assert plot.y.max() <= 51
+
+    def test_edges(self):
+        z = load(self.path)
+
+        # Coordinates of the edges of the cells, rather than of their centers
+        xe, ye = np.linspace(0, 1.2, 1201), np.linspace(0, 1, 1001)
+        x, y   = fields.coordinates(xe, ye, z.shape)
+        np.testing.assert_allclose(x, (xe[1:] + xe[:-1]) / 2)
+        np.testing.assert_allclose(y, (ye[1:] + ye[:-1]) / 2)
+
+        plot = heatmap(x=xe, y=ye, z=z, pyplot=False)
+        assert plot.x.min() > 0 and plot.x.max() < 1.2
+        assert plot.x.size == plot.z.shape[1] and plot.y.size == plot.z.shape[0]
+
+        with self.assertRaises(AssertionError):
+            fields.coordinates(xe[:-2], ye, z.shape)
+
+    def test_raw(self):
+        raw = os.path.join(self.tmp.name, 'field.raw')
+        self.z.tofile(raw)
+
+        plot = heatmap(z=load(raw, shape=self.z.shape, dtype=np.float32), pyplot=False)
+        np.testing.assert_allclose(plot.z.mean(), self.z.mean(), atol=1e-3)
+
+
+class TestPyramid(unittest.TestCase):
+
+    def test_levels(self):
+        y, x = np.mgrid[0:2000, 0:3000]
+        z    = np.sin(x/100) * np.cos(y/150)
+
+        plot = heatmap(x=np.linspace(0, 3, 3000), y=np.linspace(0, 2, 2000), z=z, heatmap_pyramid=True, pyplot=False)
+
+        # Full view: a coarse level
+        assert plot.graph.get_array().shape[1] < 1000
+
+        # Zoomed in: the field itself
+        plot.ax.set_xlim(1, 1.1)
+        plot.ax.set_ylim(1, 1.1)
+
+        drawn = plot.graph.get_array()
+        assert drawn.shape[1] < 120
+        assert np.isin(drawn[0, 0], z)
+
+        # Pyramids are shared by plots of the same array, and released with them
+        assert heatmap(z=z, heatmap_pyramid=True, pyplot=False).pyramid is plot.pyramid
+
+        del plot
+        gc.collect()
+        assert len(pyramid.cache) == 0
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import re
+import sys
+import json
+import unittest
+import subprocess
+
+
+heavy = ['pandas', 'toml', 'matplotlib.pyplot',
+         'mpl_plotter.two_d.plotters', 'mpl_plotter.two_d.mock', 'mpl_plotter.two_d.panes',
+         'mpl_plotter.three_d.plotters', 'mpl_plotter.presets.preset']
+
+
+def run(code, *flags):
+    """
+    Run Python code in a new interpreter, returning its output and error streams.
+    """
+    result = subprocess.run([sys.executable, *flags, '-c', code], capture_output=True, text=True, check=True)
+    return result.stdout, result.stderr
+
+
+def loaded(statement):
+    """
+    Return which of the heavy modules are loaded by an import statement.
+    """
+    out, _ = run(f'import sys, json; before = set(sys.modules); {statement}; '
+                 f'print(json.dumps([m for m in {heavy!r} if m in set(sys.modules) - before]))')
+    return json.loads(out)
+
+
+def import_time(module):
+    """
+    Return the time taken to import a package, excluding its parent packages, in seconds.
+    """
+    _, err = run(f'import mpl_plotter; import {module}', '-X', 'importtime')
+    # import time: self [us] | cumulative [us] | module
+    times  = {m.group(3).strip(): int(m.group(2)) for m in re.finditer(r'import time:\s+(\d+) \|\s+(\d+) \|(.*)', err)}
+    return times[module] / 1e6
+
+
+class TestImports(unittest.TestCase):
+
+    def test_lazy(self):
+        for package in ['mpl_plotter', 'mpl_plotter.two_d', 'mpl_plotter.three_d', 'mpl_plotter.presets']:
+            assert loaded(f'import {package}') == [], package
+
+        # Plotters are loaded on access, without Pandas, Pyplot or the placeholder data
+        assert loaded('from mpl_plotter.two_d import line') == ['mpl_plotter.two_d.plotters']
+        assert 'toml' not in loaded('from mpl_plotter.presets import preset')
+
+    def test_exports(self):
+        out, _ = run('from mpl_plotter.two_d import panes, comparison; import mpl_plotter.two_d as m; '
+                     'print(callable(m.comparison), callable(m.panes), "line" in dir(m))')
+        assert out.split() == ['True'] * 3
+
+        # Importing a module does not hide the object of the same name it exports
+        out, _ = run('import mpl_plotter.presets.publication; from mpl_plotter.presets import preset; print(type(preset).__name__)')
+        assert out.strip() == 'type'
+
+        with self.assertRaises(ImportError):
+            from mpl_plotter.two_d import nothing
+
+    def test_import_time(self):
+        # Import time of the packages themselves, their dependencies aside
+        for package in ['mpl_plotter.two_d', 'mpl_plotter.three_d', 'mpl_plotter.presets']:
+            assert import_time(package) < 0.1, package
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+import numpy as np
+
+from mpl_plotter.two_d import line, scatter, comparison
+from mpl_plotter.utils import decimate, ring
+
+from tests.setup import show, backend
+
+
+x = np.linspace(0, 100, 1_000_000)
+y = np.sin(x) + np.random.default_rng(0).normal(0, 0.1, x.size)
+y[500_000:500_100] = np.nan
+
+
+class TestDecimation(unittest.TestCase):
+
+    def test_decimate(self):
+        i = decimate(x, y, 500)
+
+        assert i.size <= 5 * 500
+        assert i[0] == 0 and i[-1] == y.size - 1
+        assert np.nanmin(y[i]) == np.nanmin(y)
+        assert np.nanmax(y[i]) == np.nanmax(y)
+        assert np.isnan(y[i]).any()
+
+        np.testing.assert_array_equal(decimate(x[:100], y[:100], 500), np.arange(100))
+
+        # Decreasing abscissae
+        np.testing.assert_array_equal(decimate(-x, y, 500), i)
+
+    def test_columns(self):
+        # Dense samples on [0, 1], sparse samples on [1, 100]
+        u = np.concatenate([np.linspace(0, 1, 900_000, endpoint=False), np.linspace(1, 100, 100_000)])
+        v = np.sin(50 * u)
+        n = 400
+
+        i = decimate(u, v, n)
+
+        # Same extremes in every column
+        edges = np.linspace(u[0], u[-1], n + 1)
+        full  = np.digitize(u, edges[1:-1])
+        kept  = full[i]
+        for c in np.unique(full):
+            assert v[i][kept == c].max() == v[full == c].max()
+            assert v[i][kept == c].min() == v[full == c].min()
+
+    def test_line(self):
+        plot = line(x=x, y=y, line_decimate=True, pyplot=False)
+
+        drawn = plot.graph.get_ydata()
+        assert drawn.size < 10_000
+        assert np.nanmax(drawn) == np.nanmax(y)
+
+    def test_color_rule(self):
+        plot = line(x=x, y=y, color_rule=lambda x: np.cos(x), line_decimate=1000, pyplot=False)
+
+        assert len(plot.graph.get_segments()) < 10_000
+        assert len(plot.graph.get_array()) == len(plot.graph.get_segments()) + 1
+
+    def test_comparison(self):
+        comparison(x, [y, -y], line_decimate=True, show=show, backend=backend)
+
+
+class TestCompact(unittest.TestCase):
+
+    def test_compact(self):
+        t = np.linspace(0, 10, 100_000)
+
+        full    = line(x=t, y=np.sin(t), color_rule=np.cos(t), pyplot=False)
+        compact = line(x=t, y=np.sin(t), color_rule=np.cos(t), line_compact=True, pyplot=False)
+
+        segments  = full.graph.get_segments()
+        polylines = compact.graph.get_segments()
+
+        assert len(segments) == t.size - 1
+        assert len(polylines) < 1000
+
+        # Each polyline is drawn with the color of the segments it replaces
+        lengths = [len(p) - 1 for p in polylines]
+        assert sum(lengths) == len(segments)
+
+        colors  = full.graph.to_rgba(full.graph.get_array()[:-1])
+        merged  = np.repeat(compact.graph.to_rgba(compact.graph.get_array()), lengths, axis=0)
+        np.testing.assert_array_equal(colors, merged)
+
+
+class TestStreaming(unittest.TestCase):
+
+    def test_ring(self):
+        buffer = ring(100, 2)
+        for i in range(0, 1000, 7):
+            buffer.extend(np.column_stack([np.arange(i, i + 7), -np.arange(i, i + 7)]))
+
+        np.testing.assert_array_equal(buffer.view()[:, 0], np.arange(1001 - 100, 1001))
+        np.testing.assert_array_equal(buffer.extent(0), [1001 - 100, 1000])
+        np.testing.assert_array_equal(buffer.extent(1), [-1000, -(1001 - 100)])
+
+        growing = ring(None, 1)
+        growing.extend(np.arange(3000))
+        assert len(growing) == 3000
+
+    def test_line(self):
+        plot = line(x=np.arange(10), y=np.arange(10), line_buffer=50, pyplot=False)
+
+        for i in range(10, 100):
+            plot.append(i, i**2)
+
+        np.testing.assert_array_equal(plot.graph.get_xdata(), np.arange(50, 100))
+        assert plot.ax.get_xlim()[1] >= 99
+        assert plot.ax.get_ylim()[1] >= 99**2
+
+    def test_blit(self):
+        plot = line(x=np.arange(10), y=np.sin(np.arange(10)), pyplot=False)
+
+        draws = []
+        draw  = plot.fig.canvas.draw
+        plot.fig.canvas.draw = lambda: draws.append(draw())
+
+        for i in range(10, 210):
+            plot.append(i, np.sin(i))
+
+        # The limits of a growing time series expand geometrically, so most appends are blitted
+        assert len(draws) < 20
+        assert plot.ax.get_xlim()[1] >= 209
+
+    def test_scatter(self):
+        plot = scatter(x=np.arange(10), y=np.arange(10), color_rule=np.arange(10), pyplot=False)
+
+        plot.extend(np.arange(10, 20), np.arange(10, 20), np.arange(10, 20))
+
+        assert plot.graph.get_offsets().shape == (20, 2)
+        np.testing.assert_array_equal(plot.graph.get_array(), np.arange(20))
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+import numpy as np
+
+from mpl_plotter.utils import placeholders
+from mpl_plotter.two_d import line, heatmap
+from mpl_plotter.two_d.mock import spirograph, waterdrop
+from mpl_plotter.three_d.mock import hill
+
+
+class TestPlaceholders(unittest.TestCase):
+
+    def test_memoized(self):
+        for generator in [spirograph, waterdrop, hill]:
+            assert generator() is generator()
+            assert all(not a.flags.writeable for a in generator())
+
+        assert placeholders['waterdrop'] is waterdrop
+
+        # Whichever way the arguments are passed
+        waterdrop.cache_clear()
+        assert waterdrop() is waterdrop(1000) is waterdrop(d=1000)
+        assert waterdrop.cache_info().currsize == 1
+
+        with self.assertRaises(ValueError):
+            waterdrop()[2][0, 0] = 0
+
+    def test_resolution(self):
+        assert waterdrop(50)[2].shape == (50, 50)
+        assert hill(size=20, step=2)[2].shape == (20, 20)
+        assert spirograph(dtheta=0.4)[0].size < spirograph()[0].size
+
+        np.testing.assert_array_equal(hill(size=20, step=2)[2], hill(size=40)[2][::2, ::2])
+
+    def test_plotters(self):
+        # Plots of the same placeholder data share it
+        a, b = heatmap(pyplot=False), heatmap(pyplot=False)
+        assert a.z is b.z
+
+        assert line(pyplot=False).x is spirograph()[0]
@@ -4,6 +4,9 @@
 import unittest
 import numpy as np
 
+from unittest import mock
+from matplotlib.figure import Figure
+
 from mpl_plotter.color.schemes import colorscheme_one
 from mpl_plotter.presets.publication import two_d
 
@@ -305,3 +308,46 @@ class TestsPlurals(unittest.TestCase):
                       [colorscheme_one()[2], colorscheme_one()[3]],
                       [colorscheme_one()[4], colorscheme_one()[5]]],
               show=show, backend=backend)
+
+
+class TestsParallel(unittest.TestCase):
+
+    def test_shared(self):
+
+        fig = panes(x, [u, 2*v, 3*y], share_y=True, pyplot=False)
+
+        limits = [ax.get_ylim() for ax in fig.axes]
+        assert all(l == limits[0] for l in limits)
+
+    def test_layout(self):
+
+        calls = []
+        adjust = Figure.subplots_adjust
+
+        def counted(fig, *args, **kwargs):
+            calls.append(kwargs)
+            return adjust(fig, *args, **kwargs)
+
+        # The margins of the figure are set once, rather than once per pane
+        with mock.patch.object(Figure, 'subplots_adjust', counted):
+            panes(x, [u, v, y, uu], rows=2, plot_labels=["sin", "cos", "tan", "sinh"], pyplot=False)
+
+        assert len(calls) == 1
+
+    def test_workers(self):
+
+        args = dict(rows=2, plot_labels=["sin", "cos", "tan", "sinh"], pyplot=False)
+
+        serial   = panes(x, [u, v, y, uu], **args)
+        parallel = panes(x, [u, v, y, uu], workers=2, **args)
+
+        assert len(parallel.axes) == 1 and len(parallel.axes[0].images) == 1
+
+        serial.canvas.draw()
+        parallel.canvas.draw()
+
+        a = np.asarray(serial.canvas.buffer_rgba(), dtype=float)
+        b = np.asarray(parallel.canvas.buffer_rgba(), dtype=float)
+
+        assert a.shape == b.shape
+        assert np.abs(a - b).mean() < 1
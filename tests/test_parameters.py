@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import inspect
+import unittest
+
+import numpy as np
+
+from mpl_plotter.two_d import line, scatter
+from mpl_plotter.three_d import surface
+
+
+class TestParameters(unittest.TestCase):
+
+    def test_schema(self):
+        for plotter in [line, scatter, surface]:
+            signature = inspect.signature(plotter)
+            assert plotter.schema.names == tuple(signature.parameters)
+            assert plotter.schema.defaults == {k: v.default for k, v in signature.parameters.items()}
+
+        class custom(line):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+
+        assert custom.schema is line.schema
+
+    def test_record(self):
+        x = np.linspace(0, 1, 10)
+
+        plot = line(x=x, y=x**2, color='red', pyplot=False)
+
+        assert not hasattr(plot.parameters, '__dict__')
+        assert set(plot.parameters.overrides()) == {'x', 'y', 'color', 'pyplot'}
+
+        # Defaults are shared
+        assert plot.parameters.cb_floating_coords is line.schema.defaults['cb_floating_coords']
+
+        # Parameters are read from the record unless overwritten in the instance
+        assert plot.color == 'red'
+        assert plot.title_size == 17
+        assert plot.parameters.bounds_x is None and plot.bounds_x is not None
+
+        with self.assertRaises(AttributeError):
+            plot.not_a_parameter
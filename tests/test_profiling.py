@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import os
+import csv
+import json
+import tempfile
+import unittest
+
+from mpl_plotter.profiling import profile, stage
+from mpl_plotter.two_d import line, heatmap
+from mpl_plotter.two_d.plotters import line as line_class
+from mpl_plotter.two_d.components import guides
+from mpl_plotter.three_d import surface
+
+
+class TestProfiling(unittest.TestCase):
+
+    def test_records(self):
+        streamed = []
+
+        with profile(callback=streamed.append) as p:
+            line(pyplot=False)
+            heatmap(colorbar=True, pyplot=False)
+            surface(pyplot=False)
+
+        assert streamed == p.records
+        assert sorted({r.plot for r in p.records}) == [0, 1, 2]
+        assert [r.plotter for r in p.records if r.stage == 'main'] == ['line', 'heatmap', 'surface']
+
+        stages = {r.stage for r in p.records if r.plot == 1}
+        assert {'main', 'finish', 'plot', 'method_colorbar', 'method_setup', 'method_save'} <= stages
+
+        # Stages called within main and finish are nested in them
+        records = [r for r in p.records if r.plot == 0]
+        main    = next(r for r in records if r.stage == 'main')
+        setup   = next(r for r in records if r.stage == 'method_setup')
+        assert (main.depth, setup.depth) == (0, 1)
+        # Stages are recorded as they end
+        assert records.index(setup) < records.index(main) and main.time > setup.time
+        assert sum(r.artists for r in p.records if r.plot == 0 and r.depth == 0) > 0
+
+        assert list(p.totals())[0] in ['main', 'finish']
+
+    def test_restored(self):
+        original = line_class.plot, guides.method_legend
+
+        with profile():
+            assert line_class.plot is not original[0]
+            with profile() as inner:
+                line(pyplot=False)
+            # Instrumented while any profile is active
+            assert line_class.plot is not original[0]
+
+        assert (line_class.plot, guides.method_legend) == original
+        assert inner.records
+
+    def test_export(self):
+        with profile() as p:
+            line(pyplot=False)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            p.to_json(os.path.join(tmp, 'stages.json'))
+            p.to_csv(os.path.join(tmp, 'stages.csv'))
+
+            with open(os.path.join(tmp, 'stages.json')) as f:
+                records = json.load(f)
+            with open(os.path.join(tmp, 'stages.csv')) as f:
+                rows = list(csv.DictReader(f))
+
+        assert len(records) == len(rows) == len(p.records)
+        assert list(records[0]) == list(rows[0]) == list(stage._fields)
+        assert stage(**records[0]) == p.records[0]
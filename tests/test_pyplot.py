@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import io
+import gc
+import weakref
+import unittest
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from concurrent.futures import ThreadPoolExecutor
+
+from mpl_plotter.two_d import line, scatter, heatmap, contour, quiver, streamline, fill_area, comparison, panes
+from mpl_plotter.three_d import line as line3, scatter as scatter3, surface
+
+
+class TestPyplotFree(unittest.TestCase):
+
+    def test_plotters(self):
+        plt.close('all')
+
+        for plotter in [line, scatter, heatmap, contour, quiver, streamline, fill_area, line3, scatter3, surface]:
+            plot = plotter(pyplot=False)
+            plot.fig.savefig(io.BytesIO(), format='png')
+            assert plot.plt is None
+            assert plot.fig.canvas.__class__.__name__ == 'FigureCanvasAgg'
+
+        assert plt.get_fignums() == []
+
+    def test_compositions(self):
+        plt.close('all')
+
+        x = np.linspace(0, 2*np.pi, 100)
+
+        fig = comparison(x, [np.sin(x), np.cos(x)], pyplot=False, plot_labels=['sin', 'cos'])
+        assert len(fig.axes) == 1 and len(fig.axes[0].lines) == 2
+
+        fig = panes(x, [np.sin(x), np.cos(x)], pyplot=False)
+        assert len(fig.axes) == 2
+
+        assert plt.get_fignums() == []
+
+    def test_collected(self):
+        plot = line(pyplot=False)
+        plot.fig.savefig(io.BytesIO(), format='png')
+        ref = weakref.ref(plot.fig)
+        del plot
+        gc.collect()
+        assert ref() is None
+
+    def test_threads(self):
+
+        def render(i):
+            plot = scatter(x=np.arange(100), y=np.random.rand(100), color_rule=np.arange(100),
+                           colorbar=True, pyplot=False)
+            buffer = io.BytesIO()
+            plot.fig.savefig(buffer, format='png')
+            return len(buffer.getvalue())
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            sizes = list(pool.map(render, range(8)))
+
+        assert all(size > 0 for size in sizes)
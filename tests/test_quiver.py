@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+import numpy as np
+
+from mpl_plotter.two_d import quiver
+
+
+x, y = np.meshgrid(np.linspace(0, 1, 200), np.linspace(0, 1, 100))
+u, v = np.cos(6*y), np.sin(6*x)
+
+
+class TestQuiver(unittest.TestCase):
+
+    def test_colors(self):
+        plot = quiver(x=x, y=y, u=u, v=v, pyplot=False)
+
+        # Colors are mapped from the scalar values of the rule
+        np.testing.assert_array_equal(plot.graph.get_array(), (u**2 + v**2).ravel())
+        assert plot.graph.norm.vmin == (u**2 + v**2).min()
+
+        custom = np.hypot(u, v)
+        plot   = quiver(x=x, y=y, u=u, v=v, quiver_custom_rule=custom, pyplot=False)
+        np.testing.assert_array_equal(plot.graph.get_array(), custom.ravel())
+
+    def test_thinning(self):
+        assert quiver(x=x, y=y, u=u, v=v, quiver_stride=10, pyplot=False).graph.N == 10 * 20
+        assert quiver(x=x[0], y=y[:, 0], u=u, v=v, quiver_stride=(10, 20), pyplot=False).graph.N == 10 * 10
+        assert quiver(x=x, y=y, u=u, v=v, quiver_max_arrows=500, pyplot=False).graph.N <= 500
+
+        # Scattered vectors
+        plot = quiver(x=x.ravel(), y=y.ravel(), u=u.ravel(), v=v.ravel(), quiver_max_arrows=400, pyplot=False)
+        assert 0 < plot.graph.N <= 400
+        assert plot.x.min() < 0.1 and plot.x.max() > 0.9
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+import numpy as np
+
+from mpl_plotter.three_d import scatter
+from mpl_plotter.three_d.cloud import voxel
+
+
+rng  = np.random.default_rng(0)
+x, y = rng.random(20000) * 10, rng.random(20000) * 10
+z    = np.sin(x) * np.cos(y)
+
+
+class TestPointCloud(unittest.TestCase):
+
+    def test_projection(self):
+        reference = scatter(x=x, y=y, z=z, color_rule=z, pyplot=False)
+        plot      = scatter(x=x, y=y, z=z, color_rule=z, scatter_point_cloud=True, pyplot=False)
+
+        for p in [reference, plot]:
+            p.fig.canvas.draw()
+
+        # Same projection and depth order as Matplotlib
+        np.testing.assert_allclose(plot.graph.get_offsets(), reference.graph.get_offsets())
+        np.testing.assert_array_equal(plot.graph.get_array(), z[reference.graph._z_markers_idx])
+
+        # Reprojected on every draw
+        plot.ax.view_init(60, 30)
+        plot.fig.canvas.draw()
+        assert not np.allclose(plot.graph.get_offsets(), reference.graph.get_offsets())
+
+    def test_budget(self):
+        xyz  = np.column_stack([x, y, z])
+        keep = voxel(xyz, 1000)
+
+        assert 0 < keep.size <= 1000
+        assert np.all(np.diff(keep) > 0)
+
+        plot = scatter(x=x, y=y, z=z, scatter_point_cloud=True, scatter_point_budget=1000, pyplot=False)
+        plot.fig.canvas.draw()
+        assert len(plot.graph.get_offsets()) <= 1000
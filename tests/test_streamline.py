@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+import numpy as np
+
+from matplotlib.figure import Figure
+
+from mpl_plotter.two_d import streamline
+from mpl_plotter.two_d import streamlines
+from mpl_plotter.two_d.mock import diff_field
+
+
+class TestStreamlines(unittest.TestCase):
+
+    def test_streamplot(self):
+        x, y, u, v, c = diff_field()
+
+        plot = streamline(x=x, y=y, u=u, v=v, color=c, streamline_cache=False, pyplot=False)
+        lc   = Figure().add_subplot().streamplot(x, y, u, v, density=2, color=c, cmap='RdBu_r').lines
+
+        # Trajectories and colors are those of Matplotlib's streamplot
+        np.testing.assert_allclose(plot.graph.get_segments(), lc.get_segments())
+        np.testing.assert_allclose(plot.graph.get_array(), lc.get_array())
+        assert len(plot.ax.patches) == len(plot.trajectories)
+
+    def test_cache(self):
+        x, y, u, v, c = diff_field()
+
+        first  = streamline(x=x, y=y, u=u, v=v, pyplot=False)
+        second = streamline(x=x, y=y, u=u, v=v, color='black', streamline_line_width=2, pyplot=False)
+
+        assert second.trajectories is first.trajectories
+        assert streamline(x=x, y=y, u=u, v=-v, pyplot=False).trajectories is not first.trajectories
+
+    def test_seeds(self):
+        x, y  = np.meshgrid(np.linspace(-1, 1, 101), np.linspace(-1, 1, 101))
+        seeds = np.column_stack([np.linspace(0.1, 0.9, 9), np.zeros(9)])
+
+        # Rotation: streamlines are circles
+        plot = streamline(x=x, y=y, u=-y, v=x, streamline_seeds=seeds, pyplot=False)
+
+        assert len(plot.trajectories) == 9
+        for i, r in enumerate(seeds[:, 0]):
+            np.testing.assert_allclose(np.hypot(*plot.trajectories[i].T), r, atol=1e-3)
+
+    def test_workers(self):
+        x, y  = np.meshgrid(np.linspace(-1, 1, 101), np.linspace(-1, 1, 101))
+        seeds = np.random.default_rng(0).uniform(-1, 1, (200, 2))
+
+        serial   = streamlines.streamlines(x, y, -y, x, seeds=seeds, cached=False)
+        parallel = streamlines.streamlines(x, y, -y, x, seeds=seeds, cached=False, workers=4)
+
+        np.testing.assert_array_equal(parallel.offsets, serial.offsets)
+        np.testing.assert_array_equal(parallel.points, serial.points)
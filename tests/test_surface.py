@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: © Antonio López Rivera <antonlopezr99@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+import numpy as np
+import matplotlib as mpl
+
+from mpl_plotter.three_d import surface
+from mpl_plotter.utils import lod
+from mpl_plotter.three_d import lighting
+from mpl_plotter.color.maps import colormap
+
+
+x, y = np.meshgrid(np.linspace(-3, 3, 400), np.linspace(-3, 3, 300))
+z    = np.exp(-4*(x**2 + y**2))
+
+
+class TestLevelOfDetail(unittest.TestCase):
+
+    def test_indices(self):
+        for method in ['stride', 'curvature']:
+            rows, cols = lod(z, 2000, method)
+
+            assert (len(rows) - 1) * (len(cols) - 1) <= 2000
+            assert rows[0] == 0 and rows[-1] == 299
+            assert cols[0] == 0 and cols[-1] == 399
+
+        # Rows and columns are concentrated around the peak
+        rows, cols = lod(z, 2000, 'curvature')
+        assert np.sum(np.abs(x[0, cols]) < 1) > len(cols) / 2
+
+    def test_surface(self):
+        plot = surface(x=x, y=y, z=z, color_rule=z, surface_lod='curvature', surface_lod_budget=2000, pyplot=False)
+
+        assert len(plot.graph.get_paths()) <= 2000
+        assert plot.color_rule.shape == plot.z.shape
+
+        plot.update(z=-z)
+        assert plot.z.shape == plot.x.shape
+
+    def test_lighting(self):
+        plot = surface(x=x, y=y, z=z, surface_lighting=True, surface_lod='stride', pyplot=False)
+
+        budget = plot.fig.get_figwidth() * plot.fig.get_figheight() * plot.fig.dpi**2 / 16
+        assert len(plot.graph.get_paths()) <= budget
+
+
+class TestLighting(unittest.TestCase):
+
+    def test_cache(self):
+        lighting.cache.clear()
+
+        a = surface(x=x, y=y, z=z, surface_lighting=True, azim=30, pyplot=False).method_lighting()
+        b = surface(x=x, y=y, z=z, surface_lighting=True, azim=60, elev=45, pyplot=False).method_lighting()
+
+        # Shaded once, for all view angles
+        assert a is b and not a.flags.writeable
+        assert len(lighting.cache) == 1
+
+        c = surface(x=x, y=y, z=z, surface_lighting=True, surface_light_azdeg=90, pyplot=False).method_lighting()
+        assert c is not a and not np.array_equal(a, c)
+
+        for _ in range(lighting.cache_size + 1):
+            lighting.shade(np.random.rand(4, 4), 'viridis')
+        assert len(lighting.cache) == lighting.cache_size
+
+    def test_colormap(self):
+        assert colormap('red') == 'Reds'
+        assert colormap('navy') == 'Blues'
+        assert colormap('pink') == 'pink'
+        assert colormap('black') == 'Greys'
+        assert colormap('not a color') == 'Greys'
+
+        # Colormaps registered later are found too
+        mpl.colormaps.register(mpl.colors.ListedColormap(['teal', 'white'], name='Lagoon'))
+        try:
+            assert colormap('lagoon') == 'Lagoon'
+        finally:
+            mpl.colormaps.unregister('Lagoon')
+        assert colormap('lagoon') == 'Greys'